@@ -0,0 +1,163 @@
+"""
+asyncio deque backed by a DoublyLinkedList.
+
+    queue = AsyncLinkedDeque(maxsize=100)
+    await queue.put(job)             # waits while the deque is full
+    job = await queue.pop_front()    # waits while it's empty
+    jobs = await queue.get_many(32)  # up to 32 at once
+
+Waiting consumers and producers park on futures and are woken by the
+operation that lets them proceed, so nobody polls. Cancelling a waiting
+call never loses a value: values only move in and out after the last
+await, and a cancelled waiter that had already been woken passes the
+wakeup on.
+"""
+import asyncio
+from collections import deque
+
+from doubly_linked_list import DoublyLinkedList
+
+
+class AsyncLinkedDeque:
+    """
+    Double-ended queue for asyncio tasks.
+
+    maxsize bounds the number of values (0 means unbounded); put and
+    put_front wait for room once it's reached.
+    """
+
+    def __init__(self, maxsize=0):
+        self._maxsize = maxsize
+        self._values = DoublyLinkedList()
+        self._getters = deque()
+        self._putters = deque()
+
+    def __len__(self):
+        return self._values.length()
+
+    def __str__(self):
+        return str(self._values)
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def empty(self):
+        return not self._values.length()
+
+    def full(self):
+        return 0 < self._maxsize <= self._values.length()
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """Wake the longest waiting call that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, blocked):
+        """Park on a future in waiters until blocked() is False."""
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+                # we may have been woken and cancelled at once; hand the
+                # wakeup on so it isn't lost
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+
+                raise
+
+    # space and time: O(1)
+    def put_nowait(self, value):
+        """Append value at the back; raises asyncio.QueueFull if full."""
+        if self.full():
+            raise asyncio.QueueFull
+
+        self._values.append(value)
+        self._wakeup_next(self._getters)
+
+    def put_front_nowait(self, value):
+        """Insert value at the front; raises asyncio.QueueFull if full."""
+        if self.full():
+            raise asyncio.QueueFull
+
+        self._values.insert(value)
+        self._wakeup_next(self._getters)
+
+    async def put(self, value):
+        """Append value at the back, waiting for room if the deque is full."""
+        await self._wait(self._putters, self.full)
+        self.put_nowait(value)
+
+    async def put_front(self, value):
+        """Insert value at the front, waiting for room if the deque is full."""
+        await self._wait(self._putters, self.full)
+        self.put_front_nowait(value)
+
+    # space and time: O(1)
+    def pop_front_nowait(self):
+        """Remove and return the front value; raises asyncio.QueueEmpty if empty."""
+        if self.empty():
+            raise asyncio.QueueEmpty
+
+        value = self._values.pop_front()
+        self._wakeup_next(self._putters)
+        return value
+
+    def pop_back_nowait(self):
+        """Remove and return the back value; raises asyncio.QueueEmpty if empty."""
+        if self.empty():
+            raise asyncio.QueueEmpty
+
+        value = self._values.pop_back()
+        self._wakeup_next(self._putters)
+        return value
+
+    async def pop_front(self):
+        """Remove and return the front value, waiting for one if empty."""
+        await self._wait(self._getters, self.empty)
+        return self.pop_front_nowait()
+
+    async def pop_back(self):
+        """Remove and return the back value, waiting for one if empty."""
+        await self._wait(self._getters, self.empty)
+        return self.pop_back_nowait()
+
+    # space: O(k) for the k values returned
+    # time: O(k)
+    async def get_many(self, n):
+        """
+        Remove and return up to n values from the front, as a list.
+
+        Waits until at least one value is there, then takes whatever is
+        available without waiting again.
+        """
+        if n < 1:
+            raise ValueError('n must be at least 1')
+
+        await self._wait(self._getters, self.empty)
+        values = []
+
+        while len(values) < n and not self.empty():
+            values.append(self._values.pop_front())
+            self._wakeup_next(self._putters)
+
+        # wake another consumer if values are left over
+        if not self.empty():
+            self._wakeup_next(self._getters)
+
+        return values
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+import async_linked_deque
+
+
+class TestAsyncLinkedDeque(unittest.IsolatedAsyncioTestCase):
+    """Test asyncio deque over the doubly linked list."""
+
+    def setUp(self):
+        self.deque = async_linked_deque.AsyncLinkedDeque(maxsize=2)
+
+    async def test_both_ends(self):
+        await self.deque.put(1)
+        await self.deque.put_front(0)
+        self.assertTrue(self.deque.full())
+        self.assertEqual(str(self.deque), '0 -> 1')
+
+        self.assertEqual(await self.deque.pop_back(), 1)
+        self.assertEqual(await self.deque.pop_front(), 0)
+        self.assertTrue(self.deque.empty())
+
+        with self.assertRaises(asyncio.QueueEmpty):
+            self.deque.pop_back_nowait()
+
+    async def test_consumer_waits_for_value(self):
+        consumer = asyncio.create_task(self.deque.pop_front())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())
+
+        await self.deque.put('job')
+        self.assertEqual(await consumer, 'job')
+
+    async def test_backpressure(self):
+        await self.deque.put(1)
+        await self.deque.put(2)
+
+        with self.assertRaises(asyncio.QueueFull):
+            self.deque.put_nowait(3)
+
+        producer = asyncio.create_task(self.deque.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+
+        self.assertEqual(self.deque.pop_front_nowait(), 1)
+        await producer
+        self.assertEqual(str(self.deque), '2 -> 3')
+
+    async def test_get_many(self):
+        lst = async_linked_deque.AsyncLinkedDeque()
+        batch = asyncio.create_task(lst.get_many(3))
+        await asyncio.sleep(0)
+
+        for value in range(5):
+            lst.put_nowait(value)
+
+        self.assertEqual(await batch, [0, 1, 2])
+        self.assertEqual(await lst.get_many(10), [3, 4])
+
+        with self.assertRaises(ValueError):
+            await lst.get_many(0)
+
+    async def test_cancelled_consumer_loses_nothing(self):
+        first = asyncio.create_task(self.deque.pop_front())
+        second = asyncio.create_task(self.deque.pop_front())
+        await asyncio.sleep(0)
+
+        # wake the first consumer, then cancel it before it runs
+        self.deque.put_nowait('job')
+        first.cancel()
+
+        self.assertEqual(await second, 'job')
+        self.assertTrue(first.cancelled())
+        self.assertFalse(self.deque._getters)
+
+    async def test_cancelled_producer(self):
+        await self.deque.put(1)
+        await self.deque.put(2)
+        producer = asyncio.create_task(self.deque.put(3))
+        await asyncio.sleep(0)
+
+        producer.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await producer
+
+        self.assertEqual(len(self.deque), 2)
+        self.assertFalse(self.deque._putters)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,480 @@
+"""
+Benchmarks for the linked list classes.
+
+    python benchmark.py ops [--sizes ...] [--output FILE] [--baseline FILE]
+    python benchmark.py sort [--size N]
+    python benchmark.py concurrent [--threads ...] [--operations N]
+    python benchmark.py parallel [--size N] [--workers ...]
+
+`ops` times every public method of LinkedList and DoublyLinkedList at each
+size, records ops/sec and peak memory, fits a complexity curve per method
+and measures the import time of linked_list. With --baseline it exits
+with status 1 if any operation got slower than the tolerance allows.
+
+`concurrent` hammers one ConcurrentDoublyLinkedList from several threads
+with a mix of operations, reports throughput next to a DoublyLinkedList
+behind a single lock, and exits with status 1 if the links or the length
+don't add up afterward.
+
+`parallel` times the process-pool reductions in parallel.py against the
+sequential methods for each worker count and reports the speedup.
+"""
+import argparse
+import io
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import concurrent_linked_list
+import doubly_linked_list
+import linked_list
+import parallel
+
+CLASSES = (linked_list.LinkedList, doubly_linked_list.DoublyLinkedList)
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def break_made_cycle(lst):
+    """Close the list into a cycle and cut it again, leaving it as it was."""
+    lst.create_cycle()
+    lst.break_cycle()
+
+
+# name: (input order, max calls on one list, call(lst, n, i))
+# i is the repetition number, so repeated calls can vary their argument.
+# Operations that shrink the list stop at half of it, and sort only runs
+# once because after that the input is no longer shuffled.
+HALF = 'half'
+OPERATIONS = {
+    'insert': ('random', None, lambda lst, n, i: lst.insert(i)),
+    'append': ('random', None, lambda lst, n, i: lst.append(i)),
+    'pop_front': ('random', HALF, lambda lst, n, i: lst.pop_front()),
+    'pop_back': ('random', HALF, lambda lst, n, i: lst.pop_back()),
+    'search': ('random', None, lambda lst, n, i: lst.search(-1)),
+    'find_max': ('random', None, lambda lst, n, i: lst.find_max()),
+    'find_min': ('random', None, lambda lst, n, i: lst.find_min()),
+    'length': ('random', None, lambda lst, n, i: lst.length()),
+    'find_nth_from_beginning': (
+        'random', None, lambda lst, n, i: lst.find_nth_from_beginning(n - 1)),
+    'find_nth_from_end': (
+        'random', None, lambda lst, n, i: lst.find_nth_from_end(n - 1)),
+    'find_middle_value': (
+        'random', None, lambda lst, n, i: lst.find_middle_value()),
+    'insert_ascending': (
+        'sorted', None, lambda lst, n, i: lst.insert_ascending(n)),
+    'insert_many_ascending': (
+        'sorted', None,
+        lambda lst, n, i: lst.insert_many_ascending(range(0, n, 100))),
+    'extend': ('random', None, lambda lst, n, i: lst.extend(range(100))),
+    'insert_at': ('random', None, lambda lst, n, i: lst.insert_at(n // 2, i)),
+    'cursor': ('random', None, lambda lst, n, i: lst.cursor(n // 2)),
+    'delete': ('sorted', HALF, lambda lst, n, i: lst.delete(n - 1 - i)),
+    'delete_all': ('sorted', HALF, lambda lst, n, i: lst.delete_all((n - 1 - i,))),
+    'delete_many': (
+        'sorted', HALF, lambda lst, n, i: lst.delete_many((n - 1 - i,))),
+    'delete_where': (
+        'sorted', HALF, lambda lst, n, i: lst.delete_where((n - 1 - i).__eq__)),
+    'reverse': ('random', None, lambda lst, n, i: lst.reverse()),
+    'sort': ('random', 1, lambda lst, n, i: lst.sort()),
+    'visit': ('random', None, lambda lst, n, i: lst.visit(io.StringIO())),
+    'str': ('random', None, lambda lst, n, i: str(lst)),
+    'iter': ('random', None, lambda lst, n, i: list(lst)),
+    'has_cycle': ('random', None, lambda lst, n, i: lst.has_cycle()),
+    'cycle_entry': ('random', None, lambda lst, n, i: lst.cycle_entry()),
+    'cycle_length': ('random', None, lambda lst, n, i: lst.cycle_length()),
+    'tail_length': ('random', None, lambda lst, n, i: lst.tail_length()),
+    'break_cycle': ('random', None, lambda lst, n, i: break_made_cycle(lst)),
+}
+
+COMPLEXITY_MODELS = {
+    'O(1)': lambda n: 1.0,
+    'O(log n)': lambda n: math.log(n),
+    'O(n)': lambda n: float(n),
+    'O(n log n)': lambda n: n * math.log(n),
+    'O(n^2)': lambda n: float(n) ** 2,
+}
+
+
+def timed(func):
+    """Return how long func() takes, in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def make_values(size, order, seed=0):
+    values = list(range(size))
+
+    if order == 'random':
+        random.Random(seed).shuffle(values)
+
+    return values
+
+
+def bench_operation(cls, name, size, min_time=0.2, max_reps=10000):
+    """
+    Time one operation on a fresh list of the given size.
+
+    Calls are repeated until min_time has passed, so fast operations get
+    enough samples. Returns a result dict with ops_per_sec and peak_bytes.
+    """
+    order, limit, call = OPERATIONS[name]
+    values = make_values(size, order)
+
+    # peak memory of a single call, on a list of its own
+    lst = cls.from_iterable(values)
+    tracemalloc.start()
+    call(lst, size, 0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    lst = cls.from_iterable(values)
+
+    if limit == HALF:
+        limit = max(1, size // 2)
+
+    limit = min(limit or max_reps, max_reps)
+    reps = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+
+    while reps < limit and elapsed < min_time:
+        call(lst, size, reps)
+        reps += 1
+        elapsed = time.perf_counter() - start
+
+    return {
+        'class': cls.__name__,
+        'operation': name,
+        'size': size,
+        'reps': reps,
+        'ops_per_sec': reps / elapsed,
+        'peak_bytes': peak,
+    }
+
+
+def fit_complexity(points):
+    """
+    Return the complexity model that best fits [(size, seconds per op)].
+
+    Each model is scaled by the constant that minimises the squared error
+    in log space, and the one with the smallest residual wins. The log-log
+    slope between the smallest and largest size is reported alongside.
+    """
+    points = sorted(points)
+    best = None
+
+    for model, func in COMPLEXITY_MODELS.items():
+        logs = [math.log(t) - math.log(func(n)) for n, t in points]
+        offset = sum(logs) / len(logs)
+        residual = sum((x - offset) ** 2 for x in logs)
+
+        if best is None or residual < best[1]:
+            best = (model, residual)
+
+    (n0, t0), (n1, t1) = points[0], points[-1]
+    slope = (math.log(t1) - math.log(t0)) / (math.log(n1) - math.log(n0))
+
+    return {'model': best[0], 'slope': round(slope, 3)}
+
+
+def measure_import_time(module='linked_list'):
+    """
+    Return the cumulative import time of module in microseconds.
+
+    Returns None if the module can't be imported in a fresh interpreter.
+    """
+    # run next to the modules, wherever the benchmark was started from
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    if result.returncode:
+        return None
+
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split('|')]
+
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+
+    return None
+
+
+def find_regressions(results, baseline, tolerance):
+    """Return descriptions of results slower than baseline by over tolerance."""
+    previous = {(r['class'], r['operation'], r['size']): r
+                for r in baseline['results']}
+    regressions = []
+
+    for result in results:
+        old = previous.get((result['class'], result['operation'], result['size']))
+
+        if old and result['ops_per_sec'] < old['ops_per_sec'] * (1 - tolerance):
+            regressions.append('{class}.{operation} n={size}: '.format(**result) +
+                               '{:.1f} -> {:.1f} ops/sec'.format(
+                                   old['ops_per_sec'], result['ops_per_sec']))
+
+    return regressions
+
+
+def bench_ops(args):
+    results = []
+    complexity = {}
+
+    print('{:<18} {:<24} {:>9} {:>14} {:>12}'.format(
+        'class', 'operation', 'n', 'ops/sec', 'peak bytes'))
+
+    for cls in CLASSES:
+        for name in args.operations or OPERATIONS:
+            points = []
+
+            for size in args.sizes:
+                result = bench_operation(cls, name, size, args.min_time)
+                results.append(result)
+                points.append((size, 1 / result['ops_per_sec']))
+                print('{class:<18} {operation:<24} {size:>9} '
+                      '{ops_per_sec:>14.1f} {peak_bytes:>12}'.format(**result))
+
+            if len(points) > 1:
+                fit = fit_complexity(points)
+                complexity['{}.{}'.format(cls.__name__, name)] = fit
+                print('{:<18} {:<24} fits {} (slope {})'.format(
+                    cls.__name__, name, fit['model'], fit['slope']))
+
+    import_time = measure_import_time()
+    print('import linked_list: {} us'.format(
+        'unavailable' if import_time is None else import_time))
+
+    report = {
+        'python': sys.version.split()[0],
+        'sizes': list(args.sizes),
+        'import_time_us': import_time,
+        'results': results,
+        'complexity': complexity,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = find_regressions(results, baseline, args.tolerance)
+
+        for regression in regressions:
+            print('REGRESSION ' + regression)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+def bench_sort(args):
+    """Time list.sort against sorted(list(...)) on random, sorted and reversed input."""
+    size = args.size
+    rand = random.Random(0)
+    inputs = {
+        'random': [rand.random() for _ in range(size)],
+        'sorted': list(range(size)),
+        'reversed': list(range(size, 0, -1)),
+    }
+
+    print('sort, n = {:,}'.format(size))
+    print('{:<18} {:<10} {:>10} {:>14}'.format('class', 'input', 'sort()', 'sorted(list)'))
+
+    for cls in CLASSES:
+        for name, values in inputs.items():
+            lst = cls.from_iterable(values)
+            baseline = timed(lambda: sorted(list(lst)))
+            elapsed = timed(lst.sort)
+            print('{:<18} {:<10} {:>9.3f}s {:>13.3f}s'.format(
+                cls.__name__, name, elapsed, baseline))
+
+    return 0
+
+
+# the stress mix is mostly O(1) operations at both ends, with some walks
+STRESS_MIX = ('insert', 'append', 'pop_front', 'pop_back') * 4 + (
+    'insert_ascending', 'delete', 'search')
+
+
+def stress_worker(lst, count, seed, lock, deltas):
+    """Run count random operations on lst; record the net length change."""
+    rand = random.Random(seed)
+    delta = 0
+
+    for _ in range(count):
+        name = rand.choice(STRESS_MIX)
+        value = rand.randrange(1000)
+
+        with lock:
+            try:
+                if name in ('insert', 'append', 'insert_ascending'):
+                    getattr(lst, name)(value)
+                    delta += 1
+                elif name in ('pop_front', 'pop_back'):
+                    getattr(lst, name)()
+                    delta -= 1
+                elif name == 'delete':
+                    if lst.delete(value) is not None:
+                        delta -= 1
+                else:
+                    lst.search(value)
+            except IndexError:
+                pass
+
+    deltas.append(delta)
+
+
+def links_intact(lst):
+    """Return True if lst's links mirror each other and match its length."""
+    if hasattr(lst, 'check_integrity'):
+        return lst.check_integrity()
+
+    count = 0
+    previous = None
+    current = lst._head
+
+    while current:
+        if current._prev_node is not previous:
+            return False
+        previous = current
+        current = current._next_node
+        count += 1
+
+    return previous is lst._tail and count == lst.length()
+
+
+def bench_concurrent(args):
+    """Time a multi-threaded operation mix and check the list survives it."""
+    lists = (
+        ('per-node locks', concurrent_linked_list.ConcurrentDoublyLinkedList, nullcontext()),
+        ('one global lock', doubly_linked_list.DoublyLinkedList, threading.Lock()),
+    )
+    failures = 0
+
+    print('{} operations, GIL {}'.format(
+        args.operations, 'enabled' if getattr(sys, '_is_gil_enabled', lambda: True)()
+        else 'disabled'))
+    print('{:<16} {:>8} {:>14} {:>10} {:>8}'.format(
+        'locking', 'threads', 'ops/sec', 'length', 'links'))
+
+    for label, cls, lock in lists:
+        for threads in args.threads:
+            lst = cls.from_iterable(range(args.size))
+            deltas = []
+            per_thread = args.operations // threads
+            workers = [threading.Thread(target=stress_worker,
+                                        args=(lst, per_thread, seed, lock, deltas))
+                       for seed in range(threads)]
+
+            start = time.perf_counter()
+
+            for worker in workers:
+                worker.start()
+
+            for worker in workers:
+                worker.join()
+
+            elapsed = time.perf_counter() - start
+            ok = links_intact(lst) and lst.length() == args.size + sum(deltas)
+            failures += not ok
+
+            print('{:<16} {:>8} {:>14.1f} {:>10} {:>8}'.format(
+                label, threads, per_thread * threads / elapsed, lst.length(),
+                'ok' if ok else 'CORRUPT'))
+
+    return 1 if failures else 0
+
+
+def bench_parallel(args):
+    """Time parallel.py reductions against the sequential methods."""
+    values = make_values(args.size, 'random')
+    reductions = {
+        'find_max': (lambda lst: lst.find_max(), parallel.find_max),
+        'find_min': (lambda lst: lst.find_min(), parallel.find_min),
+        'search': (lambda lst: lst.search(-1),
+                   lambda lst, **kwargs: parallel.search(lst, -1, **kwargs)),
+        'count': (lambda lst: sum(1 for value in lst if value == 0),
+                  lambda lst, **kwargs: parallel.count(lst, 0, **kwargs)),
+    }
+
+    print('n = {:,}, {} CPUs'.format(args.size, os.cpu_count()))
+    print('{:<18} {:<10} {:>8} {:>12} {:>9}'.format(
+        'class', 'reduction', 'workers', 'seconds', 'speedup'))
+
+    for cls in CLASSES:
+        lst = cls.from_iterable(values)
+
+        for name, (sequential, parallel_reduce) in reductions.items():
+            baseline = timed(lambda: sequential(lst))
+            print('{:<18} {:<10} {:>8} {:>12.3f} {:>9}'.format(
+                cls.__name__, name, 'seq', baseline, '1.00x'))
+
+            for workers in args.workers:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # start the worker processes before timing
+                    list(executor.map(abs, range(workers)))
+                    elapsed = timed(lambda: parallel_reduce(
+                        lst, workers=workers, threshold=0, executor=executor))
+
+                print('{:<18} {:<10} {:>8} {:>12.3f} {:>8.2f}x'.format(
+                    cls.__name__, name, workers, elapsed, baseline / elapsed))
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='benchmark', required=True)
+
+    ops = commands.add_parser('ops', help='every operation at every size')
+    ops.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    ops.add_argument('--operations', nargs='+', choices=sorted(OPERATIONS))
+    ops.add_argument('--min-time', type=float, default=0.2,
+                     help='seconds to spend repeating each operation')
+    ops.add_argument('--output', help='write results as JSON to this file')
+    ops.add_argument('--baseline', help='JSON results to compare against')
+    ops.add_argument('--tolerance', type=float, default=0.25,
+                     help='allowed ops/sec drop before failing (fraction)')
+    ops.set_defaults(run=bench_ops)
+
+    sort = commands.add_parser('sort', help='sort() against sorted(list)')
+    sort.add_argument('--size', type=int, default=10 ** 6)
+    sort.set_defaults(run=bench_sort)
+
+    concurrent = commands.add_parser(
+        'concurrent', help='multi-threaded stress and throughput')
+    concurrent.add_argument('--threads', type=int, nargs='+', default=(1, 2, 4, 8))
+    concurrent.add_argument('--operations', type=int, default=10 ** 6,
+                            help='total operations per run, split across threads')
+    concurrent.add_argument('--size', type=int, default=100,
+                            help='values in the list before the run')
+    concurrent.set_defaults(run=bench_concurrent)
+
+    pool = commands.add_parser('parallel', help='process-pool reduction speedup')
+    pool.add_argument('--size', type=int, default=10 ** 7)
+    pool.add_argument('--workers', type=int, nargs='+',
+                      default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    pool.set_defaults(run=bench_parallel)
+
+    args = parser.parse_args()
+    return args.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,434 @@
+"""
+Thread-safe doubly linked list with a lock per node.
+
+Threads lock nodes hand over hand, always from head toward tail: a walker
+holds a node while it takes the next one, and a mutation holds every
+node whose links it rewrites. Threads working on different parts of the
+list don't wait for each other, which pays off on free-threaded CPython
+builds where they really run in parallel.
+
+Sentinel nodes sit at both ends so every real node has a predecessor
+and a successor to lock. Operations at the tail (append, pop_back) have
+to find the tail's predecessor before they can lock it, against the
+usual direction; they take those locks with try-acquire and retry on
+failure, so they never wait while holding a lock and can't deadlock
+with walkers.
+"""
+import sys
+import threading
+import time
+
+from doubly_linked_list import Node
+
+
+class LockedNode(Node):
+    """Doubly linked node with its own lock and a removed flag."""
+
+    __slots__ = ('_lock', '_removed')
+
+    def __init__(self, value):
+        super().__init__(value)
+        self._lock = threading.Lock()
+        self._removed = False
+
+
+class ConcurrentDoublyLinkedList:
+    """
+    Doubly linked list that many threads can read and mutate at once.
+
+    Exposes the methods of DoublyLinkedList that make sense under
+    concurrency. Iteration, str and reversed work on a snapshot taken by
+    one hand-over-hand walk; positional reads are only as current as the
+    length they were computed from.
+    """
+
+    def __init__(self):
+        self._head = LockedNode(None)
+        self._tail = LockedNode(None)
+        self._head._next_node = self._tail
+        self._tail._prev_node = self._head
+
+        self._length = 0
+        self._length_lock = threading.Lock()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list holding the iterable's values in the same order."""
+        lst = cls()
+        lst.extend(iterable)
+        return lst
+
+    def __str__(self):
+        return ' -> '.join(str(value) for value in self)
+
+    # space: O(n) for the snapshot
+    # time: O(n)
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __reversed__(self):
+        return reversed(self.snapshot())
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def _add_length(self, delta):
+        with self._length_lock:
+            self._length += delta
+
+    # space and time: O(1); caller holds the locks of previous and next_node
+    def _link_between(self, previous, node, next_node):
+        node._prev_node = previous
+        node._next_node = next_node
+        previous._next_node = node
+        next_node._prev_node = node
+        self._add_length(1)
+
+    # space and time: O(1); caller holds the locks of node and both neighbours
+    def _unlink(self, node):
+        previous = node._prev_node
+        next_node = node._next_node
+        previous._next_node = next_node
+        next_node._prev_node = previous
+
+        # links are left in place so threads that read them before the
+        # unlink can still step off the node; _removed tells them to retry
+        node._removed = True
+        self._add_length(-1)
+
+    # space: O(1)
+    # time: O(k) for the k nodes visited
+    def _scan(self, visit):
+        """
+        Call visit(node) on each node hand over hand until it returns True.
+
+        Returns True if visit stopped the walk; else False.
+        """
+        current = self._head
+        current._lock.acquire()
+
+        try:
+            while True:
+                next_node = current._next_node
+
+                if next_node is self._tail:
+                    return False
+
+                next_node._lock.acquire()
+                current._lock.release()
+                current = next_node
+
+                if visit(current):
+                    return True
+        finally:
+            current._lock.release()
+
+    # space: O(n)
+    # time: O(n)
+    def snapshot(self):
+        """Return the values as a list, read in one hand-over-hand walk."""
+        values = []
+        self._scan(lambda node: values.append(node._value))
+        return values
+
+    # space and time: O(1)
+    def insert(self, value):
+        """Insert new node with given value at the head of the linked list."""
+        new_node = LockedNode(value)
+
+        with self._head._lock:
+            first = self._head._next_node
+
+            with first._lock:
+                self._link_between(self._head, new_node, first)
+
+    # space: O(1)
+    # time: O(1), retried while other threads hold the tail's locks
+    def append(self, value):
+        """Insert new node with given value at the tail of the linked list."""
+        new_node = LockedNode(value)
+
+        while True:
+            last = self._tail._prev_node
+
+            with last._lock:
+                if self._tail._lock.acquire(blocking=False):
+                    try:
+                        if not last._removed and last._next_node is self._tail:
+                            self._link_between(last, new_node, self._tail)
+                            return
+                    finally:
+                        self._tail._lock.release()
+
+            # give the thread holding the lock a chance to finish
+            time.sleep(0)
+
+    # space: O(k)
+    # time: O(k)
+    def extend(self, iterable):
+        """Append every value of the iterable, in order, at the tail."""
+        if iterable is self:
+            iterable = self.snapshot()
+
+        for value in iterable:
+            self.append(value)
+
+    # space and time: O(1)
+    def pop_front(self):
+        """
+        Remove the first node and return its value.
+
+        Raises IndexError if the list is empty.
+        """
+        with self._head._lock:
+            first = self._head._next_node
+
+            if first is self._tail:
+                raise IndexError
+
+            with first._lock:
+                with first._next_node._lock:
+                    self._unlink(first)
+
+        return first._value
+
+    # space: O(1)
+    # time: O(1), retried while other threads hold the tail's locks
+    def pop_back(self):
+        """
+        Remove the last node and return its value.
+
+        Raises IndexError if the list is empty.
+        """
+        while True:
+            last = self._tail._prev_node
+            previous = last._prev_node
+
+            if last is self._head:
+                with self._head._lock:
+                    if self._head._next_node is self._tail:
+                        raise IndexError
+                continue
+
+            with previous._lock:
+                if last._lock.acquire(blocking=False):
+                    try:
+                        if self._tail._lock.acquire(blocking=False):
+                            try:
+                                if (not previous._removed and previous._next_node is last
+                                        and last._next_node is self._tail):
+                                    self._unlink(last)
+                                    return last._value
+                            finally:
+                                self._tail._lock.release()
+                    finally:
+                        last._lock.release()
+
+            time.sleep(0)
+
+    # space: O(1)
+    # time: O(n)
+    def search(self, value):
+        """Search for the given value. Returns True if found; else False."""
+        return self._scan(lambda node: node._value == value)
+
+    # space: O(1)
+    # time: O(n)
+    def find_max(self):
+        """Return the max value in the list; returns None if list is empty."""
+        values = self.snapshot()
+        return max(values) if values else None
+
+    # same as above for space and time
+    def find_min(self):
+        """Return the min value in the list; returns None if list is empty."""
+        values = self.snapshot()
+        return min(values) if values else None
+
+    # space and time: O(1)
+    def length(self):
+        return self._length
+
+    # space: O(1)
+    # time: O(n)
+    def find_nth_from_beginning(self, n):
+        """
+        Return value of nth node in the list.
+
+        Raises error if n is not in list range.
+        """
+        if n < 0:
+            raise IndexError
+
+        found = None
+
+        def visit(node):
+            nonlocal n, found
+
+            if n == 0:
+                found = node
+                return True
+
+            n -= 1
+            return False
+
+        if not self._scan(visit):
+            raise IndexError
+
+        return found._value
+
+    # space: O(1)
+    # time: O(n), the walk goes forward so locks stay in order
+    def find_nth_from_end(self, n):
+        """
+        Return value of nth node from end of list.
+
+        Assumes last node is index 0. (e.g. 3rd from end is idx -4)
+        """
+        if n < 0:
+            raise IndexError
+
+        return self.find_nth_from_beginning((self._length - 1) - n)
+
+    def find_middle_value(self):
+        """
+        Return value at middle node in list.
+
+        If length is odd, returns middle node. If even, returns middle
+        rounded down (e.g. length 10 will return element at index 4).
+
+        Returns None if list is empty.
+        """
+        values = self.snapshot()
+        return values[(len(values) - 1) // 2] if values else None
+
+    # space: O(1)
+    # time: O(n)
+    def insert_ascending(self, value):
+        """
+        Insert new node with the given value in ascending order.
+
+        Assumes the list is already sorted.
+        """
+        new_node = LockedNode(value)
+        previous = self._head
+        previous._lock.acquire()
+        current = previous._next_node
+        current._lock.acquire()
+
+        try:
+            while current is not self._tail and current._value < value:
+                previous._lock.release()
+                previous = current
+                current = current._next_node
+                current._lock.acquire()
+
+            self._link_between(previous, new_node, current)
+        finally:
+            current._lock.release()
+            previous._lock.release()
+
+    # space: O(c) for one chunk of the snapshot's value strings
+    # time: O(n)
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        values = [str(value) for value in self.snapshot()]
+
+        for start in range(0, len(values), chunk_size):
+            file.write(' '.join(values[start:start + chunk_size]) + ' ')
+
+        file.write('\n')
+
+    # space: O(1)
+    # time: O(n) in the worst case, the value isn't in the list
+    def delete(self, value):
+        """
+        Delete the first node found with the specified value.
+
+        Returns the deleted node if found; else None.
+        """
+        previous = self._head
+        previous._lock.acquire()
+        current = previous._next_node
+        current._lock.acquire()
+
+        try:
+            while current is not self._tail:
+                if current._value == value:
+                    with current._next_node._lock:
+                        self._unlink(current)
+                    return current
+
+                previous._lock.release()
+                previous = current
+                current = current._next_node
+                current._lock.acquire()
+
+            return None
+        finally:
+            current._lock.release()
+            previous._lock.release()
+
+    # space: O(n) for the list of locked nodes
+    # time: O(n), and it holds every lock while it relinks
+    def reverse(self):
+        """Reverse the linked list; other threads wait until it's done."""
+        nodes = [self._head]
+        self._head._lock.acquire()
+
+        try:
+            while nodes[-1] is not self._tail:
+                next_node = nodes[-1]._next_node
+                next_node._lock.acquire()
+                nodes.append(next_node)
+
+            inner = nodes[1:-1]
+
+            for node in inner:
+                node._prev_node, node._next_node = node._next_node, node._prev_node
+
+            if inner:
+                inner[-1]._prev_node = self._head
+                inner[0]._next_node = self._tail
+                self._head._next_node = inner[-1]
+                self._tail._prev_node = inner[0]
+        finally:
+            for node in nodes:
+                node._lock.release()
+
+    # space: O(1)
+    # time: O(n)
+    def check_integrity(self):
+        """
+        Return True if every next link is mirrored by a prev link and the
+        node count matches the length.
+
+        Only meaningful while no other thread is mutating the list.
+        """
+        count = 0
+        current = self._head
+
+        while current is not self._tail:
+            next_node = current._next_node
+
+            if next_node is None or next_node._prev_node is not current:
+                return False
+
+            if next_node._removed:
+                return False
+
+            current = next_node
+            count += 1
+
+        return count - 1 == self._length
@@ -0,0 +1,97 @@
+import io
+import threading
+import unittest
+import concurrent_linked_list as concurrent
+
+
+class TestConcurrentDoublyLinkedList(unittest.TestCase):
+    """Test doubly linked list with per-node locks."""
+
+    def setUp(self):
+        self.empty_list = concurrent.ConcurrentDoublyLinkedList()
+        self.lst = concurrent.ConcurrentDoublyLinkedList.from_iterable(
+            [-3, 4, -3, 5, 20])
+
+    def test_methods(self):
+        lst = self.lst
+        self.assertEqual(str(lst), '-3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(list(reversed(lst)), [20, 5, -3, 4, -3])
+        self.assertEqual(lst.length(), 5)
+        self.assertIn(5, lst)
+        self.assertNotIn(6, lst)
+        self.assertEqual(lst.find_max(), 20)
+        self.assertEqual(lst.find_min(), -3)
+        self.assertEqual(lst.find_nth_from_beginning(1), 4)
+        self.assertEqual(lst.find_nth_from_end(1), 5)
+        self.assertEqual(lst.find_middle_value(), -3)
+
+        self.assertIsNone(self.empty_list.find_max())
+        self.assertIsNone(self.empty_list.find_middle_value())
+
+        with self.assertRaises(IndexError):
+            lst.find_nth_from_beginning(5)
+
+        out = io.StringIO()
+        lst.visit(out, chunk_size=2)
+        self.assertEqual(out.getvalue(), '-3 4 -3 5 20 \n')
+
+    def test_mutations(self):
+        lst = self.lst
+        self.assertEqual(lst.delete(-3).value, -3)
+        self.assertIsNone(lst.delete(7))
+        self.assertEqual(lst.pop_back(), 20)
+        self.assertEqual(lst.pop_front(), 4)
+        lst.insert(1)
+        lst.append(9)
+        self.assertEqual(str(lst), '1 -> -3 -> 5 -> 9')
+
+        lst.reverse()
+        self.assertEqual(str(lst), '9 -> 5 -> -3 -> 1')
+        self.assertTrue(lst.check_integrity())
+
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_front()
+
+    def test_insert_ascending(self):
+        lst = self.empty_list
+        for value in [5, 1, 9, 5, 0]:
+            lst.insert_ascending(value)
+        self.assertEqual(str(lst), '0 -> 1 -> 5 -> 5 -> 9')
+        self.assertTrue(lst.check_integrity())
+
+    def test_threads(self):
+        lst = self.empty_list
+        pushed = 2000
+
+        def produce(start):
+            for value in range(start, start + pushed):
+                if value % 2:
+                    lst.append(value)
+                else:
+                    lst.insert(value)
+
+        def consume(popped):
+            while len(popped) < pushed:
+                try:
+                    popped.append(lst.pop_back())
+                except IndexError:
+                    pass
+
+        popped = [[], []]
+        threads = [threading.Thread(target=produce, args=(i * pushed,)) for i in range(2)]
+        threads += [threading.Thread(target=consume, args=(out,)) for out in popped]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(lst.length(), 0)
+        self.assertTrue(lst.check_integrity())
+        self.assertEqual(sorted(popped[0] + popped[1]), list(range(2 * pushed)))
+
+
+if __name__ == '__main__':
+    unittest.main()
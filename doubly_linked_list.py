@@ -1,6 +1,14 @@
+import sys
+from collections import deque
+from operator import attrgetter, gt, lt
+
+
 class Node:
     """Basic Node class for doubly linked list."""
 
+    # slots drop the per-instance __dict__, which is most of a node's size
+    __slots__ = ('_value', '_prev_node', '_next_node')
+
     def __init__(self, value):
         self._value = value
         self._prev_node = None
@@ -29,41 +37,511 @@ class Node:
 
 
 class DoublyLinkedList:
-    """Doubly Linked List class."""
+    """
+    Doubly Linked List class.
+
+    With indexed=True the list also keeps a dict from each value to its
+    nodes in chain order, so search and delete don't scan. Values must
+    then be hashable.
+
+    With track_extrema=True, find_min and find_max are served from an
+    aggregate kept up to date on insertion (see LinkedList).
+
+    The list also keeps a pointer to its middle node (index
+    (length - 1) // 2). Every insert or removal shifts it by at most one
+    step, so find_middle_value is O(1). A removal whose side of the middle
+    isn't known, like an indexed delete, drops the pointer instead, and
+    the next find_middle_value walks to rebuild it.
 
-    def __init__(self):
+    Positional reads walk from whichever of the head, the tail or the
+    last position read (the finger) is closest.
+
+    A node pool works as it does for LinkedList.
+
+    reverse() is O(1): it flips which end the list reads from instead of
+    relinking, and every read and write follows the current orientation.
+    The nodes keep their physical order, so prev_node and next_node on a
+    reversed list point the other way from the values' order.
+    materialize() relinks them to match; sort and the ascending inserts
+    do so first.
+    """
+
+    # factory for new nodes; instrumentation swaps in a counting subclass
+    _make_node = Node
+
+    def __init__(self, indexed=False, track_extrema=False, pool=None):
         self._head = None
+        self._tail = None
+        self._length = 0
+        self._index = {} if indexed else None
+
+        # None on a non-empty list means the middle has to be recomputed
+        self._middle = None
+
+        self._track_extrema = track_extrema
+        self._min = self._max = None
+        self._extrema_stale = False
+        self._ascending = True
+
+        # last node reached by position, so nearby lookups start from it
+        self._finger_node = None
+        self._finger_index = 0
+
+        # True when the values read from _tail back to _head; the middle,
+        # finger and index all stay in physical terms
+        self._reversed = False
+
+        # with a NodePool, new nodes come off its free-list for this node
+        # class and removed ones go back
+        self._pool = pool
+        self._free = None if pool is None else pool.free_list(self._make_node)
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Build a list holding the iterable's values in the same order."""
+        lst = cls(**kwargs)
+        lst.extend(iterable)
+        return lst
 
     def __str__(self):
-        s = ''
+        return ' -> '.join(str(value) for value in self)
+
+    # space: O(1) beyond the pickled values
+    # time: O(n)
+    def __reduce__(self):
+        # hand pickle the values as list items instead of the node chain,
+        # which it would recurse through one node per stack frame;
+        # unpickling feeds them back through extend in batches, and an
+        # instrumented list comes back as the plain class it wraps
+        cls = getattr(type(self), '_plain_class', type(self))
+        return cls, (self._index is not None, self._track_extrema), None, iter(self)
+
+    # space and time same as singly LL
+    def __iter__(self):
+        return self._values_backward() if self._reversed else self._values_forward()
+
+    # space: O(1) because prev_node links allow walking back from the tail
+    # time: O(n)
+    def __reversed__(self):
+        return self._values_forward() if self._reversed else self._values_backward()
+
+    def _values_forward(self):
         current = self._head
 
         while current:
-            s += str(current.value)
-            s += ' -> '
-            current = current.next_node
-        return s[:-4]
+            yield current._value
+            current = current._next_node
+
+    def _values_backward(self):
+        current = self._tail
+
+        while current:
+            yield current._value
+            current = current._prev_node
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
 
     # space and time same as singly LL
     def insert(self, value):
         """Insert new node with given value at the head of the linked list."""
-        new_node = Node(value)
+        if self._reversed:
+            self._push_back(value)
+        else:
+            self._push_front(value)
+
+    # space and time: O(1)
+    def _push_front(self, value):
+        """Link a new node holding value in front of the physical head."""
+        # reusing a pooled node inline costs far less than making one
+        free = self._free
 
+        if free:
+            new_node = free.pop()
+            new_node._value = value
+        else:
+            new_node = self._make_node(value)
+
+            if free is not None:
+                self._pool.allocations += 1
+
+        if self._index is not None:
+            self._index_node(new_node, True)
+
+        if self._track_extrema:
+            self._see_value(value, at_head=True)
+
+        self._link_front(new_node)
+
+    # space and time: O(1)
+    def _link_front(self, node):
+        """Attach a detached node at the head."""
         if self._head:
-            new_node.next_node = self._head
-            self._head.prev_node = new_node
+            node._next_node = self._head
+            self._head._prev_node = node
+        else:
+            self._tail = node
+
+        self._head = node
+        self._length += 1
+        self._finger_index += 1
+        self._shift_middle_after_insert(node, True)
+
+    # space and time: O(1)
+    def _shift_middle_after_insert(self, node, before_middle):
+        """Move the middle pointer after node was linked in."""
+        old_len = self._length - 1
+
+        if old_len == 0:
+            self._middle = node
+        elif self._middle is None:
+            return
+        elif before_middle:
+            if old_len % 2:
+                self._middle = self._middle._prev_node
+        elif old_len % 2 == 0:
+            self._middle = self._middle._next_node
+
+    # space and time: O(1)
+    def _shift_middle_before_remove(self, node, before_middle):
+        """
+        Move the middle pointer off a node about to be unlinked.
+
+        before_middle is None when the caller doesn't know which side of
+        the middle node is on; the pointer is dropped then.
+        """
+        old_len = self._length
+        middle = self._middle
+
+        if old_len == 1:
+            self._middle = None
+        elif node is middle:
+            self._middle = middle._prev_node if old_len % 2 else middle._next_node
+        elif middle is None:
+            return
+        elif before_middle is None:
+            self._middle = None
+        elif before_middle:
+            if old_len % 2 == 0:
+                self._middle = middle._next_node
+        elif old_len % 2:
+            self._middle = middle._prev_node
+
+    # space: O(1)
+    # time: O(n) to walk to the middle index
+    def _locate_middle(self):
+        current = self._head
+
+        for _ in range((self._length - 1) // 2):
+            current = current._next_node
+
+        self._middle = current
+
+    # space: O(1) because it only needs a variable for the new node
+    # time: O(1) because the tail pointer means there's no walk to the end
+    def append(self, value):
+        """Insert new node with given value at the tail of the linked list."""
+        if self._reversed:
+            self._push_front(value)
+        else:
+            self._push_back(value)
 
-        self._head = new_node
+    # space and time: O(1)
+    def _push_back(self, value):
+        """Link a new node holding value after the physical tail."""
+        free = self._free
+
+        if free:
+            new_node = free.pop()
+            new_node._value = value
+        else:
+            new_node = self._make_node(value)
+
+            if free is not None:
+                self._pool.allocations += 1
+
+        if self._index is not None:
+            self._index_node(new_node, False)
+
+        if self._track_extrema:
+            self._see_value(value, at_tail=True)
+
+        if self._tail:
+            new_node._prev_node = self._tail
+            self._tail._next_node = new_node
+        else:
+            self._head = new_node
+
+        self._tail = new_node
+        self._length += 1
+        self._shift_middle_after_insert(new_node, False)
+
+    # space: O(1)
+    # time: O(1) when the node is the first or last with its value
+    def _index_node(self, node, first):
+        """Record node in the value index as the first or last occurrence."""
+        nodes = self._index.get(node._value)
+
+        if nodes is None:
+            self._index[node._value] = deque((node,))
+        elif first:
+            nodes.appendleft(node)
+        else:
+            nodes.append(node)
+
+    # same as above for space and time
+    def _unindex_node(self, node):
+        """Drop node from the value index."""
+        nodes = self._index[node._value]
+
+        if nodes[0] is node:
+            nodes.popleft()
+        elif nodes[-1] is node:
+            nodes.pop()
+        else:
+            nodes.remove(node)
+
+        if not nodes:
+            del self._index[node._value]
 
     # space and time same as singly LL
+    def extend(self, iterable):
+        """Append every value of the iterable, in order, at the tail."""
+        # extending a list with itself would never reach the end
+        if iterable is self:
+            iterable = list(iterable)
+
+        # the aggregate needs each value, and a reversed list grows at its
+        # physical head, so those go through append
+        if self._track_extrema or self._reversed:
+            for value in iterable:
+                self.append(value)
+            return
+
+        tail = self._tail
+        count = 0
+        free = self._free
+
+        for value in iterable:
+            if free:
+                new_node = free.pop()
+                new_node._value = value
+            else:
+                new_node = self._make_node(value)
+
+                if free is not None:
+                    self._pool.allocations += 1
+
+            if self._index is not None:
+                self._index_node(new_node, False)
+
+            if tail:
+                new_node._prev_node = tail
+                tail._next_node = new_node
+            else:
+                self._head = new_node
+
+            tail = new_node
+            count += 1
+
+        self._tail = tail
+        self._length += count
+
+        # everything went in after the middle, so it only moves forward
+        if self._middle is not None:
+            old_len = self._length - count
+
+            for _ in range((self._length - 1) // 2 - (old_len - 1) // 2):
+                self._middle = self._middle._next_node
+
+    # space: O(n) for the new index
+    # time: O(n)
+    def _rebuild_index(self):
+        """Rebuild the value index from scratch in chain order."""
+        self._index = {}
+        current = self._head
+
+        while current:
+            self._index_node(current, False)
+            current = current._next_node
+
+    # space and time: O(1), unlike singly LL the predecessor is one hop away
+    def _unlink_node(self, node, before_middle=None):
+        """
+        Detach node from the list, fixing head, tail, length and index.
+
+        before_middle tells which side of the middle node the node is on,
+        if the caller knows.
+        """
+        if self._index is not None:
+            self._unindex_node(node)
+
+        self._shift_middle_before_remove(node, before_middle)
+
+        # the finger survives removals at either end unless it's the node
+        if self._finger_node is not None:
+            if node is self._finger_node:
+                self._finger_node = None
+            elif node is self._head:
+                self._finger_index -= 1
+            elif node is not self._tail:
+                self._finger_node = None
+
+        prev_node = node._prev_node
+        next_node = node._next_node
+
+        if prev_node:
+            prev_node._next_node = next_node
+        else:
+            self._head = next_node
+
+        if next_node:
+            next_node._prev_node = prev_node
+        else:
+            self._tail = prev_node
+
+        node._prev_node = None
+        node._next_node = None
+        self._length -= 1
+
+        # an empty list has no orientation to keep
+        if not self._length:
+            self._reversed = False
+
+        if self._track_extrema:
+            self._drop_value(node._value)
+
+    # space and time: O(1)
+    def _new_node(self, value):
+        """Return a node holding value, off the pool's free-list if it has one."""
+        free = self._free
+
+        if free:
+            node = free.pop()
+            node._value = value
+            return node
+
+        if free is not None:
+            self._pool.allocations += 1
+
+        return self._make_node(value)
+
+    # space and time: O(1)
+    def _release(self, node):
+        """Return the value of a removed node, pooling the node if pooled."""
+        value = node._value
+
+        if self._pool is not None:
+            self._pool.release(node)
+
+        return value
+
+    # space and time: O(1)
+    def pop_front(self):
+        """
+        Remove the first node and return its value.
+
+        Raises IndexError if the list is empty.
+        """
+        if not self._head:
+            raise IndexError
+
+        if self._reversed:
+            removed = self._tail
+            self._unlink_node(removed, False)
+        else:
+            removed = self._head
+            self._unlink_node(removed, True)
+
+        value = removed._value
+
+        if self._pool is not None:
+            self._pool.release(removed)
+
+        return value
+
+    # space and time: O(1) because the tail knows its predecessor
+    def pop_back(self):
+        """
+        Remove the last node and return its value.
+
+        Raises IndexError if the list is empty.
+        """
+        if not self._tail:
+            raise IndexError
+
+        if self._reversed:
+            removed = self._head
+            self._unlink_node(removed, True)
+        else:
+            removed = self._tail
+            self._unlink_node(removed, False)
+
+        value = removed._value
+
+        if self._pool is not None:
+            self._pool.release(removed)
+
+        return value
+
+    # space and time same as singly LL
+    def _see_value(self, value, at_head=False, at_tail=False):
+        """Fold a value about to be linked into the tracked min and max."""
+        if self._ascending and self._head:
+            if at_head and value > self._head._value:
+                self._ascending = False
+            elif at_tail and value < self._tail._value:
+                self._ascending = False
+
+        if self._extrema_stale:
+            return
+
+        if self._max is None:
+            self._min = self._max = value
+        elif value < self._min:
+            self._min = value
+        elif value > self._max:
+            self._max = value
+
+    # space and time same as singly LL
+    def _drop_value(self, value):
+        """Invalidate the tracked min/max if value was one of them."""
+        if not self._length:
+            self._min = self._max = None
+            self._extrema_stale = False
+            self._ascending = True
+        elif value == self._min or value == self._max:
+            self._extrema_stale = True
+
+    # space and time same as singly LL
+    def _refresh_extrema(self):
+        current = self._head
+        self._min = self._max = current._value
+
+        while current:
+            if current._value < self._min:
+                self._min = current._value
+            elif current._value > self._max:
+                self._max = current._value
+            current = current._next_node
+
+        self._extrema_stale = False
+
+    # space and time same as singly LL, O(1) time when indexed
     def search(self, value):
         """Search for the given value. Returns True if found; else False."""
+        if self._index is not None:
+            return value in self._index
+
         current = self._head
 
         while current:
-            if current.value == value:
+            if current._value == value:
                 return True
-            current = current.next_node
+            current = current._next_node
 
         return False
 
@@ -74,13 +552,20 @@ class DoublyLinkedList:
         if not self._head:
             return None
 
+        if self._track_extrema:
+            if self._ascending:
+                return self._tail._value
+            if self._extrema_stale:
+                self._refresh_extrema()
+            return self._max
+
         current = self._head
         max_so_far = float('-Inf')
 
         while current:
-            if current.value > max_so_far:
-                max_so_far = current.value
-            current = current.next_node
+            if current._value > max_so_far:
+                max_so_far = current._value
+            current = current._next_node
 
         return max_so_far
 
@@ -90,45 +575,138 @@ class DoublyLinkedList:
         if not self._head:
             return None
 
+        if self._track_extrema:
+            if self._ascending:
+                return self._head._value
+            if self._extrema_stale:
+                self._refresh_extrema()
+            return self._min
+
         current = self._head
         min_so_far = float('Inf')
 
         while current:
-            if current.value < min_so_far:
-                min_so_far = current.value
-            current = current.next_node
+            if current._value < min_so_far:
+                min_so_far = current._value
+            current = current._next_node
 
         return min_so_far
 
     # space and time same as singly LL
     def length(self):
-        len_list = 0
+        return self._length
+
+    # space: O(1)
+    # time: O(k) where k is the distance from the nearest of the head, the
+    # tail and the finger, so at most n / 2
+    def _node_at(self, index):
+        """
+        Return the node at index and leave the finger on it.
+
+        Raises IndexError if index is not in list range.
+        """
+        if not 0 <= index < self._length:
+            raise IndexError
+
+        if self._reversed:
+            index = self._length - 1 - index
+
+        return self._walk_to(index)
+
+    # same as above for space and time
+    def _walk_to(self, index):
+        """Return the node at a physical index, counted from _head."""
         current = self._head
+        counter = 0
+        distance = index
 
-        while current:
-            len_list += 1
-            current = current.next_node
+        if self._length - 1 - index < distance:
+            current = self._tail
+            counter = self._length - 1
+            distance = counter - index
 
-        return len_list
+        if self._finger_node is not None and abs(index - self._finger_index) < distance:
+            current = self._finger_node
+            counter = self._finger_index
 
-    # space and time same as singly LL
+        while counter < index:
+            current = current._next_node
+            counter += 1
+
+        while counter > index:
+            current = current._prev_node
+            counter -= 1
+
+        self._finger_node = current
+        self._finger_index = index
+        return current
+
+    # space: O(1)
+    # time: O(k) where k is the distance from the nearest of the head, the
+    # tail and the last position read, so sequential reads are O(1) each
     def find_nth_from_beginning(self, n):
         """
         Return value of nth node in the list.
 
         Raises error if n is not in list range.
         """
-        current = self._head
-        counter = 0
+        return self._node_at(n)._value
 
-        while current:
-            if counter == n:
-                return current.value
+    # space: O(1)
+    # time: same as _node_at
+    def insert_at(self, index, value):
+        """
+        Insert new node with given value so that it ends up at index.
 
-            counter += 1
-            current = current.next_node
+        index may be anything from 0 to the length; raises IndexError
+        otherwise.
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError
 
-        raise IndexError
+        # from here on index is physical; the new node takes that position
+        if self._reversed:
+            index = self._length - index
+
+        if index == 0:
+            self._push_front(value)
+            return
+
+        if index == self._length:
+            self._push_back(value)
+            return
+
+        # the finger stays on previous, next to the new node
+        previous = self._walk_to(index - 1)
+        next_node = previous._next_node
+
+        if self._track_extrema:
+            if not previous._value <= value <= next_node._value:
+                self._ascending = False
+            self._see_value(value)
+
+        new_node = self._new_node(value)
+        new_node._prev_node = previous
+        new_node._next_node = next_node
+        previous._next_node = new_node
+        next_node._prev_node = new_node
+        self._length += 1
+        self._shift_middle_after_insert(new_node, index <= (self._length - 2) // 2)
+
+        if self._index is not None:
+            # where it goes among equal values isn't known without a walk
+            if value in self._index:
+                self._rebuild_index()
+            else:
+                self._index_node(new_node, True)
+
+    def cursor(self, index=0):
+        """
+        Return a Cursor on the node at index.
+
+        Raises IndexError if index is not in list range.
+        """
+        return Cursor(self, self._node_at(index), index)
 
     # space and time same as singly LL
     def insert_ascending(self, value):
@@ -137,90 +715,461 @@ class DoublyLinkedList:
 
         Assumes the list is already sorted.
         """
-        new_node = Node(value)
+        self.materialize()
+        new_node = self._new_node(value)
+        self._finger_node = None
+
+        if self._track_extrema:
+            self._see_value(value)
+
+        # the new node lands before any equal values, so it's their first
+        if self._index is not None:
+            self._index_node(new_node, True)
 
         # if inserting at head of list
-        if not self._head or value <= self._head.value:
+        if not self._head or value <= self._head._value:
             if self._head:
-                new_node.next_node = self._head
-                self._head.prev_node = new_node
+                new_node._next_node = self._head
+                self._head._prev_node = new_node
+            else:
+                self._tail = new_node
 
             self._head = new_node
+            self._length += 1
+            self._shift_middle_after_insert(new_node, True)
             return
 
         current = self._head
-
-        while current.next_node:
-            next_node = current.next_node
-
-            if value <= next_node.value:
-                new_node.next_node = next_node
-                new_node.prev_node = current
-                next_node.prev_node = new_node
-                current.next_node = new_node
+        middle = self._middle
+        passed_middle = False
+
+        while current._next_node:
+            passed_middle = passed_middle or current is middle
+            next_node = current._next_node
+
+            if value <= next_node._value:
+                new_node._next_node = next_node
+                new_node._prev_node = current
+                next_node._prev_node = new_node
+                current._next_node = new_node
+                self._length += 1
+                self._shift_middle_after_insert(new_node, not passed_middle)
                 return
 
-            current = current.next_node
+            current = current._next_node
 
         # if item is added at end of list
-        new_node.prev_node = current
-        current.next_node = new_node
+        new_node._prev_node = current
+        current._next_node = new_node
+        self._tail = new_node
+        self._length += 1
+        self._shift_middle_after_insert(new_node, False)
 
     # space and time same as singly LL
-    def visit(self):
+    def insert_many_ascending(self, values):
         """
-        Print all values in the linked list.
+        Insert every value in ascending order.
 
-        Prints empty string if list is empty.
+        Assumes the list is already sorted. The batch is sorted stably and
+        merged in, each value going before any equal values already in the
+        list, so equal values from the batch keep their order among
+        themselves. Repeated insert_ascending calls would put each later
+        equal value first instead.
         """
+        self.materialize()
+        batch = sorted(values)
+        self._finger_node = None
+
+        if self._track_extrema:
+            for value in batch:
+                self._see_value(value)
+
+        previous = None
         current = self._head
+        indexed = self._index is not None
+        new_nodes = []
 
-        while current:
-            print(current.value, end=' ')
-            current = current.next_node
+        for value in batch:
+            while current and current._value < value:
+                previous = current
+                current = current._next_node
+
+            new_node = self._new_node(value)
+            new_node._prev_node = previous
+            new_node._next_node = current
+
+            if previous:
+                previous._next_node = new_node
+            else:
+                self._head = new_node
+
+            if current:
+                current._prev_node = new_node
+            else:
+                self._tail = new_node
+
+            previous = new_node
+
+            if indexed:
+                new_nodes.append(new_node)
+
+        self._length += len(batch)
+        self._middle = None
+
+        # new nodes sit in batch order ahead of any equal old ones, so each
+        # run of equal values goes in front of that value's index entries
+        for new_node in reversed(new_nodes):
+            self._index_node(new_node, True)
+
+    # space and time same as singly LL
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
 
-        print('')
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
 
-    # same as singly LL
+        file.write('\n')
+
+    # same as singly LL, O(1) time when indexed
     def delete(self, value):
         """
         Delete the first node found with the specified value.
 
         Returns the deleted node if found; else None.
         """
-        current = self._head
+        if self._index is not None:
+            nodes = self._index.get(value)
+
+            if not nodes:
+                return None
+
+            deleted = nodes[-1] if self._reversed else nodes[0]
+            self._unlink_node(deleted)
+            return deleted
+
+        # a reversed list is walked from its physical tail, where nodes are
+        # past the middle until the walk reaches it
+        backward = self._reversed
+        current = self._tail if backward else self._head
+        before_middle = not backward
 
         while current:
-            if current.value == value:
-                current.prev_node.next_node = current.next_node
-                current.next_node.prev_node = current.prev_node
+            if current._value == value:
+                self._unlink_node(current, before_middle)
                 return current
-            current = current.next_node
+
+            if current is self._middle:
+                before_middle = backward
+
+            current = current._prev_node if backward else current._next_node
 
         return None
 
-    # same as singly ll
+    # space: O(1)
+    # time: O(n), a single pass however many nodes match
+    def _delete_matching(self, match, done=None):
+        """
+        Unlink every node whose value match accepts; return how many.
+
+        done, if given, is called after each removal and ends the pass
+        early once it returns True.
+        """
+        removed = 0
+        backward = self._reversed
+        current = self._tail if backward else self._head
+        before_middle = not backward
+
+        while current:
+            next_node = current._prev_node if backward else current._next_node
+
+            # nodes after this one are past the middle, even if removing
+            # this one moves the middle pointer onto next_node
+            at_middle = current is self._middle
+
+            if match(current._value):
+                self._unlink_node(current, before_middle)
+                self._release(current)
+                removed += 1
+
+                if done is not None and done():
+                    break
+
+            if at_middle:
+                before_middle = backward
+
+            current = next_node
+
+        return removed
+
+    # space: O(1)
+    # time: O(j) for the j nodes deleted
+    def _delete_indexed(self, value, count):
+        """Delete the first count nodes holding value (every one if None)."""
+        removed = 0
+
+        while value in self._index and (count is None or removed < count):
+            node = self._index[value][-1 if self._reversed else 0]
+            self._unlink_node(node)
+            self._release(node)
+            removed += 1
+
+        return removed
+
+    # space and time same as singly LL
+    def delete_where(self, predicate):
+        """
+        Delete every node whose value predicate returns true for.
+
+        Returns the number of nodes deleted.
+        """
+        return self._delete_matching(predicate)
+
+    # space and time same as singly LL; O(k + j) when indexed, for the
+    # k values and the j nodes deleted
+    def delete_all(self, values):
+        """
+        Delete every node holding any of the values, in one pass.
+
+        The values must be hashable. Returns the number of nodes deleted.
+        """
+        targets = set(values)
+
+        if not targets:
+            return 0
+
+        if self._index is not None:
+            return sum(self._delete_indexed(value, None) for value in targets)
+
+        def match(value):
+            try:
+                return value in targets
+            except TypeError:  # an unhashable value can't be a target
+                return False
+
+        return self._delete_matching(match)
+
+    # same as delete_all for space and time
+    def delete_many(self, values, count=1):
+        """
+        Delete the first count nodes holding each of the values, in one pass.
+
+        With the default count of 1 this does what calling delete for each
+        distinct value would, without a scan from the head per value;
+        count=None deletes every match, like delete_all. The values must
+        be hashable. Returns the number of nodes deleted.
+        """
+        if count is None:
+            return self.delete_all(values)
+
+        if count < 0:
+            raise ValueError('count must not be negative')
+
+        pending = dict.fromkeys(values, count) if count else {}
+
+        if not pending:
+            return 0
+
+        if self._index is not None:
+            return sum(self._delete_indexed(value, count) for value in pending)
+
+        def match(value):
+            try:
+                left = pending.get(value)
+            except TypeError:
+                return False
+
+            if left is None:
+                return False
+
+            if left == 1:
+                del pending[value]
+            else:
+                pending[value] = left - 1
+
+            return True
+
+        return self._delete_matching(match, lambda: not pending)
+
+    # space and time same as singly LL, plus one O(n) pass to relink
+    # prev_node and the index
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place by relinking its nodes.
+
+        Stable bottom-up natural merge sort; key and reverse work as they
+        do for list.sort. Sorts on next_node links, then restores
+        prev_node in one pass.
+        """
+        if self._length < 2:
+            return
+
+        # ties keep their order, so the chain must be in value order first
+        self.materialize()
+
+        if key is None:
+            sort_key = attrgetter('_value')
+        else:
+            keys = {}
+            current = self._head
+
+            while current:
+                keys[current] = key(current._value)
+                current = current._next_node
+
+            sort_key = keys.__getitem__
+
+        # before(a, b) is True when a must come strictly before b
+        before = gt if reverse else lt
+
+        if self._track_extrema:
+            self._ascending = key is None and not reverse
+
+        # cut the chain into runs, flipping strictly descending ones (which
+        # can't hold equal keys, so flipping them keeps the sort stable)
+        runs = []
+        current = self._head
+
+        while current:
+            run_head = run_tail = current
+            current = current._next_node
+
+            if current and before(sort_key(current), sort_key(run_head)):
+                while current and before(sort_key(current), sort_key(run_head)):
+                    next_node = current._next_node
+                    current._next_node = run_head
+                    run_head = current
+                    current = next_node
+            else:
+                while current and not before(sort_key(current), sort_key(run_tail)):
+                    run_tail = current
+                    current = current._next_node
+
+            run_tail._next_node = None
+            runs.append((run_head, run_tail))
+
+        # merge neighbouring runs pairwise until one is left
+        while len(runs) > 1:
+            merged = [self._merge_runs(runs[i], runs[i + 1], sort_key, before)
+                      for i in range(0, len(runs) - 1, 2)]
+
+            if len(runs) % 2:
+                merged.append(runs[-1])
+
+            runs = merged
+
+        self._head, self._tail = runs[0]
+        self._middle = None
+        self._finger_node = None
+
+        previous = None
+        current = self._head
+
+        while current:
+            current._prev_node = previous
+            previous = current
+            current = current._next_node
+
+        if self._index is not None:
+            self._rebuild_index()
+
+    @staticmethod
+    def _merge_runs(left, right, sort_key, before):
+        """Merge two sorted runs; ties go to left. Returns (head, tail)."""
+        left_node, left_tail = left
+        right_node, right_tail = right
+
+        if before(sort_key(right_node), sort_key(left_node)):
+            head = right_node
+            right_node = right_node._next_node
+        else:
+            head = left_node
+            left_node = left_node._next_node
+
+        tail = head
+
+        while left_node and right_node:
+            if before(sort_key(right_node), sort_key(left_node)):
+                tail._next_node = right_node
+                tail = right_node
+                right_node = right_node._next_node
+            else:
+                tail._next_node = left_node
+                tail = left_node
+                left_node = left_node._next_node
+
+        if left_node:
+            tail._next_node = left_node
+            return head, left_tail
+
+        tail._next_node = right_node
+        return head, right_tail
+
+    # space and time: O(1), only the orientation flips
     def reverse(self):
-        """Reverse the linked list iteratively."""
+        """Reverse the order of the values; see materialize."""
         # if empty or 1 item in list
-        if not self._head or not self._head.next_node:
+        if not self._head or not self._head._next_node:
+            return
+
+        self._ascending = False
+        self._reversed = not self._reversed
+
+    # space: O(1)
+    # time: O(n) if the list is reversed; else O(1)
+    def materialize(self):
+        """
+        Relink the nodes so next_node follows the order of the values.
+
+        After a reverse the links still run the old way; this makes them
+        match, leaving the values' order as it is.
+        """
+        if not self._reversed:
             return
 
+        self._reversed = False
         current = self._head
         prev_node = None
 
         while current:
-            next_node = current.next_node
+            next_node = current._next_node
 
-            current.prev_node = next_node
-            current.next_node = prev_node
+            current._prev_node = next_node
+            current._next_node = prev_node
 
             prev_node = current
             current = next_node
 
+        self._tail = self._head
         self._head = prev_node
+        self._finger_index = self._length - 1 - self._finger_index
+
+        # with an even length the lower middle is now the old upper middle
+        if self._middle is not None and self._length % 2 == 0:
+            self._middle = self._middle._prev_node
 
-    # same as singly LL
+        # chain order flipped, so does the order of each value's nodes
+        if self._index is not None:
+            for nodes in self._index.values():
+                nodes.reverse()
+
+    # space: O(1)
+    # time: O(1) from the middle pointer; O(n) if it has to be rebuilt
     def find_middle_value(self):
         """
         Return value at middle node in list.
@@ -233,59 +1182,149 @@ class DoublyLinkedList:
         if not self._head:
             return None
 
-        len_list = self.length()
+        if self._middle is None:
+            self._locate_middle()
 
-        # if len is even, return lower indexed element
-        if len_list % 2 == 0:
-            return self.find_nth_from_beginning((len_list / 2) - 1)
-        else:
-            return self.find_nth_from_beginning(len_list // 2)
+        # the middle is kept in physical order, where an even length has
+        # the reversed list's middle one node further on
+        if self._reversed and self._length % 2 == 0:
+            return self._middle._next_node._value
+
+        return self._middle._value
 
-    # space: O(1) because it only needs vars to track current, length, and range
-    # per python docs, amount of memory required for range object is
-    # constant, no matter the size of the range it represents
-    # time: O(k + n) where k is the length of the list and n is the desired index.
-    # If n is the first element in the list, this is the same as O(2k)
+    # space: O(1)
+    # time: O(n) where n is the desired index, since the walk starts at the
+    # tail, unless the head or the last position read is closer
     def find_nth_from_end(self, n):
         """
         Return value of nth node from end of list.
 
         Assumes last node is index 0. (e.g. 3rd from end is idx -4).
+        """
+        # check n is in range
+        if self._length - 1 < n:
+            raise IndexError
+
+        return self._node_at((self._length - 1) - n)._value
 
-        Uses counter instead of length() to only iterate once through list.
+    # space and time same as singly LL
+    def _detect_cycle(self):
         """
-        current = self._head
-        len_list = 0
+        Return (tail length, cycle length, entry node) or None if acyclic.
+
+        Uses Brent's algorithm over next_node links only.
+        """
+        if not self._head:
+            return None
 
-        while current and current.next_node:
-            len_list += 1
-            current = current.next_node
+        power = cycle_len = 1
+        tortoise = self._head
+        hare = self._head._next_node
 
-        # add 1 to len list since loop only iterates through penultimate node
-        len_list += 1
+        while hare is not tortoise:
+            if hare is None:
+                return None
 
-        # check n is in range
-        if len_list - 1 < n:
-            raise IndexError
+            if power == cycle_len:
+                tortoise = hare
+                power *= 2
+                cycle_len = 0
+
+            hare = hare._next_node
+            cycle_len += 1
+
+        # start the hare a full cycle ahead; they meet at the entry
+        tortoise = hare = self._head
+
+        for _ in range(cycle_len):
+            hare = hare._next_node
+
+        tail_len = 0
+
+        while tortoise is not hare:
+            tortoise = tortoise._next_node
+            hare = hare._next_node
+            tail_len += 1
 
-        # iterate backward to find nth node
-        for idx in range(n):
-            current = current.prev_node
-        return current.value
+        return tail_len, cycle_len, tortoise
 
     # space and time same as singly LL
     def has_cycle(self):
+        return self._detect_cycle() is not None
+
+    def cycle_entry(self):
+        """Return the first node reached twice, or None if no cycle."""
+        cycle = self._detect_cycle()
+        return cycle[2] if cycle else None
+
+    def cycle_length(self):
+        """Return the number of nodes in the cycle; 0 if there's none."""
+        cycle = self._detect_cycle()
+        return cycle[1] if cycle else 0
+
+    def tail_length(self):
+        """
+        Return the number of nodes before the cycle entry.
+
+        Without a cycle that is every node in the list.
+        """
+        cycle = self._detect_cycle()
+        return cycle[0] if cycle else self._count_nodes()
+
+    # space and time same as singly LL
+    def _count_nodes(self):
+        """Count nodes by walking; only valid on an acyclic chain."""
+        count = 0
         current = self._head
-        visited = set()
 
         while current:
-            if current in visited:
-                return True
+            count += 1
+            current = current._next_node
 
-            visited.add(current)
-            current = current.next_node
+        return count
 
-        return False
+    # space: O(1)
+    # time: O(n) because prev_node links are rebuilt along the chain
+    def break_cycle(self):
+        """
+        Cut the link that closes the cycle, leaving a plain list.
+
+        Returns True if a cycle was broken; else False.
+        """
+        cycle = self._detect_cycle()
+
+        if not cycle:
+            return False
+
+        _, cycle_len, entry = cycle
+        last = entry
+
+        for _ in range(cycle_len - 1):
+            last = last._next_node
+
+        last._next_node = None
+        self._middle = None
+        self._finger_node = None
+        self._extrema_stale = True
+        self._ascending = False
+
+        # prev_node links may be as corrupt as the cycle was
+        previous = None
+        current = self._head
+        self._length = 0
+
+        while current:
+            current._prev_node = previous
+            previous = current
+            current = current._next_node
+            self._length += 1
+
+        self._tail = previous
+
+        if self._index is not None:
+            self._rebuild_index()
+
+        return True
 
     def create_cycle(self):
         """Create a cycle for testing purposes."""
@@ -293,11 +1332,68 @@ class DoublyLinkedList:
         if not self._head:
             return
 
-        current = self._head
+        # cycle back to head
+        self._tail._next_node = self._head
+        self._head._prev_node = self._tail
 
-        while current.next_node:
-            current = current.next_node
 
-        # cycle back to head
-        current.next_node = self._head
-        self._head.prev_node = current.next_node
+class Cursor:
+    """
+    Position in a DoublyLinkedList that moves a node at a time.
+
+    The cursor keeps the list's finger on its node, so moving either way
+    and inserting on either side are O(1) per step. Like an iterator, a
+    cursor is only valid until the list is changed other than through
+    the cursor.
+    """
+
+    __slots__ = ('_list', '_node', '_index')
+
+    def __init__(self, lst, node, index):
+        self._list = lst
+        self._node = node
+        self._index = index
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def value(self):
+        return self._node._value
+
+    def _hand_finger(self):
+        """Put the list's finger back on the cursor's node."""
+        lst = self._list
+        lst._finger_node = self._node
+        lst._finger_index = lst._length - 1 - self._index if lst._reversed else self._index
+
+    # space: O(1)
+    # time: O(steps)
+    def advance(self, steps=1):
+        """
+        Move the cursor steps nodes toward the tail (back if negative).
+
+        Raises IndexError, leaving the cursor where it was, if that would
+        move it off the list.
+        """
+        self._hand_finger()
+        self._node = self._list._node_at(self._index + steps)
+        self._index += steps
+
+    def retreat(self, steps=1):
+        """Move the cursor steps nodes toward the head."""
+        self.advance(-steps)
+
+    # space and time: O(1)
+    def insert_after(self, value):
+        """Insert value right after the cursor; the cursor doesn't move."""
+        self._hand_finger()
+        self._list.insert_at(self._index + 1, value)
+
+    # space and time: O(1)
+    def insert_before(self, value):
+        """Insert value right before the cursor; the cursor stays on its node."""
+        self._hand_finger()
+        self._list.insert_at(self._index, value)
+        self._index += 1
@@ -0,0 +1,253 @@
+"""
+Opt-in operation instrumentation for LinkedList and DoublyLinkedList.
+
+    stats = Instrumentation()
+    stats.instrument(lst)
+    lst.search(3)
+    print(stats.to_prometheus())
+    stats.uninstrument(lst)
+
+Instrumenting a list swaps its class for a subclass whose public methods
+record calls and latency, and swaps its nodes' class for a subclass that
+counts link reads (hops) and allocations. Lists that were never
+instrumented run the plain classes, so they pay nothing.
+"""
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, float('inf'))
+
+LINK_NAMES = ('_next_node', '_prev_node')
+
+
+class MethodStats:
+    """Counters for one method of one list class."""
+
+    __slots__ = ('calls', 'hops', 'allocations', 'total_seconds', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.hops = 0
+        self.allocations = 0
+        self.total_seconds = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'hops': self.hops,
+            'allocations': self.allocations,
+            'total_seconds': self.total_seconds,
+            'latency_buckets': dict(zip(LATENCY_BUCKETS, self.buckets)),
+        }
+
+
+class Instrumentation:
+    """
+    Collects hops, node allocations and latencies from instrumented lists.
+
+    Counts are inclusive: when find_middle_value calls length() and
+    find_nth_from_beginning, their hops count toward all three methods.
+    """
+
+    def __init__(self):
+        self.hops = 0
+        self.allocations = 0
+        self._methods = {}  # (class name, method name) -> MethodStats
+        self._node_classes = {}  # plain node class -> counting subclass
+        self._list_classes = {}  # plain list class -> instrumented subclass
+
+    def reset(self):
+        """Zero every counter; instrumented lists stay instrumented."""
+        self.hops = 0
+        self.allocations = 0
+        self._methods.clear()
+
+    def _counting_node_class(self, node_class):
+        """Return a subclass of node_class that reports to this object."""
+        counting = self._node_classes.get(node_class)
+
+        if counting:
+            return counting
+
+        stats = self
+        namespace = {'__slots__': ()}
+
+        def init(node, value):
+            stats.allocations += 1
+            node_class.__init__(node, value)
+
+        namespace['__init__'] = init
+
+        for name in LINK_NAMES:
+            slot = getattr(node_class, name, None)
+
+            if slot is None:
+                continue
+
+            def get_link(node, slot=slot):
+                stats.hops += 1
+                return slot.__get__(node)
+
+            namespace[name] = property(get_link, slot.__set__)
+
+        counting = type('Counting' + node_class.__name__, (node_class,), namespace)
+        self._node_classes[node_class] = counting
+        return counting
+
+    def _instrumented_list_class(self, list_class):
+        """Return a subclass of list_class whose public methods are timed."""
+        instrumented = self._list_classes.get(list_class)
+
+        if instrumented:
+            return instrumented
+
+        namespace = {'_make_node': self._counting_node_class(list_class._make_node)}
+
+        for name in dir(list_class):
+            method = getattr(list_class, name)
+
+            # classmethods come back bound, so they aren't plain functions
+            if name.startswith('_') or not callable(method) or hasattr(method, '__self__'):
+                continue
+
+            namespace[name] = self._timed(list_class.__name__, name, method)
+
+        instrumented = type(list_class.__name__, (list_class,), namespace)
+        instrumented._plain_class = list_class
+        self._list_classes[list_class] = instrumented
+        return instrumented
+
+    def _timed(self, class_name, name, method):
+        stats = self
+        key = (class_name, name)
+        perf_counter = time.perf_counter
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            hops = stats.hops
+            allocations = stats.allocations
+            start = perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                method_stats = stats._methods.get(key)
+
+                if method_stats is None:
+                    method_stats = stats._methods[key] = MethodStats()
+
+                method_stats.calls += 1
+                method_stats.hops += stats.hops - hops
+                method_stats.allocations += stats.allocations - allocations
+                method_stats.total_seconds += elapsed
+                method_stats.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+        return wrapper
+
+    @staticmethod
+    def _nodes(lst):
+        """Yield every node of lst, stopping if the chain loops back."""
+        seen = set()
+        current = lst._head
+
+        while current and current not in seen:
+            seen.add(current)
+            yield current
+            current = current._next_node
+
+    # space: O(1) beyond the cached classes
+    # time: O(n) once, to retag the existing nodes
+    def instrument(self, lst):
+        """Start recording lst's operations. Returns lst."""
+        if hasattr(type(lst), '_plain_class'):
+            raise ValueError('list is already instrumented')
+
+        lst.__class__ = self._instrumented_list_class(type(lst))
+        counting = lst._make_node
+
+        # walking uses the plain class so retagging itself isn't counted
+        for node in list(self._nodes(lst)):
+            node.__class__ = counting
+
+        self._switch_free_list(lst, counting)
+        return lst
+
+    def uninstrument(self, lst):
+        """Stop recording lst's operations. Returns lst."""
+        plain = getattr(type(lst), '_plain_class', None)
+
+        if plain is None:
+            raise ValueError('list is not instrumented')
+
+        hops = self.hops
+        nodes = list(self._nodes(lst))
+        self.hops = hops
+
+        for node in nodes:
+            node.__class__ = plain._make_node
+
+        lst.__class__ = plain
+        self._switch_free_list(lst, plain._make_node)
+        return lst
+
+    @staticmethod
+    def _switch_free_list(lst, node_class):
+        """Point a pooled list at the pool's free-list for node_class."""
+        pool = getattr(lst, '_pool', None)
+
+        if pool is not None:
+            lst._free = pool.free_list(node_class)
+
+    def as_dict(self):
+        """Return every counter as nested dicts keyed by class then method."""
+        methods = {}
+
+        for (class_name, name), method_stats in sorted(self._methods.items()):
+            methods.setdefault(class_name, {})[name] = method_stats.as_dict()
+
+        return {
+            'hops': self.hops,
+            'allocations': self.allocations,
+            'methods': methods,
+        }
+
+    def to_prometheus(self, prefix='linked_list'):
+        """Return the counters in the Prometheus text exposition format."""
+        methods = sorted(self._methods.items())
+        labels = {key: 'class="{}",method="{}"'.format(*key) for key, _ in methods}
+
+        lines = [
+            '# TYPE {}_hops_total counter'.format(prefix),
+            '{}_hops_total {}'.format(prefix, self.hops),
+            '# TYPE {}_node_allocations_total counter'.format(prefix),
+            '{}_node_allocations_total {}'.format(prefix, self.allocations),
+        ]
+
+        for counter in ('hops', 'allocations'):
+            lines.append('# TYPE {}_method_{}_total counter'.format(prefix, counter))
+
+            for key, method_stats in methods:
+                lines.append('{}_method_{}_total{{{}}} {}'.format(
+                    prefix, counter, labels[key], getattr(method_stats, counter)))
+
+        lines.append('# TYPE {}_call_seconds histogram'.format(prefix))
+
+        for key, method_stats in methods:
+            cumulative = 0
+
+            for bound, count in zip(LATENCY_BUCKETS, method_stats.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append('{}_call_seconds_bucket{{{},le="{}"}} {}'.format(
+                    prefix, labels[key], le, cumulative))
+
+            lines.append('{}_call_seconds_sum{{{}}} {}'.format(
+                prefix, labels[key], method_stats.total_seconds))
+            lines.append('{}_call_seconds_count{{{}}} {}'.format(
+                prefix, labels[key], method_stats.calls))
+
+        return '\n'.join(lines) + '\n'
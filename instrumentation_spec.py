@@ -0,0 +1,112 @@
+import pickle
+import unittest
+import doubly_linked_list as dll
+import instrumentation
+import linked_list
+import node_pool
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test hop, allocation and latency recording on instrumented lists."""
+
+    def setUp(self):
+        self.stats = instrumentation.Instrumentation()
+        self.lst = linked_list.LinkedList.from_iterable([1, 2, 3, 4])
+        self.stats.instrument(self.lst)
+
+    def method(self, name, class_name='LinkedList'):
+        return self.stats.as_dict()['methods'][class_name][name]
+
+    def test_behavior_unchanged(self):
+        self.lst.insert(0)
+        self.lst.insert_ascending(5)  # not sorted at the tail, still appends
+        self.assertEqual(str(self.lst), '0 -> 1 -> 2 -> 3 -> 4 -> 5')
+        self.assertIsInstance(self.lst, linked_list.LinkedList)
+
+    def test_counts_hops(self):
+        self.lst.search(3)  # follows 1 -> 2 -> 3
+        self.assertEqual(self.method('search')['hops'], 2)
+
+        self.lst.search(100)  # follows every link, including the last None
+        search = self.method('search')
+        self.assertEqual(search['calls'], 2)
+        self.assertEqual(search['hops'], 2 + 4)
+
+    def test_counts_nested_calls(self):
+        self.lst.find_middle_value()
+        self.assertEqual(self.method('find_middle_value')['calls'], 1)
+        self.assertEqual(self.method('length')['calls'], 1)
+        self.assertEqual(self.method('find_nth_from_beginning')['calls'], 1)
+
+    def test_counts_allocations(self):
+        self.lst.insert(0)
+        self.lst.extend([5, 6])
+        self.assertEqual(self.method('insert')['allocations'], 1)
+        self.assertEqual(self.method('extend')['allocations'], 2)
+        self.assertEqual(self.stats.allocations, 3)
+
+    def test_counts_pooled_allocations(self):
+        pool = node_pool.NodePool()
+        lst = self.stats.instrument(linked_list.LinkedList.from_iterable([1], pool=pool))
+        lst.pop_front()
+        lst.insert(2)  # reuses the popped node
+        lst.insert(3)
+        self.assertEqual(self.method('insert')['allocations'], 1)
+        self.assertEqual(pool.stats()['reuses'], 1)
+
+        self.stats.uninstrument(lst)
+        lst.pop_front()
+        lst.insert(4)
+        self.assertIs(type(lst._head), linked_list.Node)
+
+    def test_latency_histogram(self):
+        self.lst.length()
+        buckets = self.method('length')['latency_buckets']
+        self.assertEqual(sum(buckets.values()), 1)
+
+    def test_pickle_as_plain_list(self):
+        copied = pickle.loads(pickle.dumps(self.lst))
+        self.assertIs(type(copied), linked_list.LinkedList)
+        self.assertEqual(list(copied), [1, 2, 3, 4])
+
+        lst = self.stats.instrument(dll.DoublyLinkedList.from_iterable([1, 2]))
+        self.assertIs(type(pickle.loads(pickle.dumps(lst))), dll.DoublyLinkedList)
+
+    def test_uninstrument(self):
+        self.lst.insert(0)
+        self.stats.uninstrument(self.lst)
+        self.assertIs(type(self.lst), linked_list.LinkedList)
+        self.assertIs(type(self.lst._head), linked_list.Node)
+
+        hops = self.stats.hops
+        self.lst.search(100)
+        self.assertEqual(self.stats.hops, hops)
+
+        with self.assertRaises(ValueError):
+            self.stats.uninstrument(self.lst)
+
+    def test_doubly_linked_list(self):
+        lst = self.stats.instrument(dll.DoublyLinkedList.from_iterable([1, 2, 3, 4, 5]))
+        lst.find_nth_from_end(1)
+        self.assertEqual(self.method('find_nth_from_end', 'DoublyLinkedList')['hops'], 1)
+
+        with self.assertRaises(ValueError):
+            self.stats.instrument(lst)
+
+    def test_prometheus(self):
+        self.lst.search(2)
+        text = self.stats.to_prometheus()
+        self.assertIn('linked_list_method_hops_total{class="LinkedList",method="search"} 1',
+                      text)
+        self.assertIn('linked_list_call_seconds_count{class="LinkedList",method="search"} 1',
+                      text)
+        self.assertIn('le="+Inf"} 1', text)
+
+    def test_reset(self):
+        self.lst.search(2)
+        self.stats.reset()
+        self.assertEqual(self.stats.as_dict(), {'hops': 0, 'allocations': 0, 'methods': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
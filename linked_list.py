@@ -1,6 +1,13 @@
+import sys
+from operator import attrgetter, gt, lt
+
+
 class Node:
     """Basic Node class to use in singly linked list."""
 
+    # slots drop the per-instance __dict__, which is most of a node's size
+    __slots__ = ('_value', '_next_node')
+
     def __init__(self, value):
         self._value = value
         self._next_node = None
@@ -21,33 +28,326 @@ class Node:
 
 
 class LinkedList:
-    """Singly linked list class composed of Nodes."""
+    """
+    Singly linked list class composed of Nodes.
+
+    With track_extrema=True the list keeps its min and max up to date as
+    values arrive, so find_min and find_max don't scan. Removing the
+    current min or max marks them stale and the next call recomputes
+    them. While the list is known to be ascending (built with
+    insert_ascending, or sorted with sort()), they are read straight off
+    the head and tail.
 
-    def __init__(self):
+    With a node_pool.NodePool, new nodes are taken from the pool and the
+    nodes pop_front, pop_back and the batch deletes remove are handed back
+    to it. delete still returns its node, which then belongs to the caller.
+    """
+
+    # factory for new nodes; instrumentation swaps in a counting subclass
+    _make_node = Node
+
+    def __init__(self, track_extrema=False, pool=None):
         self._head = None
+        self._tail = None
+        self._length = 0
+
+        self._track_extrema = track_extrema
+        self._min = self._max = None
+        self._extrema_stale = False
+        self._ascending = True
+
+        # last node reached by position, so nearby lookups start from it
+        self._finger_node = None
+        self._finger_index = 0
+
+        # with a NodePool, new nodes come off its free-list for this node
+        # class and removed ones go back
+        self._pool = pool
+        self._free = None if pool is None else pool.free_list(self._make_node)
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Build a list holding the iterable's values in the same order."""
+        lst = cls(**kwargs)
+        lst.extend(iterable)
+        return lst
 
     def __str__(self):
-        s = ''
+        return ' -> '.join(str(value) for value in self)
+
+    # space: O(1) beyond the pickled values
+    # time: O(n)
+    def __reduce__(self):
+        # hand pickle the values as list items instead of the node chain,
+        # which it would recurse through one node per stack frame;
+        # unpickling feeds them back through extend in batches, and an
+        # instrumented list comes back as the plain class it wraps
+        cls = getattr(type(self), '_plain_class', type(self))
+        return cls, (self._track_extrema,), None, iter(self)
+
+    # space: O(1) because the generator only tracks the current node
+    # time: O(n) to exhaust it
+    def __iter__(self):
         current = self._head
 
         while current:
-            s += str(current.value)
-            s += ' -> '  # 4 chars long
-            current = current.next_node
-        return s[:-4]
+            yield current._value
+            current = current._next_node
+
+    # space: O(n) because a singly linked list can only be walked forward,
+    # so the values are collected before being yielded backward
+    # time: O(n)
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
 
     # space: O(1) because it only needs a variable for the new node
     # time: O(1) because it's inserting at the beginning of the list
     # so the amount of work it does is finite and independent of input size
     def insert(self, value):
         """Insert new node with given value at the head of the linked list."""
-        new_node = Node(value)
+        # reusing a pooled node inline costs far less than making one
+        free = self._free
+
+        if free:
+            new_node = free.pop()
+            new_node._value = value
+        else:
+            new_node = self._make_node(value)
+
+            if free is not None:
+                self._pool.allocations += 1
+
+        if self._track_extrema:
+            self._see_value(value, at_head=True)
 
         # if list isn't empty
         if self._head:
-            new_node.next_node = self._head
+            new_node._next_node = self._head
+        else:
+            self._tail = new_node
 
         self._head = new_node
+        self._length += 1
+        self._finger_index += 1
+
+    # space: O(1) because it only needs a variable for the new node
+    # time: O(1) because the tail pointer means there's no walk to the end
+    def append(self, value):
+        """Insert new node with given value at the tail of the linked list."""
+        free = self._free
+
+        if free:
+            new_node = free.pop()
+            new_node._value = value
+        else:
+            new_node = self._make_node(value)
+
+            if free is not None:
+                self._pool.allocations += 1
+
+        if self._track_extrema:
+            self._see_value(value, at_tail=True)
+
+        if self._tail:
+            self._tail._next_node = new_node
+        else:
+            self._head = new_node
+
+        self._tail = new_node
+        self._length += 1
+
+    # space: O(k) for the k new nodes
+    # time: O(k) because the chain is linked onto the tail in one pass
+    def extend(self, iterable):
+        """Append every value of the iterable, in order, at the tail."""
+        # extending a list with itself would never reach the end
+        if iterable is self:
+            iterable = list(iterable)
+
+        # the aggregate needs each value, so go through append
+        if self._track_extrema:
+            for value in iterable:
+                self.append(value)
+            return
+
+        tail = self._tail
+        count = 0
+        free = self._free
+
+        for value in iterable:
+            if free:
+                new_node = free.pop()
+                new_node._value = value
+            else:
+                new_node = self._make_node(value)
+
+                if free is not None:
+                    self._pool.allocations += 1
+
+            if tail:
+                tail._next_node = new_node
+            else:
+                self._head = new_node
+
+            tail = new_node
+            count += 1
+
+        self._tail = tail
+        self._length += count
+
+    # space and time: O(1)
+    def _new_node(self, value):
+        """Return a node holding value, off the pool's free-list if it has one."""
+        free = self._free
+
+        if free:
+            node = free.pop()
+            node._value = value
+            return node
+
+        if free is not None:
+            self._pool.allocations += 1
+
+        return self._make_node(value)
+
+    # space and time: O(1)
+    def _release(self, node):
+        """Return the value of a removed node, pooling the node if pooled."""
+        value = node._value
+
+        if self._pool is not None:
+            self._pool.release(node)
+
+        return value
+
+    # space: O(1) because it only tracks the removed node
+    # time: O(1) because only the head changes
+    def pop_front(self):
+        """
+        Remove the first node and return its value.
+
+        Raises IndexError if the list is empty.
+        """
+        if not self._head:
+            raise IndexError
+
+        removed = self._head
+        self._head = removed._next_node
+        removed._next_node = None
+
+        if not self._head:
+            self._tail = None
+
+        self._length -= 1
+        self._finger_index -= 1
+
+        if removed is self._finger_node:
+            self._finger_node = None
+
+        if self._track_extrema:
+            self._drop_value(removed._value)
+
+        value = removed._value
+
+        if self._pool is not None:
+            self._pool.release(removed)
+
+        return value
+
+    # space: O(1) because it only tracks previous and current
+    # time: O(n) because a singly linked node can't reach its predecessor,
+    # so it still walks to the node before the tail
+    def pop_back(self):
+        """
+        Remove the last node and return its value.
+
+        Raises IndexError if the list is empty.
+        """
+        if not self._head:
+            raise IndexError
+
+        removed = self._tail
+
+        if self._head is removed:
+            self._head = self._tail = None
+        else:
+            previous = self._head
+
+            while previous._next_node is not removed:
+                previous = previous._next_node
+
+            previous._next_node = None
+            self._tail = previous
+
+        self._length -= 1
+
+        if removed is self._finger_node:
+            self._finger_node = None
+
+        if self._track_extrema:
+            self._drop_value(removed._value)
+
+        value = removed._value
+
+        if self._pool is not None:
+            self._pool.release(removed)
+
+        return value
+
+    # space and time: O(1)
+    def _see_value(self, value, at_head=False, at_tail=False):
+        """
+        Fold a value about to be linked into the tracked min and max.
+
+        Called before linking, so at_head/at_tail can compare the value
+        against the current ends to tell if the list stays ascending.
+        """
+        if self._ascending and self._head:
+            if at_head and value > self._head._value:
+                self._ascending = False
+            elif at_tail and value < self._tail._value:
+                self._ascending = False
+
+        if self._extrema_stale:
+            return
+
+        if self._max is None:
+            self._min = self._max = value
+        elif value < self._min:
+            self._min = value
+        elif value > self._max:
+            self._max = value
+
+    # space and time: O(1)
+    def _drop_value(self, value):
+        """Invalidate the tracked min/max if value was one of them."""
+        if not self._length:
+            self._min = self._max = None
+            self._extrema_stale = False
+            self._ascending = True
+        elif value == self._min or value == self._max:
+            self._extrema_stale = True
+
+    # space: O(1)
+    # time: O(n), but only after the old min or max was removed
+    def _refresh_extrema(self):
+        current = self._head
+        self._min = self._max = current._value
+
+        while current:
+            if current._value < self._min:
+                self._min = current._value
+            elif current._value > self._max:
+                self._max = current._value
+            current = current._next_node
+
+        self._extrema_stale = False
 
     # space: O(1) because it only needs vars to track current and return value
     # time: O(n) because in the worst case, it has to iterate through the
@@ -58,28 +358,35 @@ class LinkedList:
 
         # iterate through nodes
         while current:
-            if current.value == value:
+            if current._value == value:
                 return True
-            current = current.next_node
+            current = current._next_node
 
         return False
 
     # space: O(1) because memory needed doesn't depend on input size
     # time: O(n) because it has to iterate through the entire list to find
-    # the max value
+    # the max value; O(1) with track_extrema unless the max was deleted
     def find_max(self):
         """Return the max value in the list; returns None if list is empty."""
         # if list is empty
         if not self._head:
             return None
 
+        if self._track_extrema:
+            if self._ascending:
+                return self._tail._value
+            if self._extrema_stale:
+                self._refresh_extrema()
+            return self._max
+
         current = self._head
         max_so_far = float('-Inf')
 
         while current:
-            if current.value > max_so_far:
-                max_so_far = current.value
-            current = current.next_node
+            if current._value > max_so_far:
+                max_so_far = current._value
+            current = current._next_node
 
         return max_so_far
 
@@ -89,48 +396,111 @@ class LinkedList:
         if not self._head:
             return None
 
+        if self._track_extrema:
+            if self._ascending:
+                return self._head._value
+            if self._extrema_stale:
+                self._refresh_extrema()
+            return self._min
+
         current = self._head
         min_so_far = float('Inf')
 
         while current:
-            if current.value < min_so_far:
-                min_so_far = current.value
-            current = current.next_node
+            if current._value < min_so_far:
+                min_so_far = current._value
+            current = current._next_node
 
         return min_so_far
 
-    # space: O(1) because it only needs variables to track current and length
-    # time: O(n) because it has to iterate through the entire list to find
-    # the length
+    # space: O(1) because the length is a single counter
+    # time: O(1) because every mutation keeps the counter up to date
     def length(self):
-        len_list = 0
-        current = self._head
+        return self._length
 
-        while current:
-            len_list += 1
-            current = current.next_node
+    # space: O(1)
+    # time: O(k) where k is the distance from the finger, or from the head
+    # when the index is before the finger; O(1) for the last node
+    def _node_at(self, index):
+        """
+        Return the node at index and leave the finger on it.
+
+        Raises IndexError if index is not in list range.
+        """
+        if not 0 <= index < self._length:
+            raise IndexError
+
+        if index == self._length - 1:
+            current = self._tail
+        else:
+            current = self._finger_node
+            counter = self._finger_index
+
+            if current is None or counter > index:
+                current = self._head
+                counter = 0
 
-        return len_list
+            while counter < index:
+                current = current._next_node
+                counter += 1
+
+        self._finger_node = current
+        self._finger_index = index
+        return current
 
     # space: O(1) because it only needs vars to track current and counter
-    # time: O(n) where n is the index of the node you want to get
+    # time: O(n) where n is the index of the node you want to get, but the
+    # walk resumes from the last position read, so reading indexes in
+    # increasing order costs O(1) each
     def find_nth_from_beginning(self, n):
         """
         Return value of nth node in the list.
 
         Raises error if n is not in list range.
         """
-        current = self._head
-        counter = 0
+        return self._node_at(n)._value
 
-        while current:
-            if counter == n:
-                return current.value
+    # space: O(1)
+    # time: O(k) where k is the distance from the finger or the head
+    def insert_at(self, index, value):
+        """
+        Insert new node with given value so that it ends up at index.
+
+        index may be anything from 0 to the length; raises IndexError
+        otherwise.
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError
+
+        if index == 0:
+            self.insert(value)
+            return
+
+        if index == self._length:
+            self.append(value)
+            return
+
+        # the finger stays on previous, ahead of the new node
+        previous = self._node_at(index - 1)
+        next_node = previous._next_node
 
-            counter += 1
-            current = current.next_node
+        if self._track_extrema:
+            if not previous._value <= value <= next_node._value:
+                self._ascending = False
+            self._see_value(value)
 
-        raise IndexError
+        new_node = self._new_node(value)
+        new_node._next_node = next_node
+        previous._next_node = new_node
+        self._length += 1
+
+    def cursor(self, index=0):
+        """
+        Return a Cursor on the node at index.
+
+        Raises IndexError if index is not in list range.
+        """
+        return Cursor(self, self._node_at(index), index)
 
     # space: O(1) because memory required is independent of input size
     # time: O(n) because in the worst case, you have to insert the node at
@@ -141,47 +511,111 @@ class LinkedList:
 
         Assumes the list is already sorted.
         """
-        new_node = Node(value)
+        new_node = self._new_node(value)
+        self._finger_node = None
+
+        if self._track_extrema:
+            self._see_value(value)
 
         # if new node will be first item in list
-        if not self._head or value <= self._head.value:
+        if not self._head or value <= self._head._value:
             # check list isn't empty
             if self._head:
-                new_node.next_node = self._head
+                new_node._next_node = self._head
+            else:
+                self._tail = new_node
 
             self._head = new_node
+            self._length += 1
             return
 
         previous = self._head
-        current = previous.next_node
+        current = previous._next_node
 
         while current:
-            if value <= current.value:
-                new_node.next_node = current
-                previous.next_node = new_node
+            if value <= current._value:
+                new_node._next_node = current
+                previous._next_node = new_node
+                self._length += 1
                 return
 
             previous = current
-            current = current.next_node
+            current = current._next_node
 
         # if value is max item in list
-        previous.next_node = new_node
-
-    # space: O(1) because you only need a var to track current node
-    # time: O(n) because you have to iterate through all the nodes in the list
-    def visit(self):
+        previous._next_node = new_node
+        self._tail = new_node
+        self._length += 1
+
+    # space: O(k) for the sorted copy of the batch and its nodes
+    # time: O(k log k + n) because after sorting the batch, a single sweep
+    # merges it into the list instead of k separate scans from the head
+    def insert_many_ascending(self, values):
         """
-        Print all values in the linked list.
+        Insert every value in ascending order.
 
-        Prints empty string if list is empty.
+        Assumes the list is already sorted. The batch is sorted stably and
+        merged in, each value going before any equal values already in the
+        list, so equal values from the batch keep their order among
+        themselves. Repeated insert_ascending calls would put each later
+        equal value first instead.
         """
+        batch = sorted(values)
+        self._finger_node = None
+
+        if self._track_extrema:
+            for value in batch:
+                self._see_value(value)
+
+        previous = None
         current = self._head
 
-        while current:
-            print(current.value, end=' ')
-            current = current.next_node
+        for value in batch:
+            while current and current._value < value:
+                previous = current
+                current = current._next_node
+
+            new_node = self._new_node(value)
+            new_node._next_node = current
+
+            if previous:
+                previous._next_node = new_node
+            else:
+                self._head = new_node
+
+            if not current:
+                self._tail = new_node
+
+            previous = new_node
+
+        self._length += len(batch)
+
+    # space: O(c) for one chunk of c value strings
+    # time: O(n) because you have to iterate through all the nodes in the
+    # list, but there's one write per chunk instead of one print per node
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
 
-        print('')
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
+
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
+
+        file.write('\n')
 
     # space: O(1) because memory needed is independent of input
     # time: O(n) because in the worst case, the value isn't in the list and
@@ -197,42 +631,285 @@ class LinkedList:
             return None
 
         # if head is the value to delete
-        if self._head.value == value:
+        if self._head._value == value:
             deleted = self._head
-            self._head = deleted.next_node
+            self._head = deleted._next_node
+            self._finger_node = None
+
+            if not self._head:
+                self._tail = None
+
+            self._length -= 1
+
+            if self._track_extrema:
+                self._drop_value(deleted._value)
+
             return deleted
 
         previous = self._head
-        current = previous.next_node
+        current = previous._next_node
 
         while current:
-            if value == current.value:
-                previous.next_node = current.next_node
+            if value == current._value:
+                previous._next_node = current._next_node
+                self._finger_node = None
+
+                if current is self._tail:
+                    self._tail = previous
+
+                self._length -= 1
+
+                if self._track_extrema:
+                    self._drop_value(current._value)
+
                 return current
 
             previous = current
-            current = current.next_node
+            current = current._next_node
 
         return None
 
+    # space: O(1)
+    # time: O(n), a single pass however many nodes match
+    def _delete_matching(self, match, done=None):
+        """
+        Unlink every node whose value match accepts; return how many.
+
+        done, if given, is called after each removal and ends the pass
+        early once it returns True.
+        """
+        removed = 0
+        previous = None
+        current = self._head
+
+        while current:
+            next_node = current._next_node
+
+            if not match(current._value):
+                previous = current
+                current = next_node
+                continue
+
+            if previous:
+                previous._next_node = next_node
+            else:
+                self._head = next_node
+
+            if current is self._tail:
+                self._tail = previous
+
+            self._length -= 1
+            removed += 1
+
+            if self._track_extrema:
+                self._drop_value(current._value)
+
+            current._next_node = None
+            self._release(current)
+
+            if done is not None and done():
+                break
+
+            current = next_node
+
+        if removed:
+            self._finger_node = None
+
+        return removed
+
+    # space: O(1)
+    # time: O(n)
+    def delete_where(self, predicate):
+        """
+        Delete every node whose value predicate returns true for.
+
+        Returns the number of nodes deleted.
+        """
+        return self._delete_matching(predicate)
+
+    # space: O(k) for the set of k values
+    # time: O(n + k)
+    def delete_all(self, values):
+        """
+        Delete every node holding any of the values, in one pass.
+
+        The values must be hashable. Returns the number of nodes deleted.
+        """
+        targets = set(values)
+
+        if not targets:
+            return 0
+
+        def match(value):
+            try:
+                return value in targets
+            except TypeError:  # an unhashable value can't be a target
+                return False
+
+        return self._delete_matching(match)
+
+    # space: O(k) for the k values' remaining counts
+    # time: O(n + k), and the pass stops once every count is used up
+    def delete_many(self, values, count=1):
+        """
+        Delete the first count nodes holding each of the values, in one pass.
+
+        With the default count of 1 this does what calling delete for each
+        distinct value would, without a scan from the head per value;
+        count=None deletes every match, like delete_all. The values must
+        be hashable. Returns the number of nodes deleted.
+        """
+        if count is None:
+            return self.delete_all(values)
+
+        if count < 0:
+            raise ValueError('count must not be negative')
+
+        pending = dict.fromkeys(values, count) if count else {}
+
+        if not pending:
+            return 0
+
+        def match(value):
+            try:
+                left = pending.get(value)
+            except TypeError:
+                return False
+
+            if left is None:
+                return False
+
+            if left == 1:
+                del pending[value]
+            else:
+                pending[value] = left - 1
+
+            return True
+
+        return self._delete_matching(match, lambda: not pending)
+
+    # space: O(r) for the list of natural runs (at most n / 2 of them),
+    # plus O(n) for the keys when key is given; no nodes are allocated
+    # time: O(n log r), so O(n) when the list is already sorted
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place by relinking its nodes.
+
+        Stable bottom-up natural merge sort; key and reverse work as they
+        do for list.sort.
+        """
+        if self._length < 2:
+            return
+
+        self._finger_node = None
+
+        if key is None:
+            sort_key = attrgetter('_value')
+        else:
+            keys = {}
+            current = self._head
+
+            while current:
+                keys[current] = key(current._value)
+                current = current._next_node
+
+            sort_key = keys.__getitem__
+
+        # before(a, b) is True when a must come strictly before b
+        before = gt if reverse else lt
+
+        if self._track_extrema:
+            self._ascending = key is None and not reverse
+
+        # cut the chain into runs, flipping strictly descending ones (which
+        # can't hold equal keys, so flipping them keeps the sort stable)
+        runs = []
+        current = self._head
+
+        while current:
+            run_head = run_tail = current
+            current = current._next_node
+
+            if current and before(sort_key(current), sort_key(run_head)):
+                while current and before(sort_key(current), sort_key(run_head)):
+                    next_node = current._next_node
+                    current._next_node = run_head
+                    run_head = current
+                    current = next_node
+            else:
+                while current and not before(sort_key(current), sort_key(run_tail)):
+                    run_tail = current
+                    current = current._next_node
+
+            run_tail._next_node = None
+            runs.append((run_head, run_tail))
+
+        # merge neighbouring runs pairwise until one is left
+        while len(runs) > 1:
+            merged = [self._merge_runs(runs[i], runs[i + 1], sort_key, before)
+                      for i in range(0, len(runs) - 1, 2)]
+
+            if len(runs) % 2:
+                merged.append(runs[-1])
+
+            runs = merged
+
+        self._head, self._tail = runs[0]
+
+    @staticmethod
+    def _merge_runs(left, right, sort_key, before):
+        """Merge two sorted runs; ties go to left. Returns (head, tail)."""
+        left_node, left_tail = left
+        right_node, right_tail = right
+
+        if before(sort_key(right_node), sort_key(left_node)):
+            head = right_node
+            right_node = right_node._next_node
+        else:
+            head = left_node
+            left_node = left_node._next_node
+
+        tail = head
+
+        while left_node and right_node:
+            if before(sort_key(right_node), sort_key(left_node)):
+                tail._next_node = right_node
+                tail = right_node
+                right_node = right_node._next_node
+            else:
+                tail._next_node = left_node
+                tail = left_node
+                left_node = left_node._next_node
+
+        if left_node:
+            tail._next_node = left_node
+            return head, left_tail
+
+        tail._next_node = right_node
+        return head, right_tail
+
     # space: O(1) because you only need to track previous, current, and next
     # time: O(n) because you need to iterate through the entire list to reverse it
     def reverse(self):
         """Reverse the linked list iteratively."""
         # if list is empty or len 1
-        if not self._head or not self._head.next_node:
+        if not self._head or not self._head._next_node:
             return
 
+        self._ascending = False
+        self._finger_index = self._length - 1 - self._finger_index
+
         previous = None
         current = self._head
 
         while current:
-            next_node = current.next_node
-            current.next_node = previous
+            next_node = current._next_node
+            current._next_node = previous
 
             previous = current
             current = next_node
 
+        self._tail = self._head
         self._head = previous
 
     def find_middle_value(self):
@@ -251,14 +928,13 @@ class LinkedList:
 
         # if even get lower indexed element
         if len_list % 2 == 0:
-            return self.find_nth_from_beginning((len_list / 2) - 1)
+            return self.find_nth_from_beginning((len_list // 2) - 1)
         else:  # return middle element
             return self.find_nth_from_beginning(len_list // 2)
 
     # space: O(1) because memory is independent of input
-    # time: O(2k), where k is the length of the linked list,
-    # (which simplifies to O(k) because you need to iterate once to
-    # calculate the length, and once more to retrieve the desired value)
+    # time: O(k), where k is the length of the linked list, because the
+    # length is tracked and only the walk to the desired value is needed
     def find_nth_from_end(self, n):
         """
         Return value of nth node from end of list.
@@ -272,22 +948,113 @@ class LinkedList:
 
         return self.find_nth_from_beginning((len_list - 1) - n)
 
-    # space: O(n) because worst case you'll add every element in the
-    # list to the set visited
-    # time: O(n) because worst case there is no cycle and you have to
-    # iterate through the entire list to confirm
+    # space: O(1), Brent's algorithm only keeps two pointers and counters
+    # time: O(mu + lam) where mu is the tail length and lam the cycle length
+    def _detect_cycle(self):
+        """
+        Return (tail length, cycle length, entry node) or None if acyclic.
+
+        Uses Brent's algorithm: the hare runs ahead while the tortoise
+        teleports to it at every power of two, which gives the cycle
+        length directly. A second pass from the head then finds the entry.
+        """
+        if not self._head:
+            return None
+
+        power = cycle_len = 1
+        tortoise = self._head
+        hare = self._head._next_node
+
+        while hare is not tortoise:
+            if hare is None:
+                return None
+
+            if power == cycle_len:
+                tortoise = hare
+                power *= 2
+                cycle_len = 0
+
+            hare = hare._next_node
+            cycle_len += 1
+
+        # start the hare a full cycle ahead; they meet at the entry
+        tortoise = hare = self._head
+
+        for _ in range(cycle_len):
+            hare = hare._next_node
+
+        tail_len = 0
+
+        while tortoise is not hare:
+            tortoise = tortoise._next_node
+            hare = hare._next_node
+            tail_len += 1
+
+        return tail_len, cycle_len, tortoise
+
+    # space: O(1)
+    # time: O(n)
     def has_cycle(self):
+        return self._detect_cycle() is not None
+
+    def cycle_entry(self):
+        """Return the first node reached twice, or None if no cycle."""
+        cycle = self._detect_cycle()
+        return cycle[2] if cycle else None
+
+    def cycle_length(self):
+        """Return the number of nodes in the cycle; 0 if there's none."""
+        cycle = self._detect_cycle()
+        return cycle[1] if cycle else 0
+
+    def tail_length(self):
+        """
+        Return the number of nodes before the cycle entry.
+
+        Without a cycle that is every node in the list.
+        """
+        cycle = self._detect_cycle()
+        return cycle[0] if cycle else self._count_nodes()
+
+    # space: O(1)
+    # time: O(n)
+    def _count_nodes(self):
+        """Count nodes by walking; only valid on an acyclic chain."""
+        count = 0
         current = self._head
-        visited = set()
 
         while current:
-            if current in visited:
-                return True
+            count += 1
+            current = current._next_node
 
-            visited.add(current)
-            current = current.next_node
+        return count
 
-        return False
+    # space: O(1)
+    # time: O(n)
+    def break_cycle(self):
+        """
+        Cut the link that closes the cycle, leaving a plain list.
+
+        Returns True if a cycle was broken; else False.
+        """
+        cycle = self._detect_cycle()
+
+        if not cycle:
+            return False
+
+        _, cycle_len, entry = cycle
+        last = entry
+
+        for _ in range(cycle_len - 1):
+            last = last._next_node
+
+        last._next_node = None
+        self._finger_node = None
+        self._extrema_stale = True
+        self._ascending = False
+        self._tail = last
+        self._length = self._count_nodes()
+        return True
 
     def create_cycle(self):
         """Create a cycle for testing purposes."""
@@ -295,19 +1062,76 @@ class LinkedList:
         if not self._head:
             return
 
-        current = self._head
+        # cycle back to head
+        self._tail._next_node = self._head
 
-        while current.next_node:
-            current = current.next_node
 
-        # cycle back to head
-        current.next_node = self._head
+class Cursor:
+    """
+    Position in a LinkedList that moves a node at a time.
+
+    The cursor keeps the list's finger on its node, so moving forward and
+    inserting after it are O(1) per step. Like an iterator, a cursor is
+    only valid until the list is changed other than through the cursor.
+    """
+
+    __slots__ = ('_list', '_node', '_index')
+
+    def __init__(self, lst, node, index):
+        self._list = lst
+        self._node = node
+        self._index = index
 
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def value(self):
+        return self._node._value
 
-empty_list = LinkedList()
-empty_list.visit()
+    def _hand_finger(self):
+        """Put the list's finger back on the cursor's node."""
+        self._list._finger_node = self._node
+        self._list._finger_index = self._index
 
-medium_list = empty_list
-medium_list.insert(2)
-medium_list.insert(4)
-medium_list.visit()
+    # space: O(1)
+    # time: O(steps) forward; backward walks from the head
+    def advance(self, steps=1):
+        """
+        Move the cursor steps nodes toward the tail (back if negative).
+
+        Raises IndexError, leaving the cursor where it was, if that would
+        move it off the list.
+        """
+        self._hand_finger()
+        self._node = self._list._node_at(self._index + steps)
+        self._index += steps
+
+    def retreat(self, steps=1):
+        """Move the cursor steps nodes toward the head."""
+        self.advance(-steps)
+
+    # space and time: O(1)
+    def insert_after(self, value):
+        """Insert value right after the cursor; the cursor doesn't move."""
+        self._hand_finger()
+        self._list.insert_at(self._index + 1, value)
+
+    # space: O(1)
+    # time: O(n) because the predecessor is found by walking from the head
+    def insert_before(self, value):
+        """Insert value right before the cursor; the cursor stays on its node."""
+        self._hand_finger()
+        self._list.insert_at(self._index, value)
+        self._index += 1
+
+
+if __name__ == '__main__':
+    empty_list = LinkedList()
+    empty_list.visit()
+
+    medium_list = empty_list
+    medium_list.insert(2)
+    medium_list.insert(4)
+    medium_list.visit()
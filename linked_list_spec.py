@@ -1,3 +1,5 @@
+import io
+import pickle
 import unittest
 import linked_list
 import doubly_linked_list as dll
@@ -24,27 +26,104 @@ class TestNodeClass(unittest.TestCase):
         self.assertEqual(next_node, new_node, 'incorrect next node')
         self.assertEqual(next_node.value, new_val, 'node val must be ' + str(new_val))
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.node, '__dict__'), 'node must be slotted')
 
-class TestLinkedListClass(unittest.TestCase):
-    """Test singly linked list."""
 
-    def setUp(self):
-        self.empty_list = linked_list.LinkedList()
+class ListBehavior:
+    """
+    Behaviour tests shared by every list class with insert.
 
-        self.small_list = linked_list.LinkedList()
-        self.small_list.insert(2)  # list of [2]
+    Each fixture is built by inserting its values one at a time. Test
+    classes set make_list and order, which returns the values in the order
+    the list then holds them, so the same tests cover lists that prepend
+    and lists that keep themselves sorted.
+    """
 
-        self.medium_list = linked_list.LinkedList()
-        self.medium_list.insert(0)
-        self.medium_list.insert(-2)
-        self.medium_list.insert(10)  # list of [10, -2, 0]
+    fixtures = {
+        'empty_list': [],
+        'small_list': [2],
+        'medium_list': [0, -2, 10],  # LinkedList of [10, -2, 0]
+        'large_list': [20, 5, -3, 4, -3],  # LinkedList of [-3, 4, -3, 5, 20]
+    }
+
+    def setUp(self):
+        self.contents = {}
+
+        for name, values in self.fixtures.items():
+            lst = self.make_list()
+
+            for value in values:
+                lst.insert(value)
+
+            setattr(self, name, lst)
+            self.contents[name] = self.order(values)
+
+    def each_list(self):
+        for name in self.fixtures:
+            yield getattr(self, name), self.contents[name]
+
+    def test_contents(self):
+        for lst, values in self.each_list():
+            self.assertEqual(str(lst), ' -> '.join(str(value) for value in values))
+            self.assertEqual(list(lst), values)
+            self.assertEqual(list(reversed(lst)), values[::-1])
+            self.assertEqual(lst.length(), len(values))
+            self.assertEqual(len(lst), len(values))
+
+    def test_lookup(self):
+        for lst, values in self.each_list():
+            for value in [-3, -2, 0, 2, 5, 7]:
+                self.assertEqual(lst.search(value), value in values)
+                self.assertEqual(value in lst, value in values)
+
+    def test_extrema(self):
+        for lst, values in self.each_list():
+            self.assertEqual(lst.find_max(), max(values, default=None))
+            self.assertEqual(lst.find_min(), min(values, default=None))
+
+    def test_positions(self):
+        for lst, values in self.each_list():
+            for i, value in enumerate(values):
+                self.assertEqual(lst.find_nth_from_beginning(i), value)
+                self.assertEqual(lst.find_nth_from_end(i), values[-1 - i])
+
+            with self.assertRaises(IndexError):
+                lst.find_nth_from_beginning(len(values))
+            with self.assertRaises(IndexError):
+                lst.find_nth_from_end(len(values))
+
+            middle = values[(len(values) - 1) // 2] if values else None
+            self.assertEqual(lst.find_middle_value(), middle)
+
+    def test_visit_in_chunks(self):
+        for lst, values in self.each_list():
+            expected = ''.join(str(value) + ' ' for value in values) + '\n'
+
+            for chunk_size in [1, 2, 4096]:
+                out = io.StringIO()
+                lst.visit(out, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), expected)
+
+    def test_delete_each(self):
+        for lst, values in self.each_list():
+            self.assertIsNone(lst.delete(99))
+
+            for value in list(values):
+                self.assertEqual(lst.delete(value).value, value)
+                values.remove(value)
+                self.assertEqual(list(lst), values)
+                self.assertEqual(lst.length(), len(values))
+                self.assertEqual(lst.find_max(), max(values, default=None))
+
+
+class TestLinkedListClass(ListBehavior, unittest.TestCase):
+    """Test singly linked list."""
 
-        self.large_list = linked_list.LinkedList()
-        self.large_list.insert(20)
-        self.large_list.insert(5)
-        self.large_list.insert(-3)
-        self.large_list.insert(4)
-        self.large_list.insert(-3)  # list of [-3, 4, -3, 5, 20]
+    make_list = linked_list.LinkedList
+
+    def order(self, values):
+        return values[::-1]
 
     def test_insert(self):
         self.assertEqual(str(self.empty_list), '')
@@ -122,6 +201,25 @@ class TestLinkedListClass(unittest.TestCase):
         self.assertEqual(self.large_list.length(), prev_len - 1)
         self.assertNotEqual(self.large_list.find_nth_from_beginning(0), -3)
 
+    def test_batch_delete(self):
+        lst = self.large_list
+        self.assertEqual(lst.delete_all([-3, 20, 99]), 3)
+        self.assertEqual(str(lst), '4 -> 5')
+        lst.append(6)
+        self.assertEqual(lst.find_nth_from_end(0), 6)
+
+        lst = linked_list.LinkedList.from_iterable([1, 2, 1, 3, 1, 2])
+        self.assertEqual(lst.delete_many([1, 2]), 2)
+        self.assertEqual(str(lst), '1 -> 3 -> 1 -> 2')
+        self.assertEqual(lst.delete_many([1], count=None), 2)
+        self.assertEqual(lst.delete_where(lambda value: value > 2), 1)
+        self.assertEqual(str(lst), '2')
+        self.assertEqual(lst.delete_where(bool), 1)
+        self.assertEqual(lst.length(), 0)
+        self.assertIsNone(lst._tail)
+        self.assertEqual(self.empty_list.delete_all([1]), 0)
+        self.assertRaises(ValueError, self.medium_list.delete_many, [0], -1)
+
     def test_reverse(self):
         self.empty_list.reverse()
         self.assertEqual(str(self.empty_list), '')
@@ -141,6 +239,242 @@ class TestLinkedListClass(unittest.TestCase):
         self.assertEqual(self.large_list.find_nth_from_end(3), 4)
         self.assertEqual(self.large_list.find_nth_from_end(4), -3)
 
+    def test_finger(self):
+        lst = linked_list.LinkedList.from_iterable(range(10))
+        self.assertEqual([lst.find_nth_from_beginning(i) for i in range(10)],
+                         list(range(10)))
+
+        lst.find_nth_from_beginning(6)
+        self.assertEqual(lst._finger_index, 6)
+
+        # inserting and popping at the head shift the finger
+        lst.insert(-1)
+        self.assertEqual(lst.find_nth_from_beginning(7), 6)
+        lst.pop_front()
+        lst.pop_front()
+        self.assertEqual(lst.find_nth_from_beginning(5), 6)
+
+        # removing the finger's node drops it
+        lst.find_nth_from_beginning(lst.length() - 1)
+        lst.pop_back()
+        self.assertIsNone(lst._finger_node)
+        self.assertEqual(lst.find_nth_from_beginning(7), 8)
+
+        lst.reverse()
+        self.assertEqual(lst.find_nth_from_beginning(7), 1)
+
+        with self.assertRaises(IndexError):
+            lst.find_nth_from_beginning(-1)
+
+    def test_insert_at(self):
+        lst = self.medium_list
+        lst.insert_at(1, 3)
+        lst.insert_at(0, 1)
+        lst.insert_at(5, 9)
+        self.assertEqual(str(lst), '1 -> 10 -> 3 -> -2 -> 0 -> 9')
+        self.assertEqual(lst.length(), 6)
+
+        with self.assertRaises(IndexError):
+            lst.insert_at(7, 0)
+
+        lst = linked_list.LinkedList(track_extrema=True)
+        lst.insert_many_ascending([1, 2, 4])
+        lst.insert_at(2, 3)
+        self.assertTrue(lst._ascending)
+        lst.insert_at(1, 5)
+        self.assertEqual(lst.find_max(), 5)
+        self.assertEqual(lst.find_min(), 1)
+
+    def test_cursor(self):
+        lst = linked_list.LinkedList.from_iterable(range(5))
+        cursor = lst.cursor(1)
+        self.assertEqual(cursor.value, 1)
+
+        cursor.advance(2)
+        self.assertEqual((cursor.index, cursor.value), (3, 3))
+
+        cursor.insert_after('a')
+        cursor.insert_before('b')
+        self.assertEqual(str(lst), '0 -> 1 -> 2 -> b -> 3 -> a -> 4')
+        self.assertEqual((cursor.index, cursor.value), (4, 3))
+
+        cursor.retreat(4)
+        self.assertEqual(cursor.value, 0)
+
+        with self.assertRaises(IndexError):
+            cursor.retreat()
+        self.assertEqual(cursor.index, 0)
+
+        with self.assertRaises(IndexError):
+            self.empty_list.cursor()
+
+    def test_append(self):
+        lst = self.empty_list
+        lst.append(1)
+        lst.append(2)
+        lst.insert(0)
+        self.assertEqual(str(lst), '0 -> 1 -> 2')
+        self.assertEqual(lst.length(), 3)
+        self.assertEqual(lst.find_nth_from_end(0), 2)
+
+    def test_pop_front(self):
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_front()
+
+        self.assertEqual(self.medium_list.pop_front(), 10)
+        self.assertEqual(str(self.medium_list), '-2 -> 0')
+        self.assertEqual(self.medium_list.length(), 2)
+
+        self.assertEqual(self.small_list.pop_front(), 2)
+        self.small_list.append(3)
+        self.assertEqual(str(self.small_list), '3')
+
+    def test_pop_back(self):
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+
+        self.assertEqual(self.medium_list.pop_back(), 0)
+        self.medium_list.append(7)
+        self.assertEqual(str(self.medium_list), '10 -> -2 -> 7')
+
+        self.assertEqual(self.small_list.pop_back(), 2)
+        self.assertEqual(self.small_list.length(), 0)
+
+    def test_from_iterable(self):
+        lst = linked_list.LinkedList.from_iterable([3, 1, 2])
+        self.assertEqual(str(lst), '3 -> 1 -> 2')
+        self.assertEqual(lst.length(), 3)
+        self.assertEqual(lst.find_nth_from_end(0), 2)
+
+        self.assertEqual(str(linked_list.LinkedList.from_iterable([])), '')
+
+    def test_extend(self):
+        self.medium_list.extend(iter([7, 8]))
+        self.assertEqual(str(self.medium_list), '10 -> -2 -> 0 -> 7 -> 8')
+        self.assertEqual(self.medium_list.length(), 5)
+
+        self.empty_list.extend([1])
+        self.empty_list.append(2)
+        self.assertEqual(str(self.empty_list), '1 -> 2')
+
+    def test_insert_many_ascending(self):
+        lst = linked_list.LinkedList.from_iterable([1, 4, 4, 9])
+        lst.insert_many_ascending([10, 0, 4, 5, -1])
+        self.assertEqual(str(lst), '-1 -> 0 -> 1 -> 4 -> 4 -> 4 -> 5 -> 9 -> 10')
+        self.assertEqual(lst.length(), 9)
+        self.assertEqual(lst.pop_back(), 10)
+
+        self.empty_list.insert_many_ascending([2, 1])
+        self.assertEqual(str(self.empty_list), '1 -> 2')
+
+        # equal batch values keep their order, ahead of the existing one
+        lst = linked_list.LinkedList.from_iterable([1.0, 3])
+        lst.insert_many_ascending([True, 1])
+        self.assertEqual([type(value) for value in lst], [bool, int, float, int])
+
+    def test_sort(self):
+        self.empty_list.sort()
+        self.assertEqual(str(self.empty_list), '')
+
+        self.large_list.sort()
+        self.assertEqual(str(self.large_list), '-3 -> -3 -> 4 -> 5 -> 20')
+        self.large_list.append(21)
+        self.assertEqual(self.large_list.find_nth_from_end(1), 20)
+
+        self.medium_list.sort(reverse=True)
+        self.assertEqual(str(self.medium_list), '10 -> 0 -> -2')
+
+    def test_sort_key_is_stable(self):
+        lst = linked_list.LinkedList.from_iterable(['bb', 'a', 'cc', 'd', 'eee'])
+        first = lst._head
+        lst.sort(key=len)
+        self.assertEqual(str(lst), 'a -> d -> bb -> cc -> eee')
+
+        lst.sort(key=len, reverse=True)
+        self.assertEqual(str(lst), 'eee -> bb -> cc -> a -> d')
+        self.assertIs(lst._head._next_node, first, 'sort must relink nodes')
+
+    def test_iteration_protocol(self):
+        self.assertEqual(list(self.large_list), [-3, 4, -3, 5, 20])
+        self.assertEqual(list(reversed(self.large_list)), [20, 5, -3, 4, -3])
+        self.assertEqual(list(self.empty_list), [])
+        self.assertEqual(len(self.medium_list), 3)
+        self.assertIn(-2, self.medium_list)
+        self.assertNotIn(3, self.medium_list)
+
+        self.small_list.extend(self.small_list)
+        self.assertEqual(str(self.small_list), '2 -> 2')
+
+    def test_pickle(self):
+        lst = linked_list.LinkedList.from_iterable(range(5000), track_extrema=True)
+        copied = pickle.loads(pickle.dumps(lst))
+        self.assertEqual(list(copied), list(range(5000)))
+        self.assertEqual(copied.find_nth_from_end(0), 4999)
+        self.assertEqual(copied.find_max(), 4999)
+
+        copied = pickle.loads(pickle.dumps(self.empty_list))
+        self.assertEqual(copied.length(), 0)
+
+    def test_visit(self):
+        out = io.StringIO()
+        self.large_list.visit(out, chunk_size=2)
+        self.assertEqual(out.getvalue(), '-3 4 -3 5 20 \n')
+
+        out = io.StringIO()
+        self.empty_list.visit(out)
+        self.assertEqual(out.getvalue(), '\n')
+
+    def test_tracked_extrema(self):
+        lst = linked_list.LinkedList(track_extrema=True)
+        self.assertIsNone(lst.find_max())
+
+        for value in [4, -3, 5, 20, -3]:
+            lst.insert(value)
+        self.assertEqual((lst.find_min(), lst.find_max()), (-3, 20))
+
+        lst.delete(20)  # max removed, recomputed on the next call
+        self.assertTrue(lst._extrema_stale)
+        self.assertEqual(lst.find_max(), 5)
+        self.assertFalse(lst._extrema_stale)
+
+        lst.delete(-3)  # another -3 is still there
+        self.assertEqual(lst.find_min(), -3)
+
+        while lst.length():
+            lst.pop_back()
+        lst.append(7)
+        self.assertEqual((lst.find_min(), lst.find_max()), (7, 7))
+
+    def test_tracked_extrema_when_ascending(self):
+        lst = linked_list.LinkedList(track_extrema=True)
+        lst.insert_many_ascending([3, 1, 2])
+        lst.insert_ascending(0)
+        self.assertTrue(lst._ascending)
+        self.assertEqual((lst.find_min(), lst.find_max()), (0, 3))
+
+        lst.delete(3)
+        self.assertEqual(lst.find_max(), 2)
+
+        lst.reverse()
+        self.assertFalse(lst._ascending)
+        self.assertEqual(lst.find_max(), 2)
+
+        lst.sort()
+        self.assertTrue(lst._ascending)
+
+    def test_tail_after_mutations(self):
+        lst = self.large_list
+        lst.delete(20)
+        lst.append(1)
+        self.assertEqual(lst.find_nth_from_end(0), 1)
+
+        lst.reverse()
+        lst.append(9)
+        self.assertEqual(str(lst), '1 -> 5 -> -3 -> 4 -> -3 -> 9')
+
+        lst.insert_ascending(100)
+        self.assertEqual(lst.pop_back(), 100)
+
     def test_has_cycle(self):
         self.assertFalse(self.empty_list.has_cycle())
         self.empty_list.create_cycle()
@@ -150,6 +484,28 @@ class TestLinkedListClass(unittest.TestCase):
         self.small_list.create_cycle()
         self.assertTrue(self.small_list.has_cycle())
 
+    def test_cycle_details(self):
+        lst = self.large_list
+        self.assertIsNone(lst.cycle_entry())
+        self.assertEqual(lst.cycle_length(), 0)
+        self.assertEqual(lst.tail_length(), 5)
+        self.assertFalse(lst.break_cycle())
+
+        # close the cycle on the third node: [-3, 4] -> [-3, 5, 20] -> back
+        entry = lst._head._next_node._next_node
+        lst._tail._next_node = entry
+
+        self.assertTrue(lst.has_cycle())
+        self.assertIs(lst.cycle_entry(), entry)
+        self.assertEqual(lst.cycle_length(), 3)
+        self.assertEqual(lst.tail_length(), 2)
+
+        self.assertTrue(lst.break_cycle())
+        self.assertFalse(lst.has_cycle())
+        self.assertEqual(str(lst), '-3 -> 4 -> -3 -> 5 -> 20')
+        lst.append(1)
+        self.assertEqual(lst.length(), 6)
+
 
 class TestDoubleNodeClass(unittest.TestCase):
     """
@@ -172,30 +528,20 @@ class TestDoubleNodeClass(unittest.TestCase):
         self.assertEqual(prev_node, new_node)
         self.assertEqual(prev_node.value, new_val)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.node, '__dict__'), 'node must be slotted')
+
 
-class TestDoublyLinkedListClass(unittest.TestCase):
+class TestDoublyLinkedListClass(ListBehavior, unittest.TestCase):
     """
     Test doubly linked list.
 
     Only tests features/implementations different from singly linked list.
     """
-    def setUp(self):
-        self.empty_list = dll.DoublyLinkedList()
-
-        self.small_list = dll.DoublyLinkedList()
-        self.small_list.insert(2)  # list of [2]
-
-        self.medium_list = dll.DoublyLinkedList()
-        self.medium_list.insert(0)
-        self.medium_list.insert(-2)
-        self.medium_list.insert(10)  # list of [10, -2, 0]
+    make_list = dll.DoublyLinkedList
 
-        self.large_list = dll.DoublyLinkedList()
-        self.large_list.insert(20)
-        self.large_list.insert(5)
-        self.large_list.insert(-3)
-        self.large_list.insert(4)
-        self.large_list.insert(-3)  # list of [-3, 4, -3, 5, 20]
+    def order(self, values):
+        return values[::-1]
 
     def test_insert(self):
         lst = self.empty_list
@@ -221,6 +567,139 @@ class TestDoublyLinkedListClass(unittest.TestCase):
         self.assertEqual(self.medium_list.length(), prev_len - 1)
         self.assertEqual(str(self.medium_list), '10 -> 0')
 
+        # deleting head and tail must keep both ends linked
+        self.assertEqual(self.large_list.delete(-3).value, -3)
+        self.assertEqual(self.large_list.delete(20).value, 20)
+        self.assertEqual(str(self.large_list), '4 -> -3 -> 5')
+        self.assertEqual(self.large_list.find_nth_from_end(0), 5)
+        self.assertEqual(self.large_list.length(), 3)
+
+        self.assertEqual(self.small_list.delete(2).value, 2)
+        self.assertEqual(str(self.small_list), '')
+        self.assertEqual(self.small_list.length(), 0)
+
+    def test_batch_delete(self):
+        lst = self.large_list
+        self.assertEqual(lst.delete_all([-3, 20]), 3)
+        self.assertEqual(str(lst), '4 -> 5')
+        self.assertEqual(list(reversed(lst)), [5, 4])
+        self.assertEqual(lst.find_middle_value(), 4)
+
+        lst = dll.DoublyLinkedList.from_iterable(range(10))
+        lst.find_middle_value()
+        self.assertEqual(lst.delete_where(lambda value: value % 3 == 0), 4)
+        self.assertEqual(str(lst), '1 -> 2 -> 4 -> 5 -> 7 -> 8')
+        self.assertEqual(lst.find_middle_value(), 4)
+        self.assertEqual(lst.delete_many([8, 1, 5], count=1), 3)
+        self.assertEqual(list(reversed(lst)), [7, 4, 2])
+        self.assertEqual(lst.find_middle_value(), 4)
+
+    def test_append(self):
+        lst = self.empty_list
+        lst.append(1)
+        lst.append(2)
+        lst.insert(0)
+        self.assertEqual(str(lst), '0 -> 1 -> 2')
+        self.assertEqual(lst.find_nth_from_end(2), 0)
+
+    def test_bulk_construction(self):
+        lst = dll.DoublyLinkedList.from_iterable([1, 4, 9])
+        lst.extend([10])
+        lst.insert_many_ascending([5, 0, 12])
+        self.assertEqual(str(lst), '0 -> 1 -> 4 -> 5 -> 9 -> 10 -> 12')
+        self.assertEqual(lst.find_nth_from_end(6), 0)
+        self.assertEqual(lst.find_nth_from_end(3), 5)
+        self.assertEqual(lst.pop_back(), 12)
+        self.assertEqual(lst.length(), 6)
+
+    def test_sort(self):
+        lst = self.large_list
+        lst.sort()
+        self.assertEqual(str(lst), '-3 -> -3 -> 4 -> 5 -> 20')
+        self.assertEqual(lst.find_nth_from_end(2), 4)
+
+        lst.sort(key=abs, reverse=True)
+        self.assertEqual(str(lst), '20 -> 5 -> 4 -> -3 -> -3')
+        self.assertEqual(lst.pop_back(), -3)
+        self.assertEqual(lst.find_nth_from_end(0), -3)
+
+    def test_iteration_protocol(self):
+        self.assertEqual(list(self.medium_list), [10, -2, 0])
+        self.assertEqual(list(reversed(self.medium_list)), [0, -2, 10])
+        self.assertEqual(len(self.large_list), 5)
+        self.assertIn(20, self.large_list)
+        self.assertNotIn(21, self.large_list)
+
+        out = io.StringIO()
+        self.medium_list.visit(out, chunk_size=1)
+        self.assertEqual(out.getvalue(), '10 -2 0 \n')
+
+    def test_pickle(self):
+        lst = dll.DoublyLinkedList.from_iterable(range(5000), indexed=True)
+        copied = pickle.loads(pickle.dumps(lst))
+        self.assertEqual(list(reversed(copied)), list(range(4999, -1, -1)))
+        self.assertEqual(copied.find_middle_value(), 2499)
+        self.assertEqual(len(copied._index[10]), 1)
+
+    def test_find_middle_value(self):
+        self.assertIsNone(self.empty_list.find_middle_value())
+        self.assertEqual(self.large_list.find_middle_value(), -3)
+
+        self.large_list.insert(7)  # [7, -3, 4, -3, 5, 20]
+        self.assertEqual(self.large_list.find_middle_value(), 4)
+        self.large_list.append(8)  # [7, -3, 4, -3, 5, 20, 8]
+        self.assertEqual(self.large_list.find_middle_value(), -3)
+
+        self.large_list.pop_front()
+        self.large_list.delete(5)  # [-3, 4, -3, 20, 8]
+        self.assertEqual(self.large_list.find_middle_value(), -3)
+
+        self.large_list.reverse()
+        self.large_list.pop_back()  # [8, 20, -3, 4]
+        self.assertEqual(self.large_list.find_middle_value(), 20)
+        self.large_list.reverse()  # [4, -3, 20, 8]
+        self.assertEqual(self.large_list.find_middle_value(), -3)
+
+    def test_middle_pointer_rebuilt(self):
+        lst = dll.DoublyLinkedList.from_iterable([1, 2, 3, 4], indexed=True)
+        self.assertEqual(lst.find_middle_value(), 2)
+        self.assertIs(lst._middle, lst._head._next_node)
+
+        lst.delete(4)  # indexed delete doesn't know the side
+        self.assertIsNone(lst._middle)
+        self.assertEqual(lst.find_middle_value(), 2)
+        self.assertIsNotNone(lst._middle)
+
+    def test_tracked_extrema(self):
+        lst = dll.DoublyLinkedList.from_iterable([4, -3, 5, 20], track_extrema=True)
+        self.assertEqual((lst.find_min(), lst.find_max()), (-3, 20))
+
+        lst.pop_back()
+        lst.pop_front()
+        self.assertEqual((lst.find_min(), lst.find_max()), (-3, 5))
+
+        lst.sort()
+        lst.append(1)  # no longer ascending
+        self.assertEqual(lst.find_max(), 5)
+        self.assertEqual(lst.find_min(), -3)
+
+    def test_pop_front_and_back(self):
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_front()
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+
+        lst = self.large_list
+        self.assertEqual(lst.pop_front(), -3)
+        self.assertEqual(lst.pop_back(), 20)
+        self.assertEqual(str(lst), '4 -> -3 -> 5')
+        self.assertEqual(lst.length(), 3)
+
+        lst.reverse()
+        self.assertEqual(lst.pop_back(), 4)
+        lst.append(8)
+        self.assertEqual(str(lst), '5 -> -3 -> 8')
+
     def test_reverse(self):
         self.small_list.reverse()
         self.assertEqual(str(self.small_list), '2')
@@ -228,6 +707,48 @@ class TestDoublyLinkedListClass(unittest.TestCase):
         self.medium_list.reverse()
         self.assertEqual(str(self.medium_list), '0 -> -2 -> 10')
 
+    def test_lazy_reverse(self):
+        lst = self.large_list
+        head = lst._head
+        lst.reverse()  # list of [20, 5, -3, 4, -3]
+        self.assertIs(lst._head, head)  # nothing was relinked
+
+        self.assertEqual(list(reversed(lst)), [-3, 4, -3, 5, 20])
+        self.assertEqual(lst.find_nth_from_beginning(1), 5)
+        self.assertEqual(lst.find_nth_from_end(1), 4)
+
+        lst.insert(1)
+        lst.append(2)
+        lst.insert_at(2, 3)
+        self.assertEqual(str(lst), '1 -> 20 -> 3 -> 5 -> -3 -> 4 -> -3 -> 2')
+        self.assertEqual(lst.find_middle_value(), 5)
+
+        self.assertEqual(lst.pop_front(), 1)
+        self.assertEqual(lst.pop_back(), 2)
+        self.assertEqual(lst.delete(-3).value, -3)
+        self.assertEqual(str(lst), '20 -> 3 -> 5 -> 4 -> -3')
+
+        cursor = lst.cursor(1)
+        cursor.insert_after(6)
+        cursor.advance(2)
+        self.assertEqual(cursor.value, 5)
+
+        lst.reverse()
+        self.assertEqual(str(lst), '-3 -> 4 -> 5 -> 6 -> 3 -> 20')
+
+    def test_materialize(self):
+        lst = self.large_list
+        lst.reverse()
+        lst.materialize()
+        self.assertEqual(lst._head.value, 20)
+        self.assertEqual(lst._head.next_node.value, 5)
+        self.assertEqual(str(lst), '20 -> 5 -> -3 -> 4 -> -3')
+
+        lst.reverse()
+        lst.sort(key=abs)
+        self.assertEqual(str(lst), '-3 -> -3 -> 4 -> 5 -> 20')
+        self.assertIs(lst._head.next_node.next_node, lst._node_at(2))
+
     def test_find_nth_from_end(self):
         with self.assertRaises(IndexError):
             self.empty_list.find_nth_from_end(2)
@@ -236,12 +757,183 @@ class TestDoublyLinkedListClass(unittest.TestCase):
         self.assertEqual(self.large_list.find_nth_from_end(4), -3)
         self.assertEqual(self.large_list.find_nth_from_end(1), 5)
 
+    def test_finger(self):
+        lst = dll.DoublyLinkedList.from_iterable(range(100))
+        self.assertEqual([lst.find_nth_from_beginning(i) for i in range(99, -1, -1)],
+                         list(range(99, -1, -1)))
+
+        # the walk starts from whichever end or finger is closest
+        lst.find_nth_from_beginning(40)
+        lst._head = lst._tail = None
+        self.assertEqual(lst.find_nth_from_beginning(38), 38)
+        self.assertEqual(lst.find_nth_from_end(55), 44)
+
+    def test_finger_after_mutations(self):
+        lst = dll.DoublyLinkedList.from_iterable(range(10))
+        lst.find_nth_from_beginning(4)
+
+        lst.insert(-1)
+        lst.append(10)
+        self.assertEqual(lst._finger_index, 5)
+
+        lst.pop_front()
+        lst.pop_back()
+        self.assertEqual(lst._finger_index, 4)
+        self.assertEqual(lst.find_nth_from_beginning(5), 5)
+
+        # a removal between the head and the finger drops it
+        lst.delete(2)
+        self.assertIsNone(lst._finger_node)
+        self.assertEqual(lst.find_nth_from_beginning(4), 5)
+
+        lst.reverse()
+        self.assertEqual(lst._finger_index, 4)
+        self.assertEqual(lst.find_nth_from_beginning(4), 5)
+        self.assertEqual(lst.find_nth_from_beginning(7), 1)
+
+    def test_insert_at(self):
+        lst = self.large_list
+        lst.insert_at(2, 7)
+        lst.insert_at(4, 8)
+        self.assertEqual(str(lst), '-3 -> 4 -> 7 -> -3 -> 8 -> 5 -> 20')
+        self.assertEqual(list(reversed(lst)), [20, 5, 8, -3, 7, 4, -3])
+        self.assertEqual(lst.find_middle_value(), -3)
+
+    def test_cursor(self):
+        lst = dll.DoublyLinkedList.from_iterable(range(5))
+        cursor = lst.cursor(4)
+        cursor.retreat(2)
+        self.assertEqual(cursor.value, 2)
+
+        cursor.insert_before('b')
+        cursor.insert_after('a')
+        self.assertEqual(str(lst), '0 -> 1 -> b -> 2 -> a -> 3 -> 4')
+        self.assertEqual(list(reversed(lst)), [4, 3, 'a', 2, 'b', 1, 0])
+        self.assertEqual(lst.find_middle_value(), 2)
+
+        cursor.advance(3)
+        self.assertEqual(cursor.value, 4)
+
+        with self.assertRaises(IndexError):
+            cursor.advance()
+
     def test_has_cycle(self):
         lst = self.large_list
         self.assertFalse(lst.has_cycle())
 
         lst.create_cycle()
         self.assertTrue(lst.has_cycle())
+        self.assertIs(lst.cycle_entry(), lst._head)
+        self.assertEqual(lst.cycle_length(), 5)
+        self.assertEqual(lst.tail_length(), 0)
+
+        self.assertTrue(lst.break_cycle())
+        self.assertFalse(lst.has_cycle())
+        self.assertEqual(str(lst), '-3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(lst.find_nth_from_end(4), -3)
+        self.assertIsNone(lst._head.prev_node)
+
+
+class TestIndexedDoublyLinkedList(unittest.TestCase):
+    """Test that indexed mode keeps list behavior while using the index."""
+
+    def setUp(self):
+        self.lst = dll.DoublyLinkedList(indexed=True)
+        self.lst.insert(20)
+        self.lst.insert(5)
+        self.lst.insert(-3)
+        self.lst.insert(4)
+        self.lst.insert(-3)  # list of [-3, 4, -3, 5, 20]
+
+    def assert_index_in_sync(self):
+        lst = self.lst
+        expected = {}
+        current = lst._head
+
+        while current:
+            expected.setdefault(current.value, []).append(current)
+            current = current.next_node
+
+        self.assertEqual({k: list(v) for k, v in lst._index.items()}, expected)
+
+    def test_search(self):
+        self.assertTrue(self.lst.search(-3))
+        self.assertFalse(self.lst.search(0))
+        self.assert_index_in_sync()
+
+    def test_delete_first_occurrence(self):
+        first = self.lst._head
+        self.assertIs(self.lst.delete(-3), first)
+        self.assertEqual(str(self.lst), '4 -> -3 -> 5 -> 20')
+        self.assertTrue(self.lst.search(-3))
+
+        self.assertEqual(self.lst.delete(-3).value, -3)
+        self.assertFalse(self.lst.search(-3))
+        self.assertIsNone(self.lst.delete(-3))
+        self.assertEqual(str(self.lst), '4 -> 5 -> 20')
+        self.assert_index_in_sync()
+
+    def test_delete_after_reverse(self):
+        self.lst.reverse()  # list of [20, 5, -3, 4, -3]
+        self.lst.delete(-3)
+        self.assertEqual(str(self.lst), '20 -> 5 -> 4 -> -3')
+        self.assert_index_in_sync()
+
+    def test_bulk_construction_keeps_index(self):
+        self.lst = dll.DoublyLinkedList.from_iterable([1, 3, 3], indexed=True)
+        self.lst.insert_many_ascending([3, 3, 0, 2])
+        self.assertEqual(str(self.lst), '0 -> 1 -> 2 -> 3 -> 3 -> 3 -> 3')
+        self.assert_index_in_sync()
+
+    def test_sort_keeps_index(self):
+        self.lst.sort()
+        self.assert_index_in_sync()
+        self.lst.delete(-3)
+        self.assertEqual(str(self.lst), '-3 -> 4 -> 5 -> 20')
+
+    def test_mutations_keep_index(self):
+        lst = dll.DoublyLinkedList(indexed=True)
+        for value in [4, 2, 4, 3]:
+            lst.insert_ascending(value)
+        lst.append(4)
+        lst.insert(4)
+        self.lst = lst
+        self.assert_index_in_sync()
+
+        lst.pop_front()
+        lst.pop_back()
+        lst.delete(4)
+        self.assertEqual(str(lst), '2 -> 3 -> 4')
+        self.assert_index_in_sync()
+
+    def test_insert_at_keeps_index(self):
+        self.lst.insert_at(1, 6)
+        self.lst.insert_at(3, -3)
+        self.assert_index_in_sync()
+        self.lst.delete(-3)
+        self.lst.delete(-3)
+        self.assertEqual(str(self.lst), '6 -> 4 -> -3 -> 5 -> 20')
+
+    def test_batch_delete_uses_index(self):
+        self.assertEqual(self.lst.delete_many([-3, 5]), 2)
+        self.assertEqual(str(self.lst), '4 -> -3 -> 20')
+        self.assert_index_in_sync()
+        self.assertEqual(self.lst.delete_all([-3, 20, 7]), 2)
+        self.assertEqual(str(self.lst), '4')
+        self.assert_index_in_sync()
+
+    def test_lazy_reverse_keeps_index(self):
+        self.lst.reverse()  # list of [20, 5, -3, 4, -3]
+        self.lst.insert(-3)
+        first = self.lst._tail  # the new head, at the physical tail
+        self.assertIs(self.lst.delete(-3), first)
+        self.assertEqual(self.lst.delete(-3).value, -3)
+        self.assertEqual(str(self.lst), '20 -> 5 -> 4 -> -3')
+        self.assert_index_in_sync()
+
+        self.lst.materialize()
+        self.assertEqual(str(self.lst), '20 -> 5 -> 4 -> -3')
+        self.assert_index_in_sync()
 
 
 if __name__ == '__main__':
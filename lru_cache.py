@@ -0,0 +1,161 @@
+from functools import wraps
+
+from doubly_linked_list import DoublyLinkedList
+
+
+class LRUCache:
+    """
+    Least recently used cache built on a DoublyLinkedList.
+
+    Keys are stored as node values in recency order (head is the most
+    recently used) and a dict maps each key to its node, so get, put and
+    move-to-front are O(1).
+
+    capacity bounds the total weight of the entries. Every entry weighs 1
+    unless a weigher is given, in which case weigher(key, value) is used.
+    on_evict(key, value) is called for every entry pushed out by capacity.
+    """
+
+    def __init__(self, capacity=128, weigher=None, on_evict=None):
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self._capacity = capacity
+        self._weigher = weigher
+        self._on_evict = on_evict
+
+        self._order = DoublyLinkedList()
+        self._entries = {}  # key -> [node, value, weight]
+        self._weight = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def weight(self):
+        return self._weight
+
+    # space and time: O(1)
+    def _move_to_front(self, node):
+        order = self._order
+
+        if node is order._head:
+            return
+
+        order._unlink_node(node)
+        order._link_front(node)
+
+    # space and time: O(1)
+    def get(self, key, default=None):
+        """Return the value for key and mark it most recently used."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._move_to_front(entry[0])
+        return entry[1]
+
+    # space: O(1)
+    # time: O(1) plus O(k) for the k entries evicted
+    def put(self, key, value):
+        """Insert or replace key, then evict until within capacity."""
+        weight = self._weigher(key, value) if self._weigher else 1
+
+        if weight > self._capacity:
+            raise ValueError('entry is heavier than the cache capacity')
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._order.insert(key)
+            self._entries[key] = [self._order._head, value, weight]
+        else:
+            self._weight -= entry[2]
+            entry[1] = value
+            entry[2] = weight
+            self._move_to_front(entry[0])
+
+        self._weight += weight
+
+        while self._weight > self._capacity:
+            self._evict()
+
+    # space and time: O(1)
+    def _evict(self):
+        key = self._order.pop_back()
+        _, value, weight = self._entries.pop(key)
+
+        self._weight -= weight
+        self.evictions += 1
+
+        if self._on_evict:
+            self._on_evict(key, value)
+
+    # space and time: O(1)
+    def pop(self, key, default=None):
+        """Remove key and return its value, without counting an eviction."""
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return default
+
+        self._order._unlink_node(entry[0])
+        self._weight -= entry[2]
+        return entry[1]
+
+    def clear(self):
+        """Drop every entry; the counters are kept."""
+        self._order = DoublyLinkedList()
+        self._entries.clear()
+        self._weight = 0
+
+    def stats(self):
+        """Return the hit/miss/eviction counters as a dict."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'weight': self._weight,
+            'capacity': self._capacity,
+        }
+
+    def memoize(self, func):
+        """
+        Decorate func so its results are cached here.
+
+        Arguments must be hashable; keyword arguments are part of the key.
+        """
+        missing = object()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (missing,) + tuple(sorted(kwargs.items())) if kwargs else args
+            result = self.get(key, missing)
+
+            if result is missing:
+                result = func(*args, **kwargs)
+                self.put(key, result)
+
+            return result
+
+        wrapper.cache = self
+        return wrapper
+
+
+def lru_cache(capacity=128, weigher=None, on_evict=None):
+    """Decorator factory, like functools.lru_cache but backed by LRUCache."""
+    def decorator(func):
+        return LRUCache(capacity, weigher, on_evict).memoize(func)
+
+    return decorator
@@ -0,0 +1,100 @@
+import unittest
+import lru_cache
+
+
+class TestLRUCacheClass(unittest.TestCase):
+    """Test LRU cache built on the doubly linked list."""
+
+    def setUp(self):
+        self.evicted = []
+        self.cache = lru_cache.LRUCache(
+            capacity=2, on_evict=lambda k, v: self.evicted.append((k, v)))
+
+    def test_capacity(self):
+        with self.assertRaises(ValueError):
+            lru_cache.LRUCache(capacity=0)
+
+    def test_get_and_put(self):
+        cache = self.cache
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(len(cache), 2)
+        self.assertIn('b', cache)
+
+    def test_evicts_least_recently_used(self):
+        cache = self.cache
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')  # b is now least recently used
+        cache.put('c', 3)
+
+        self.assertNotIn('b', cache)
+        self.assertEqual(self.evicted, [('b', 2)])
+        self.assertEqual(str(cache._order), 'c -> a')
+
+    def test_replace_moves_to_front(self):
+        cache = self.cache
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 10)
+        cache.put('c', 3)
+
+        self.assertEqual(cache.get('a'), 10)
+        self.assertNotIn('b', cache)
+
+    def test_weigher(self):
+        cache = lru_cache.LRUCache(capacity=10, weigher=lambda k, v: len(v))
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxx')
+        cache.put('c', 'xxxx')
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.weight, 8)
+
+        with self.assertRaises(ValueError):
+            cache.put('d', 'x' * 11)
+
+    def test_pop_and_clear(self):
+        cache = self.cache
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.pop('b'), 2)
+        self.assertIsNone(cache.pop('b'))
+        self.assertEqual(str(cache._order), 'a')
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['evictions'], 0)
+
+    def test_stats(self):
+        cache = self.cache
+        cache.get('a')
+        cache.put('a', 1)
+        cache.get('a')
+        cache.put('b', 2)
+        cache.put('c', 3)
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']),
+                         (1, 1, 1))
+        self.assertEqual(stats['size'], 2)
+
+    def test_decorator(self):
+        calls = []
+
+        @lru_cache.lru_cache(capacity=2)
+        def square(n, offset=0):
+            calls.append(n)
+            return n * n + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache.hits, 1)
+        self.assertEqual(square.__name__, 'square')
+
+
+if __name__ == '__main__':
+    unittest.main()
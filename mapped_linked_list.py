@@ -0,0 +1,577 @@
+"""
+Linked lists kept in a memory-mapped file instead of Node objects.
+
+    with MappedLinkedList('values.map') as lst:
+        lst.insert(3)
+
+Every node is a fixed-size record (value, next, and prev for the doubly
+linked variant) and links are record numbers, so the list can be much
+larger than RAM: the OS page cache decides which records stay resident.
+Deleted records go on a free-list and are reused before the file grows.
+Values have a fixed struct format ('q' for 64-bit ints by default, 'd'
+for floats). Reopening an existing file picks up the list where it was.
+"""
+import mmap
+import os
+import struct
+import sys
+
+import doubly_linked_list
+import linked_list
+
+MAGIC = b'LLMAPPED'
+
+# magic, doubly linked, value format, capacity, head, tail, length,
+# free-list head, records ever used
+HEADER = struct.Struct('<8s?c6xqqqqqq')
+LINK = struct.Struct('<q')
+
+# record number meaning "no node"
+NIL = -1
+
+
+class MappedLinkedList:
+    """
+    Singly linked list whose nodes live in an mmap-ed file.
+
+    Exposes the same methods as LinkedList. delete returns a detached
+    linked_list.Node holding the value, since records have no identity
+    outside the file.
+    """
+
+    _doubly = False
+    _node_class = linked_list.Node
+
+    def __init__(self, path, value_format=None, capacity=1024):
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+
+        try:
+            if exists:
+                self._open_existing(value_format)
+            else:
+                self._create(value_format or 'q', max(capacity, 1))
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _set_format(self, value_format):
+        self._format = value_format
+        self._value_struct = struct.Struct('<' + value_format)
+        self._next_offset = self._value_struct.size
+        self._prev_offset = self._next_offset + LINK.size
+        links = 2 if self._doubly else 1
+        self._record_size = self._value_struct.size + links * LINK.size
+
+    def _create(self, value_format, capacity):
+        self._set_format(value_format)
+        self._capacity = capacity
+        self._head = self._tail = self._free = NIL
+        self._length = self._used = 0
+
+        self._file.truncate(HEADER.size + capacity * self._record_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._save_header()
+
+    def _open_existing(self, value_format):
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        (magic, doubly, stored_format, self._capacity, self._head, self._tail,
+         self._length, self._free, self._used) = HEADER.unpack_from(self._map)
+        stored_format = stored_format.decode()
+
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError('not a mapped linked list file')
+
+        if doubly != self._doubly or value_format not in (None, stored_format):
+            self._map.close()
+            raise ValueError('file holds a {} list of {!r} values'.format(
+                'doubly linked' if doubly else 'singly linked', stored_format))
+
+        self._set_format(stored_format)
+
+    def _save_header(self):
+        HEADER.pack_into(self._map, 0, MAGIC, self._doubly, self._format.encode(),
+                         self._capacity, self._head, self._tail, self._length,
+                         self._free, self._used)
+
+    def flush(self):
+        """Write dirty pages back to the file."""
+        self._map.flush()
+
+    def close(self):
+        """Flush and close the file; the list can't be used afterward."""
+        if self._map.closed:
+            return
+
+        self._save_header()
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # record accessors; i is a record number
+
+    def _offset(self, i):
+        return HEADER.size + i * self._record_size
+
+    def _value(self, i):
+        return self._value_struct.unpack_from(self._map, self._offset(i))[0]
+
+    def _next(self, i):
+        return LINK.unpack_from(self._map, self._offset(i) + self._next_offset)[0]
+
+    def _set_next(self, i, j):
+        LINK.pack_into(self._map, self._offset(i) + self._next_offset, j)
+
+    def _prev(self, i):
+        return LINK.unpack_from(self._map, self._offset(i) + self._prev_offset)[0]
+
+    def _set_prev(self, i, j):
+        LINK.pack_into(self._map, self._offset(i) + self._prev_offset, j)
+
+    # space: O(1) amortized, the file doubles when it's full
+    # time: O(1) amortized
+    def _allocate(self, value):
+        """Return the number of a fresh record holding value, unlinked."""
+        # packing first means a value the format rejects claims no record
+        return self._allocate_packed(self._value_struct.pack(value))
+
+    def _allocate_packed(self, packed):
+        """Return the number of a fresh record holding packed bytes, unlinked."""
+        if self._free != NIL:
+            i = self._free
+            self._free = self._next(i)
+        else:
+            if self._used == self._capacity:
+                self._grow()
+
+            i = self._used
+            self._used += 1
+
+        offset = self._offset(i)
+        self._map[offset:offset + len(packed)] = packed
+        self._set_next(i, NIL)
+
+        if self._doubly:
+            self._set_prev(i, NIL)
+
+        return i
+
+    def _release(self, i):
+        """Put record i on the free-list."""
+        self._set_next(i, self._free)
+        self._free = i
+
+    def _grow(self):
+        self._capacity *= 2
+        self._map.close()
+        self._file.truncate(HEADER.size + self._capacity * self._record_size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def __str__(self):
+        return ' -> '.join(str(value) for value in self)
+
+    # space: O(1)
+    # time: O(n)
+    def __iter__(self):
+        current = self._head
+
+        while current != NIL:
+            yield self._value(current)
+            current = self._next(current)
+
+    # space: O(n) because the singly linked variant can only walk forward
+    # time: O(n)
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    # space and time: O(1)
+    def insert(self, value):
+        """Insert given value at the head of the linked list."""
+        new = self._allocate(value)
+
+        if self._head != NIL:
+            self._set_next(new, self._head)
+
+            if self._doubly:
+                self._set_prev(self._head, new)
+        else:
+            self._tail = new
+
+        self._head = new
+        self._length += 1
+        self._save_header()
+
+    # space and time: O(1) because the tail is tracked
+    def append(self, value):
+        """Insert given value at the tail of the linked list."""
+        new = self._allocate(value)
+
+        if self._tail != NIL:
+            self._set_next(self._tail, new)
+
+            if self._doubly:
+                self._set_prev(new, self._tail)
+        else:
+            self._head = new
+
+        self._tail = new
+        self._length += 1
+        self._save_header()
+
+    # space: O(k) records, plus the k packed values held until they're linked
+    # time: O(k)
+    def extend(self, iterable):
+        """Append every value of the iterable, in order, at the tail."""
+        # packing the whole batch first means a value the format rejects
+        # leaves the list untouched; it also copies a list extended with
+        # itself, which would otherwise never reach the end
+        pack = self._value_struct.pack
+        batch = [pack(value) for value in iterable]
+        tail = self._tail
+
+        # the header is written once at the end rather than per value
+        for packed in batch:
+            new = self._allocate_packed(packed)
+
+            if tail != NIL:
+                self._set_next(tail, new)
+
+                if self._doubly:
+                    self._set_prev(new, tail)
+            else:
+                self._head = new
+
+            tail = new
+            self._length += 1
+
+        self._tail = tail
+        self._save_header()
+
+    # space and time: O(1)
+    def pop_front(self):
+        """
+        Remove the first value and return it.
+
+        Raises IndexError if the list is empty.
+        """
+        if self._head == NIL:
+            raise IndexError
+
+        removed = self._head
+        value = self._value(removed)
+        self._unlink(NIL, removed)
+        return value
+
+    # space: O(1)
+    # time: O(n) because the record before the tail has to be found
+    def pop_back(self):
+        """
+        Remove the last value and return it.
+
+        Raises IndexError if the list is empty.
+        """
+        if self._tail == NIL:
+            raise IndexError
+
+        removed = self._tail
+        value = self._value(removed)
+        self._unlink(self._find_previous(removed), removed)
+        return value
+
+    def _find_previous(self, i):
+        """Return the record before i, walking from the head."""
+        previous = NIL
+        current = self._head
+
+        while current != i:
+            previous = current
+            current = self._next(current)
+
+        return previous
+
+    # space and time: O(1)
+    def _unlink(self, previous, i):
+        """Detach record i, whose predecessor is previous, and free it."""
+        next_record = self._next(i)
+
+        if previous != NIL:
+            self._set_next(previous, next_record)
+        else:
+            self._head = next_record
+
+        if next_record != NIL:
+            if self._doubly:
+                self._set_prev(next_record, previous)
+        else:
+            self._tail = previous
+
+        self._release(i)
+        self._length -= 1
+        self._save_header()
+
+    # space: O(1)
+    # time: O(n)
+    def search(self, value):
+        """Search for the given value. Returns True if found; else False."""
+        for candidate in self:
+            if candidate == value:
+                return True
+
+        return False
+
+    # space: O(1)
+    # time: O(n)
+    def find_max(self):
+        """Return the max value in the list; returns None if list is empty."""
+        if self._head == NIL:
+            return None
+
+        return max(self)
+
+    # same as above for space and time
+    def find_min(self):
+        """Return the min value in the list; returns None if list is empty."""
+        if self._head == NIL:
+            return None
+
+        return min(self)
+
+    # space and time: O(1), the length is kept in the header
+    def length(self):
+        return self._length
+
+    # space: O(1)
+    # time: O(n) where n is the index
+    def _record_at(self, index):
+        if not 0 <= index < self._length:
+            raise IndexError
+
+        current = self._head
+
+        for _ in range(index):
+            current = self._next(current)
+
+        return current
+
+    def find_nth_from_beginning(self, n):
+        """
+        Return value of nth node in the list.
+
+        Raises error if n is not in list range.
+        """
+        return self._value(self._record_at(n))
+
+    # space: O(1)
+    # time: O(n)
+    def insert_ascending(self, value):
+        """
+        Insert given value in ascending order.
+
+        Assumes the list is already sorted.
+        """
+        if self._head == NIL or value <= self._value(self._head):
+            self.insert(value)
+            return
+
+        previous = self._head
+        current = self._next(previous)
+
+        while current != NIL and self._value(current) < value:
+            previous = current
+            current = self._next(current)
+
+        if current == NIL:
+            self.append(value)
+            return
+
+        new = self._allocate(value)
+        self._set_next(new, current)
+        self._set_next(previous, new)
+
+        if self._doubly:
+            self._set_prev(new, previous)
+            self._set_prev(current, new)
+
+        self._length += 1
+        self._save_header()
+
+    # space: O(c) for one chunk of c value strings
+    # time: O(n)
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
+
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
+
+        file.write('\n')
+
+    # space: O(1)
+    # time: O(n) in the worst case, the value isn't in the list
+    def delete(self, value):
+        """
+        Delete the first node found with the specified value.
+
+        Returns a detached node holding the value if found; else None.
+        """
+        previous = NIL
+        current = self._head
+
+        while current != NIL:
+            found = self._value(current)
+
+            if found == value:
+                self._unlink(previous, current)
+                return self._node_class(found)
+
+            previous = current
+            current = self._next(current)
+
+        return None
+
+    # space: O(1)
+    # time: O(n) because every record's links are rewritten
+    def reverse(self):
+        """Reverse the linked list by relinking its records."""
+        previous = NIL
+        current = self._head
+
+        while current != NIL:
+            next_record = self._next(current)
+            self._set_next(current, previous)
+
+            if self._doubly:
+                self._set_prev(current, next_record)
+
+            previous = current
+            current = next_record
+
+        self._head, self._tail = self._tail, self._head
+        self._save_header()
+
+    def find_middle_value(self):
+        """
+        Return value at middle node in list.
+
+        If length is odd, returns middle node. If even, returns middle
+        rounded down (e.g. length 10 will return element at index 4).
+
+        Returns None if list is empty.
+        """
+        if self._head == NIL:
+            return None
+
+        return self.find_nth_from_beginning((self._length - 1) // 2)
+
+    # space: O(1)
+    # time: O(n)
+    def find_nth_from_end(self, n):
+        """
+        Return value of nth node from end of list.
+
+        Assumes last node is index 0. (e.g. 3rd from end is idx -4)
+        """
+        if self._length - 1 < n:
+            raise IndexError
+
+        return self.find_nth_from_beginning((self._length - 1) - n)
+
+    # space: O(1), only two record numbers are kept
+    # time: O(n)
+    def has_cycle(self):
+        slow = fast = self._head
+
+        while fast != NIL:
+            fast = self._next(fast)
+
+            if fast == NIL:
+                return False
+
+            fast = self._next(fast)
+            slow = self._next(slow)
+
+            if fast == slow:
+                return True
+
+        return False
+
+    def create_cycle(self):
+        """Create a cycle for testing purposes."""
+        # do nothing if empty list
+        if self._head == NIL:
+            return
+
+        # cycle back to head
+        self._set_next(self._tail, self._head)
+
+        if self._doubly:
+            self._set_prev(self._head, self._tail)
+
+
+class MappedDoublyLinkedList(MappedLinkedList):
+    """
+    Doubly linked list whose nodes live in an mmap-ed file.
+
+    Each record also stores its predecessor, so the list can be walked
+    backward and pop_back is O(1).
+    """
+
+    _doubly = True
+    _node_class = doubly_linked_list.Node
+
+    # space: O(1) because prev links allow walking back from the tail
+    # time: O(n)
+    def __reversed__(self):
+        current = self._tail
+
+        while current != NIL:
+            yield self._value(current)
+            current = self._prev(current)
+
+    # space and time: O(1), the predecessor is stored in the record
+    def _find_previous(self, i):
+        return self._prev(i)
+
+    # space: O(1)
+    # time: O(n / 2) because the walk starts from the nearer end
+    def _record_at(self, index):
+        if not 0 <= index < self._length:
+            raise IndexError
+
+        if index <= self._length // 2:
+            return super()._record_at(index)
+
+        current = self._tail
+
+        for _ in range(self._length - 1 - index):
+            current = self._prev(current)
+
+        return current
@@ -0,0 +1,132 @@
+import io
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import mapped_linked_list as mapped
+
+
+class TestMappedLinkedList(unittest.TestCase):
+    """Test singly linked list stored in a memory-mapped file."""
+
+    cls = mapped.MappedLinkedList
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'list.map')
+
+        self.lst = self.cls(self.path, capacity=2)
+        self.addCleanup(lambda: self.lst.close())
+
+        for value in [20, 5, -3, 4, -3]:
+            self.lst.insert(value)  # list of [-3, 4, -3, 5, 20]
+
+    def test_methods(self):
+        lst = self.lst
+        self.assertEqual(str(lst), '-3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(lst.length(), 5)
+        self.assertTrue(lst.search(5))
+        self.assertNotIn(6, lst)
+        self.assertEqual(lst.find_max(), 20)
+        self.assertEqual(lst.find_min(), -3)
+        self.assertEqual(lst.find_nth_from_beginning(1), 4)
+        self.assertEqual(lst.find_nth_from_end(1), 5)
+        self.assertEqual(lst.find_middle_value(), -3)
+        self.assertEqual(list(reversed(lst)), [20, 5, -3, 4, -3])
+
+        with self.assertRaises(IndexError):
+            lst.find_nth_from_end(5)
+
+        out = io.StringIO()
+        lst.visit(out)
+        self.assertEqual(out.getvalue(), '-3 4 -3 5 20 \n')
+
+    def test_mutations(self):
+        lst = self.lst
+        self.assertEqual(lst.delete(-3).value, -3)
+        self.assertIsNone(lst.delete(7))
+        self.assertEqual(lst.pop_back(), 20)
+        self.assertEqual(lst.pop_front(), 4)
+        lst.append(9)
+        lst.reverse()
+        self.assertEqual(str(lst), '9 -> 5 -> -3')
+
+        lst.reverse()
+        lst.insert_ascending(0)
+        lst.insert_ascending(10)
+        self.assertEqual(str(lst), '-3 -> 0 -> 5 -> 9 -> 10')
+
+    def test_free_list(self):
+        used = self.lst._used
+
+        for value in range(5):
+            self.lst.delete(self.lst.find_nth_from_beginning(0))
+            self.lst.append(value)
+
+        self.assertEqual(self.lst._used, used)
+        self.assertEqual(list(self.lst), [0, 1, 2, 3, 4])
+
+    def test_rejected_value_claims_no_record(self):
+        used = self.lst._used
+
+        for value in ['a', 1.5]:
+            with self.assertRaises(struct.error):
+                self.lst.insert(value)
+
+        self.assertEqual(self.lst._used, used)
+        self.assertEqual(self.lst.length(), 5)
+
+        with self.assertRaises(struct.error):
+            self.lst.extend([1, 2, 'x'])
+
+        self.assertEqual(self.lst._used, used)
+        self.lst.append(9)
+        self.assertEqual(list(self.lst), [-3, 4, -3, 5, 20, 9])
+        self.assertEqual(self.lst.length(), 6)
+        self.assertEqual(self.lst.find_nth_from_end(0), 9)
+
+    def test_reopen(self):
+        self.lst.close()
+        self.lst = self.cls(self.path)
+        self.assertEqual(list(self.lst), [-3, 4, -3, 5, 20])
+
+        with self.assertRaises(ValueError):
+            self.cls(self.path, value_format='d')
+
+    def test_float_values(self):
+        self.lst.close()
+        os.remove(self.path)
+        self.lst = self.cls(self.path, value_format='d')
+        self.lst.extend([0.5, 1.5])
+        self.assertEqual(self.lst.find_max(), 1.5)
+
+    def test_has_cycle(self):
+        self.assertFalse(self.lst.has_cycle())
+        self.lst.create_cycle()
+        self.assertTrue(self.lst.has_cycle())
+
+
+class TestMappedDoublyLinkedList(TestMappedLinkedList):
+    """Test doubly linked list stored in a memory-mapped file."""
+
+    cls = mapped.MappedDoublyLinkedList
+
+    def test_kind_must_match(self):
+        self.lst.close()
+
+        with self.assertRaises(ValueError):
+            mapped.MappedLinkedList(self.path)
+
+        self.lst = self.cls(self.path)
+
+    def test_walks_from_nearer_end(self):
+        self.lst.extend(range(100))
+        self.assertEqual(self.lst.find_nth_from_end(3), 96)
+        self.assertEqual(self.lst.pop_back(), 99)
+        self.assertEqual(list(reversed(self.lst))[:2], [98, 97])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Free-list of detached nodes for LinkedList and DoublyLinkedList.
+
+    pool = NodePool(capacity=10000)
+    queue = DoublyLinkedList(pool=pool)
+    other = LinkedList(pool=pool)
+
+A list built with a pool takes new nodes from it and hands the nodes that
+pop_front, pop_back and the batch deletes remove back, so churn-heavy
+workloads stop allocating a node per insert and freeing one per removal.
+Lists pop from the free-list inline on their insert paths, which is much
+cheaper than constructing a node; the pool itself only does the
+bookkeeping for nodes coming back. One pool can serve any number of
+lists of either class; it keeps a separate free-list per node class,
+each holding at most `capacity` nodes. Extras are left to the garbage
+collector.
+"""
+
+
+class NodePool:
+    """Bounded pool of reusable nodes with reuse statistics."""
+
+    def __init__(self, capacity=1024):
+        if capacity < 0:
+            raise ValueError('capacity must not be negative')
+
+        self._capacity = capacity
+        self._free = {}  # node class -> list of detached nodes
+
+        # reuses aren't counted as they happen, to keep the insert paths
+        # lean; stats() works them out from these
+        self.allocations = 0
+        self.releases = 0
+        self.discards = 0
+        self._cleared = 0
+
+    def __len__(self):
+        return sum(len(free) for free in self._free.values())
+
+    @property
+    def reuses(self):
+        return self.releases - self.discards - self._cleared - len(self)
+
+    def free_list(self, node_class):
+        """
+        Return the list of free node_class nodes.
+
+        Lists pop nodes straight off it, set their value, count an
+        allocation when it's empty and make a node themselves.
+        """
+        return self._free.setdefault(node_class, [])
+
+    # space and time: O(1)
+    def release(self, node):
+        """Take back a node its list has unlinked, with its links cleared."""
+        self.releases += 1
+        free = self._free.get(type(node))
+
+        if free is None or len(free) >= self._capacity:
+            self.discards += 1
+            return
+
+        # a pooled node mustn't keep its value alive
+        node._value = None
+        free.append(node)
+
+    def clear(self):
+        """Drop every pooled node."""
+        for free in self._free.values():
+            self._cleared += len(free)
+            free.clear()
+
+    def stats(self):
+        """Return the allocation and reuse counters as a dict."""
+        reuses = self.reuses
+        requests = self.allocations + reuses
+
+        return {
+            'allocations': self.allocations,
+            'reuses': reuses,
+            'reuse_rate': reuses / requests if requests else 0.0,
+            'releases': self.releases,
+            'discards': self.discards,
+            'size': len(self),
+            'capacity': self._capacity,
+        }
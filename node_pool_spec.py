@@ -0,0 +1,81 @@
+import unittest
+import doubly_linked_list as dll
+import linked_list
+import node_pool
+
+
+class TestNodePool(unittest.TestCase):
+    """Test node reuse between lists sharing a pool."""
+
+    def setUp(self):
+        self.pool = node_pool.NodePool(capacity=3)
+
+    def test_reuses_removed_nodes(self):
+        lst = linked_list.LinkedList(pool=self.pool)
+        lst.extend([1, 2, 3])
+        first = lst._head
+
+        self.assertEqual(lst.pop_front(), 1)
+        self.assertIsNone(first._value)
+        self.assertIsNone(first._next_node)
+
+        lst.insert(0)
+        self.assertIs(lst._head, first)
+        self.assertEqual(str(lst), '0 -> 2 -> 3')
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['allocations'], 3)
+        self.assertEqual(stats['reuses'], 1)
+        self.assertEqual(stats['reuse_rate'], 0.25)
+
+    def test_delete_returns_node(self):
+        lst = dll.DoublyLinkedList.from_iterable([4, 5, 6], pool=self.pool)
+        deleted = lst.delete(5)
+        self.assertEqual(deleted.value, 5)
+        self.assertIsNone(lst.delete(7))
+
+        # the deleted node belongs to the caller, so only pop_back pools
+        self.assertEqual(lst.pop_back(), 6)
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(deleted.value, 5)
+
+        lst.insert_ascending(5)
+        lst.append(7)
+        self.assertEqual(str(lst), '4 -> 5 -> 7')
+        self.assertEqual(list(reversed(lst)), [7, 5, 4])
+        self.assertEqual(len(self.pool), 0)
+
+        indexed = dll.DoublyLinkedList.from_iterable([1, 1], indexed=True, pool=self.pool)
+        self.assertEqual(indexed.delete(1).value, 1)
+        self.assertEqual(len(indexed._index[1]), 1)
+
+    def test_shared_between_classes(self):
+        singly = linked_list.LinkedList.from_iterable([1], pool=self.pool)
+        doubly = dll.DoublyLinkedList.from_iterable([2], pool=self.pool)
+        singly.pop_back()
+        doubly.pop_back()
+
+        doubly.append(3)
+        self.assertIsInstance(doubly._head, dll.Node)
+        singly.append(4)
+        self.assertIsInstance(singly._head, linked_list.Node)
+        self.assertEqual(self.pool.reuses, 2)
+
+    def test_capacity(self):
+        lst = linked_list.LinkedList.from_iterable(range(5), pool=self.pool)
+
+        while lst.length():
+            lst.pop_front()
+
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.pool.discards, 2)
+
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+        with self.assertRaises(ValueError):
+            node_pool.NodePool(capacity=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,441 @@
+"""
+Singly linked list of numbers stored as parallel arrays.
+
+Instead of a Node object per value (around 100 bytes), a NumericLinkedList
+keeps the values in one typed array and the links in two arrays of ints,
+so a node costs 16 bytes: an 8-byte value and the 4-byte indexes of the
+next and previous slots. Deletion moves the last slot into the hole and
+relinks its neighbours in O(1), so the value array always holds exactly
+the list's values, in slot order. That lets
+find_max, find_min and search scan the whole buffer in one vectorized
+call: with NumPy when it's installed, otherwise with the builtins over
+the array, which still loop in C.
+"""
+import sys
+from array import array
+
+from linked_list import Node
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# slot index meaning "no node"
+NIL = -1
+
+# below this many values NumPy's call overhead outweighs its speed
+NUMPY_MIN_LENGTH = 256
+
+
+class NumericLinkedList:
+    """
+    Singly linked list of numbers with the same methods as LinkedList.
+
+    typecode is 'q' for 64-bit ints or 'd' for floats (ints are stored
+    as floats). Values of any other type are rejected with TypeError.
+    delete returns a detached linked_list.Node holding the value, since
+    slots have no identity outside the arrays.
+    """
+
+    def __init__(self, typecode='q'):
+        if typecode not in ('d', 'q'):
+            raise ValueError("typecode must be 'd' or 'q'")
+
+        self._values = array(typecode)
+        self._next = array('i')
+        self._prev = array('i')
+        self._head = NIL
+        self._tail = NIL
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """Build a list holding the iterable's values in the same order."""
+        lst = cls(**kwargs)
+        lst.extend(iterable)
+        return lst
+
+    def __str__(self):
+        return ' -> '.join(str(value) for value in self)
+
+    # space: O(1)
+    # time: O(n)
+    def __iter__(self):
+        values = self._values
+        links = self._next
+        current = self._head
+
+        while current != NIL:
+            yield values[current]
+            current = links[current]
+
+    # space: O(n) because the links only go forward
+    # time: O(n)
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def _vector(self):
+        """Return a NumPy view of the values, or None to use the builtins."""
+        if numpy is None or len(self._values) < NUMPY_MIN_LENGTH:
+            return None
+
+        return numpy.frombuffer(self._values, dtype=self._values.typecode)
+
+    # space: O(1) amortized for the array growth
+    # time: O(1) amortized
+    def insert(self, value):
+        """Insert given value at the head of the linked list."""
+        self._values.append(value)
+        self._next.append(self._head)
+        self._prev.append(NIL)
+        new = len(self._values) - 1
+
+        if self._head != NIL:
+            self._prev[self._head] = new
+        else:
+            self._tail = new
+
+        self._head = new
+
+    # space and time: O(1) amortized, the tail is tracked
+    def append(self, value):
+        """Insert given value at the tail of the linked list."""
+        self._values.append(value)
+        self._next.append(NIL)
+        self._prev.append(self._tail)
+        new = len(self._values) - 1
+
+        if self._tail != NIL:
+            self._next[self._tail] = new
+        else:
+            self._head = new
+
+        self._tail = new
+
+    # space: O(k)
+    # time: O(k), with the values and links added as whole arrays
+    def extend(self, iterable):
+        """Append every value of the iterable, in order, at the tail."""
+        # converting first means a bad value leaves the list untouched
+        values = array(self._values.typecode, iterable)
+
+        if not values:
+            return
+
+        start = len(self._values)
+        end = start + len(values)
+
+        self._values.extend(values)
+        self._next.extend(range(start + 1, end))
+        self._next.append(NIL)
+        self._prev.append(self._tail)
+        self._prev.extend(range(start, end - 1))
+
+        if self._tail != NIL:
+            self._next[self._tail] = start
+        else:
+            self._head = start
+
+        self._tail = end - 1
+
+    # space and time: O(1), the moved slot's neighbours are one link away
+    def _remove(self, slot):
+        """Unlink slot and fill the hole it leaves."""
+        links = self._next
+        prevs = self._prev
+        previous = prevs[slot]
+        next_slot = links[slot]
+
+        if previous != NIL:
+            links[previous] = next_slot
+        else:
+            self._head = next_slot
+
+        if next_slot != NIL:
+            prevs[next_slot] = previous
+        else:
+            self._tail = previous
+
+        # move the last slot into the hole so the arrays stay dense
+        last = len(self._values) - 1
+
+        if slot != last:
+            self._values[slot] = self._values[last]
+            previous = prevs[slot] = prevs[last]
+            next_slot = links[slot] = links[last]
+
+            if previous != NIL:
+                links[previous] = slot
+            else:
+                self._head = slot
+
+            if next_slot != NIL:
+                prevs[next_slot] = slot
+            else:
+                self._tail = slot
+
+        self._values.pop()
+        links.pop()
+        prevs.pop()
+
+    # space and time: O(1)
+    def pop_front(self):
+        """
+        Remove the first value and return it.
+
+        Raises IndexError if the list is empty.
+        """
+        if self._head == NIL:
+            raise IndexError
+
+        value = self._values[self._head]
+        self._remove(self._head)
+        return value
+
+    # space and time: O(1), the tail's predecessor is in the prev links
+    def pop_back(self):
+        """
+        Remove the last value and return it.
+
+        Raises IndexError if the list is empty.
+        """
+        if self._tail == NIL:
+            raise IndexError
+
+        value = self._values[self._tail]
+        self._remove(self._tail)
+        return value
+
+    # space: O(1), or O(n) for NumPy's boolean mask
+    # time: O(n), vectorized
+    def search(self, value):
+        """Search for the given value. Returns True if found; else False."""
+        vector = self._vector()
+
+        if vector is not None and isinstance(value, (int, float)):
+            try:
+                return bool((vector == value).any())
+            except OverflowError:
+                # an int too big for the buffer can't be in it
+                return False
+
+        return value in self._values
+
+    # space: O(1)
+    # time: O(n), vectorized
+    def find_max(self):
+        """Return the max value in the list; returns None if list is empty."""
+        if not self._values:
+            return None
+
+        vector = self._vector()
+
+        if vector is not None:
+            return vector.max().item()
+
+        return max(self._values)
+
+    # same as above for space and time
+    def find_min(self):
+        """Return the min value in the list; returns None if list is empty."""
+        if not self._values:
+            return None
+
+        vector = self._vector()
+
+        if vector is not None:
+            return vector.min().item()
+
+        return min(self._values)
+
+    # space and time: O(1)
+    def length(self):
+        return len(self._values)
+
+    # space: O(1)
+    # time: O(n) where n is the index
+    def _slot_at(self, index):
+        if not 0 <= index < len(self._values):
+            raise IndexError
+
+        links = self._next
+        current = self._head
+
+        for _ in range(index):
+            current = links[current]
+
+        return current
+
+    def find_nth_from_beginning(self, n):
+        """
+        Return value of nth node in the list.
+
+        Raises error if n is not in list range.
+        """
+        return self._values[self._slot_at(n)]
+
+    # space: O(1) amortized
+    # time: O(n)
+    def insert_ascending(self, value):
+        """
+        Insert given value in ascending order.
+
+        Assumes the list is already sorted.
+        """
+        values = self._values
+        links = self._next
+
+        if self._head == NIL or value <= values[self._head]:
+            self.insert(value)
+            return
+
+        previous = self._head
+        current = links[previous]
+
+        while current != NIL and values[current] < value:
+            previous = current
+            current = links[current]
+
+        if current == NIL:
+            self.append(value)
+            return
+
+        values.append(value)
+        links.append(current)
+        self._prev.append(previous)
+        links[previous] = self._prev[current] = len(values) - 1
+
+    # space: O(c) for one chunk of c value strings
+    # time: O(n)
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
+
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
+
+        file.write('\n')
+
+    # space: O(1)
+    # time: O(n); a value that isn't there is ruled out by a C-level scan
+    def delete(self, value):
+        """
+        Delete the first node found with the specified value.
+
+        Returns a detached node holding the value if found; else None.
+        """
+        if not self.search(value):
+            return None
+
+        values = self._values
+        links = self._next
+        current = self._head
+
+        while values[current] != value:
+            current = links[current]
+
+        deleted = Node(values[current])
+        self._remove(current)
+        return deleted
+
+    # space: O(n) for the sorted values
+    # time: O(n log n)
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place; key and reverse work as for list.sort.
+
+        The arrays are rewritten in sorted order with every slot linking
+        to the next, which also makes later walks sequential in memory.
+        """
+        ordered = sorted(self, key=key, reverse=reverse)
+        self._values = array(self._values.typecode, ordered)
+        self._next = array('i', range(1, len(ordered)))
+        self._prev = array('i', range(-1, len(ordered) - 1))
+
+        if ordered:
+            self._next.append(NIL)
+            self._head, self._tail = 0, len(ordered) - 1
+
+    # space and time: O(1)
+    def reverse(self):
+        """Reverse the linked list; the next and prev links swap roles."""
+        self._next, self._prev = self._prev, self._next
+        self._head, self._tail = self._tail, self._head
+
+    def find_middle_value(self):
+        """
+        Return value at middle node in list.
+
+        If length is odd, returns middle node. If even, returns middle
+        rounded down (e.g. length 10 will return element at index 4).
+
+        Returns None if list is empty.
+        """
+        if self._head == NIL:
+            return None
+
+        return self.find_nth_from_beginning((len(self._values) - 1) // 2)
+
+    # space: O(1)
+    # time: O(n)
+    def find_nth_from_end(self, n):
+        """
+        Return value of nth node from end of list.
+
+        Assumes last node is index 0. (e.g. 3rd from end is idx -4)
+        """
+        if len(self._values) - 1 < n:
+            raise IndexError
+
+        return self.find_nth_from_beginning((len(self._values) - 1) - n)
+
+    # space: O(1), only two slot indexes are kept
+    # time: O(n)
+    def has_cycle(self):
+        links = self._next
+        slow = fast = self._head
+
+        while fast != NIL:
+            fast = links[fast]
+
+            if fast == NIL:
+                return False
+
+            fast = links[fast]
+            slow = links[slow]
+
+            if fast == slow:
+                return True
+
+        return False
+
+    def create_cycle(self):
+        """Create a cycle for testing purposes."""
+        # do nothing if empty list
+        if self._head == NIL:
+            return
+
+        # cycle back to head
+        self._next[self._tail] = self._head
+        self._prev[self._head] = self._tail
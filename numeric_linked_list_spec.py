@@ -0,0 +1,119 @@
+import io
+import unittest
+import numeric_linked_list as numeric
+
+
+class TestNumericLinkedList(unittest.TestCase):
+    """Test linked list of numbers stored in parallel arrays."""
+
+    def setUp(self):
+        self.empty_list = numeric.NumericLinkedList('q')
+
+        self.lst = numeric.NumericLinkedList('q')
+        for value in [20, 5, -3, 4, -3]:
+            self.lst.insert(value)  # list of [-3, 4, -3, 5, 20]
+
+    def test_methods(self):
+        lst = self.lst
+        self.assertEqual(str(lst), '-3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(lst.length(), 5)
+        self.assertTrue(lst.search(5))
+        self.assertNotIn(6, lst)
+        self.assertNotIn('a', lst)
+        self.assertEqual(lst.find_max(), 20)
+        self.assertEqual(lst.find_min(), -3)
+        self.assertEqual(lst.find_nth_from_beginning(1), 4)
+        self.assertEqual(lst.find_nth_from_end(1), 5)
+        self.assertEqual(lst.find_middle_value(), -3)
+        self.assertEqual(list(reversed(lst)), [20, 5, -3, 4, -3])
+
+        self.assertIsNone(self.empty_list.find_max())
+        self.assertIsNone(self.empty_list.find_middle_value())
+
+        with self.assertRaises(IndexError):
+            lst.find_nth_from_end(5)
+
+        out = io.StringIO()
+        lst.visit(out)
+        self.assertEqual(out.getvalue(), '-3 4 -3 5 20 \n')
+
+    def test_delete_keeps_arrays_dense(self):
+        lst = self.lst
+        self.assertEqual(lst.delete(-3).value, -3)
+        self.assertIsNone(lst.delete(7))
+        self.assertEqual(str(lst), '4 -> -3 -> 5 -> 20')
+        self.assertEqual(sorted(lst._values), [-3, 4, 5, 20])
+
+        self.assertEqual(lst.pop_back(), 20)
+        self.assertEqual(lst.pop_front(), 4)
+        self.assertEqual(str(lst), '-3 -> 5')
+        self.assertEqual(len(lst._next), 2)
+
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+
+    def test_removals_keep_prev_links(self):
+        lst = numeric.NumericLinkedList.from_iterable(range(6))
+        lst.reverse()  # list of [5, 4, 3, 2, 1, 0]
+        lst.insert(7)
+        lst.delete(3)
+        lst.pop_front()
+        lst.pop_back()
+        self.assertEqual(str(lst), '5 -> 4 -> 2 -> 1')
+
+        # every slot's prev link mirrors the next link that points at it
+        current = lst._head
+        previous = numeric.NIL
+
+        while current != numeric.NIL:
+            self.assertEqual(lst._prev[current], previous)
+            previous, current = current, lst._next[current]
+
+        self.assertEqual(previous, lst._tail)
+
+    def test_insert_ascending_and_reverse(self):
+        lst = self.empty_list
+        for value in [5, 1, 9, 5, 0]:
+            lst.insert_ascending(value)
+        self.assertEqual(str(lst), '0 -> 1 -> 5 -> 5 -> 9')
+
+        lst.reverse()
+        self.assertEqual(str(lst), '9 -> 5 -> 5 -> 1 -> 0')
+        lst.append(-1)
+        self.assertEqual(lst.find_nth_from_end(0), -1)
+
+        lst.sort()
+        self.assertEqual(str(lst), '-1 -> 0 -> 1 -> 5 -> 5 -> 9')
+
+    def test_typecode(self):
+        lst = numeric.NumericLinkedList()
+        lst.insert(2)
+        self.assertEqual(str(lst), '2')
+        self.assertIsInstance(lst.delete(2).value, int)
+
+        lst = numeric.NumericLinkedList.from_iterable([1, 2.5], typecode='d')
+        self.assertEqual(lst.find_min(), 1.0)
+
+        with self.assertRaises(TypeError):
+            self.lst.extend([1, 'a'])
+        self.assertEqual(self.lst.length(), 5)
+
+        with self.assertRaises(ValueError):
+            numeric.NumericLinkedList('i')
+
+    def test_large_scans(self):
+        lst = numeric.NumericLinkedList.from_iterable(range(10000), typecode='q')
+        self.assertEqual(lst.find_max(), 9999)
+        self.assertEqual(lst.find_min(), 0)
+        self.assertTrue(lst.search(5000))
+        self.assertFalse(lst.search(2 ** 70))
+        self.assertIsInstance(lst.find_max(), int)
+
+    def test_has_cycle(self):
+        self.assertFalse(self.lst.has_cycle())
+        self.lst.create_cycle()
+        self.assertTrue(self.lst.has_cycle())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Process-pool reductions over LinkedList and DoublyLinkedList.
+
+    parallel.find_max(lst)
+    parallel.count(lst, 3, workers=4)
+
+The chain is walked once to pack the values into a shared memory block,
+which is cut into one contiguous segment per worker. Each worker reduces
+its segment straight out of shared memory and the partial results are
+combined here. Walking the chain stays sequential, so this pays off for
+long lists of numbers on several cores; below `threshold` values, or
+when the values aren't all plain ints that fit in 64 bits or all floats, the
+list's own sequential method runs instead.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+# lists shorter than this are reduced sequentially
+PARALLEL_THRESHOLD = 10 ** 6
+
+
+def _pack(lst):
+    """Return the values as an array('q') or array('d'), or None."""
+    values = list(lst)
+
+    # bools and other int subclasses would come back as plain ints, so
+    # find_max on [True, False] would answer 1; they stay sequential
+    if all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            return None
+
+    if all(type(value) is float for value in values):
+        return array('d', values)
+
+    return None
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _reduce_segment(name, typecode, start, stop, op, value):
+    """Worker: reduce values[start:stop] of the shared block."""
+    block = _attach(name)
+
+    try:
+        segment = block.buf.cast(typecode)[start:stop]
+
+        try:
+            if op == 'max':
+                return max(segment)
+            if op == 'min':
+                return min(segment)
+            if op == 'search':
+                return value in segment
+            return array(typecode, segment).count(value)
+        finally:
+            segment.release()
+    finally:
+        block.close()
+
+
+def _segments(length, workers):
+    size = -(-length // workers)
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+def _combine(op, results):
+    if op == 'max':
+        return max(results)
+    if op == 'min':
+        return min(results)
+    if op == 'search':
+        return any(results)
+    return sum(results)
+
+
+def _reduce(lst, op, value, workers, threshold, executor):
+    """Run op over lst in parallel; None means the caller should go sequential."""
+    # an empty list has nothing to share and nothing to split
+    if lst.length() == 0 or lst.length() < threshold:
+        return None
+
+    values = _pack(lst)
+
+    if values is None:
+        return None
+
+    workers = workers or os.cpu_count() or 1
+
+    # workers attach to blocks this process creates; before Python 3.13
+    # that registers them with a resource tracker, which has to be this
+    # process's one, started before a pool forks, or it reports them as
+    # leaked. Starting it here keeps importing the module free of side
+    # effects; it's a no-op once running
+    resource_tracker.ensure_running()
+    block = shared_memory.SharedMemory(create=True, size=len(values) * values.itemsize)
+
+    try:
+        view = block.buf.cast(values.typecode)
+        view[:len(values)] = values
+        view.release()
+
+        own_executor = executor is None
+
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            futures = [executor.submit(_reduce_segment, block.name, values.typecode,
+                                       start, stop, op, value)
+                       for start, stop in _segments(len(values), workers)]
+            return _combine(op, [future.result() for future in futures])
+        finally:
+            if own_executor:
+                executor.shutdown()
+    finally:
+        block.close()
+        block.unlink()
+
+
+# space: O(n) for the packed copy of the values
+# time: O(n / p) for the reductions on p workers, plus the O(n) walk
+def find_max(lst, workers=None, threshold=PARALLEL_THRESHOLD, executor=None):
+    """
+    Return lst.find_max(), computed by a pool of worker processes.
+
+    workers is the number of segments, the CPU count by default. Pass
+    an executor to reuse one pool across calls.
+    """
+    if lst.length() == 0 or getattr(lst, '_track_extrema', False):
+        return lst.find_max()
+
+    result = _reduce(lst, 'max', None, workers, threshold, executor)
+    return lst.find_max() if result is None else result
+
+
+def find_min(lst, workers=None, threshold=PARALLEL_THRESHOLD, executor=None):
+    """Return lst.find_min(), computed by a pool of worker processes."""
+    if lst.length() == 0 or getattr(lst, '_track_extrema', False):
+        return lst.find_min()
+
+    result = _reduce(lst, 'min', None, workers, threshold, executor)
+    return lst.find_min() if result is None else result
+
+
+def search(lst, value, workers=None, threshold=PARALLEL_THRESHOLD, executor=None):
+    """Return lst.search(value), computed by a pool of worker processes."""
+    # an indexed list answers without a scan
+    if getattr(lst, '_index', None) is not None:
+        return lst.search(value)
+
+    result = _reduce(lst, 'search', value, workers, threshold, executor)
+    return lst.search(value) if result is None else result
+
+
+def count(lst, value, workers=None, threshold=PARALLEL_THRESHOLD, executor=None):
+    """Return how many values in lst equal value."""
+    result = _reduce(lst, 'count', value, workers, threshold, executor)
+
+    if result is None:
+        result = sum(1 for candidate in lst if candidate == value)
+
+    return result
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import doubly_linked_list as dll
+import linked_list
+import parallel
+
+
+class TestParallelReductions(unittest.TestCase):
+    """Test process-pool reductions against the sequential methods."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def run_parallel(self, func, *args):
+        return func(*args, workers=3, threshold=0, executor=self.executor)
+
+    def test_ints(self):
+        lst = linked_list.LinkedList.from_iterable([5, -3, 7, 0, 7, 2, -8])
+        self.assertEqual(self.run_parallel(parallel.find_max, lst), 7)
+        self.assertEqual(self.run_parallel(parallel.find_min, lst), -8)
+        self.assertTrue(self.run_parallel(parallel.search, lst, 2))
+        self.assertFalse(self.run_parallel(parallel.search, lst, 3))
+        self.assertEqual(self.run_parallel(parallel.count, lst, 7), 2)
+
+    def test_floats(self):
+        lst = dll.DoublyLinkedList.from_iterable([0.5, 2.5, -1.5])
+        self.assertEqual(self.run_parallel(parallel.find_max, lst), 2.5)
+        self.assertEqual(self.run_parallel(parallel.count, lst, 0.5), 1)
+
+    def test_sequential_fallback(self):
+        # too big for a 64-bit block, so it stays sequential
+        lst = linked_list.LinkedList.from_iterable([2 ** 70, 1, 3])
+        self.assertEqual(self.run_parallel(parallel.find_max, lst), 2 ** 70)
+        self.assertEqual(self.run_parallel(parallel.count, lst, 3), 1)
+
+        self.assertIsNone(parallel.find_max(linked_list.LinkedList()))
+        self.assertEqual(parallel.count(linked_list.LinkedList(), 1), 0)
+
+        # bools would pack as 0 and 1 and come back as plain ints
+        lst = linked_list.LinkedList.from_iterable([True, False, True])
+        self.assertIsNone(parallel._pack(lst))
+        self.assertIs(self.run_parallel(parallel.find_max, lst), True)
+        self.assertEqual(self.run_parallel(parallel.count, lst, True), 2)
+
+    def test_empty(self):
+        lst = linked_list.LinkedList()
+        self.assertFalse(self.run_parallel(parallel.search, lst, 1))
+        self.assertEqual(self.run_parallel(parallel.count, lst, 1), 0)
+        self.assertIsNone(self.run_parallel(parallel.find_max, lst))
+
+    def test_import_starts_nothing(self):
+        probe = ('import parallel\n'
+                 'from multiprocessing import resource_tracker\n'
+                 'print(resource_tracker._resource_tracker._pid)')
+        out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                             check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(out.stdout.strip(), 'None')
+
+    def test_segments(self):
+        self.assertEqual(parallel._segments(7, 3), [(0, 3), (3, 6), (6, 7)])
+        self.assertEqual(parallel._segments(2, 4), [(0, 1), (1, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
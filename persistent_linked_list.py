@@ -0,0 +1,278 @@
+"""
+Immutable singly linked list with structural sharing.
+
+    v1 = PersistentLinkedList.from_iterable([3, 5, 8])
+    v2 = v1.insert_ascending(4)   # copies 3, shares 5 -> 8 with v1
+    v3 = v2.delete(5)             # copies 3 -> 4, shares 8
+
+Nodes are never changed after they're made, so a version can share any
+suffix of its chain with the versions it came from. Updates return a new
+version and copy only the nodes in front of the change. Holding on to a
+version is an O(1) point-in-time snapshot: writers publish new versions
+by rebinding a reference, and readers walking an old one need no locks.
+"""
+import sys
+
+
+class PersistentNode:
+    """Node whose value and link are fixed at construction."""
+
+    __slots__ = ('_value', '_next_node')
+
+    def __init__(self, value, next_node=None):
+        self._value = value
+        self._next_node = next_node
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def next_node(self):
+        return self._next_node
+
+
+class PersistentLinkedList:
+    """
+    Immutable version of LinkedList.
+
+    insert, append, delete, insert_ascending and reverse return a new
+    list and leave this one unchanged; the read methods match LinkedList.
+    """
+
+    __slots__ = ('_head', '_length')
+
+    def __init__(self, head=None, length=0):
+        self._head = head
+        self._length = length
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a list holding the iterable's values in the same order."""
+        head = None
+        length = 0
+
+        # cons from the back so no node has to change after it's made
+        for value in reversed(list(iterable)):
+            head = PersistentNode(value, head)
+            length += 1
+
+        return cls(head, length)
+
+    def __reduce__(self):
+        # the values, not the shared chain, which pickle would recurse into
+        return type(self).from_iterable, (list(self),)
+
+    def __str__(self):
+        return ' -> '.join(str(value) for value in self)
+
+    # space: O(1)
+    # time: O(n)
+    def __iter__(self):
+        current = self._head
+
+        while current:
+            yield current._value
+            current = current._next_node
+
+    # space: O(n) because the links only go forward
+    # time: O(n)
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    # space: O(k) for the copies of the first k nodes
+    # time: O(k)
+    def _replace_prefix(self, count, new_tail):
+        """
+        Return the head of a chain that copies the first count nodes and
+        then continues with new_tail.
+        """
+        prefix = []
+        current = self._head
+
+        for _ in range(count):
+            prefix.append(current._value)
+            current = current._next_node
+
+        head = new_tail
+
+        for value in reversed(prefix):
+            head = PersistentNode(value, head)
+
+        return head
+
+    # space and time: O(1), the whole chain is shared
+    def insert(self, value):
+        """Return a new list with value at the head."""
+        return PersistentLinkedList(PersistentNode(value, self._head), self._length + 1)
+
+    # space and time: O(n) because every node points toward the tail,
+    # so nothing can be shared
+    def append(self, value):
+        """Return a new list with value at the tail."""
+        head = self._replace_prefix(self._length, PersistentNode(value))
+        return PersistentLinkedList(head, self._length + 1)
+
+    # space: O(k) where k is the insertion index
+    # time: O(k)
+    def insert_ascending(self, value):
+        """
+        Return a new list with value inserted in ascending order.
+
+        Assumes the list is already sorted. The nodes after the insertion
+        point are shared with this list.
+        """
+        index = 0
+        current = self._head
+
+        while current and current._value < value:
+            index += 1
+            current = current._next_node
+
+        head = self._replace_prefix(index, PersistentNode(value, current))
+        return PersistentLinkedList(head, self._length + 1)
+
+    # space: O(k) where k is the index of the deleted node
+    # time: O(n) in the worst case, the value isn't in the list
+    def delete(self, value):
+        """
+        Return a new list without the first node holding value.
+
+        Returns this list itself if the value isn't in it.
+        """
+        index = 0
+        current = self._head
+
+        while current:
+            if current._value == value:
+                head = self._replace_prefix(index, current._next_node)
+                return PersistentLinkedList(head, self._length - 1)
+
+            index += 1
+            current = current._next_node
+
+        return self
+
+    # space: O(n), nothing is shared
+    # time: O(n)
+    def reverse(self):
+        """Return a new list with the values in reverse order."""
+        head = None
+
+        for value in self:
+            head = PersistentNode(value, head)
+
+        return PersistentLinkedList(head, self._length)
+
+    # space: O(1)
+    # time: O(n)
+    def search(self, value):
+        """Search for the given value. Returns True if found; else False."""
+        for candidate in self:
+            if candidate == value:
+                return True
+
+        return False
+
+    # space: O(1)
+    # time: O(n)
+    def find_max(self):
+        """Return the max value in the list; returns None if list is empty."""
+        if not self._head:
+            return None
+
+        return max(self)
+
+    # same as above for space and time
+    def find_min(self):
+        """Return the min value in the list; returns None if list is empty."""
+        if not self._head:
+            return None
+
+        return min(self)
+
+    # space and time: O(1), each version knows its length
+    def length(self):
+        return self._length
+
+    # space: O(1)
+    # time: O(n) where n is the index
+    def find_nth_from_beginning(self, n):
+        """
+        Return value of nth node in the list.
+
+        Raises error if n is not in list range.
+        """
+        if not 0 <= n < self._length:
+            raise IndexError
+
+        current = self._head
+
+        for _ in range(n):
+            current = current._next_node
+
+        return current._value
+
+    # space: O(1)
+    # time: O(n)
+    def find_nth_from_end(self, n):
+        """
+        Return value of nth node from end of list.
+
+        Assumes last node is index 0. (e.g. 3rd from end is idx -4)
+        """
+        if self._length - 1 < n:
+            raise IndexError
+
+        return self.find_nth_from_beginning((self._length - 1) - n)
+
+    def find_middle_value(self):
+        """
+        Return value at middle node in list.
+
+        If length is odd, returns middle node. If even, returns middle
+        rounded down (e.g. length 10 will return element at index 4).
+
+        Returns None if list is empty.
+        """
+        if not self._head:
+            return None
+
+        return self.find_nth_from_beginning((self._length - 1) // 2)
+
+    # space: O(c) for one chunk of c value strings
+    # time: O(n)
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
+
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
+
+        file.write('\n')
+
+    # space and time: O(1)
+    def has_cycle(self):
+        """Always False: a node's link is fixed before anything links to it."""
+        return False
@@ -0,0 +1,80 @@
+import io
+import pickle
+import unittest
+import persistent_linked_list as persistent
+
+
+class TestPersistentLinkedList(unittest.TestCase):
+    """Test immutable linked list with structural sharing."""
+
+    def setUp(self):
+        self.empty_list = persistent.PersistentLinkedList()
+        self.lst = persistent.PersistentLinkedList.from_iterable([-3, 4, -3, 5, 20])
+
+    def test_methods(self):
+        lst = self.lst
+        self.assertEqual(str(lst), '-3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(list(reversed(lst)), [20, 5, -3, 4, -3])
+        self.assertEqual(lst.length(), 5)
+        self.assertIn(5, lst)
+        self.assertNotIn(6, lst)
+        self.assertEqual(lst.find_max(), 20)
+        self.assertEqual(lst.find_min(), -3)
+        self.assertEqual(lst.find_nth_from_beginning(1), 4)
+        self.assertEqual(lst.find_nth_from_end(1), 5)
+        self.assertEqual(lst.find_middle_value(), -3)
+        self.assertFalse(lst.has_cycle())
+
+        self.assertIsNone(self.empty_list.find_max())
+        self.assertIsNone(self.empty_list.find_middle_value())
+
+        with self.assertRaises(IndexError):
+            lst.find_nth_from_end(5)
+
+        out = io.StringIO()
+        lst.visit(out)
+        self.assertEqual(out.getvalue(), '-3 4 -3 5 20 \n')
+
+    def test_updates_leave_old_versions(self):
+        v1 = self.lst
+        v2 = v1.insert(0)
+        v3 = v2.delete(-3)
+        v4 = v3.append(9)
+        v5 = v4.reverse()
+
+        self.assertEqual(str(v1), '-3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(str(v2), '0 -> -3 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(str(v3), '0 -> 4 -> -3 -> 5 -> 20')
+        self.assertEqual(str(v4), '0 -> 4 -> -3 -> 5 -> 20 -> 9')
+        self.assertEqual(str(v5), '9 -> 20 -> 5 -> -3 -> 4 -> 0')
+        self.assertEqual([len(v) for v in (v1, v2, v3, v4, v5)], [5, 6, 5, 6, 6])
+
+        self.assertIs(v1.delete(7), v1)
+
+    def test_structural_sharing(self):
+        v1 = self.lst
+        self.assertIs(v1.insert(0)._head.next_node, v1._head)
+
+        # only the nodes before the change are copied
+        v2 = v1.delete(4)
+        self.assertIsNot(v2._head, v1._head)
+        self.assertIs(v2._head.next_node, v1._head.next_node.next_node)
+
+    def test_insert_ascending(self):
+        v1 = persistent.PersistentLinkedList.from_iterable([1, 5, 9])
+        v2 = v1.insert_ascending(5)
+        self.assertEqual(str(v2), '1 -> 5 -> 5 -> 9')
+        self.assertIs(v2._head.next_node.next_node, v1._head.next_node)
+
+        self.assertEqual(str(self.empty_list.insert_ascending(2)), '2')
+        self.assertEqual(str(v1.insert_ascending(10)), '1 -> 5 -> 9 -> 10')
+
+    def test_pickle(self):
+        lst = persistent.PersistentLinkedList.from_iterable(range(5000))
+        copied = pickle.loads(pickle.dumps(lst))
+        self.assertEqual(list(copied), list(range(5000)))
+        self.assertEqual(copied.length(), 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
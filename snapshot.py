@@ -0,0 +1,246 @@
+"""
+Compact binary snapshots of LinkedList and DoublyLinkedList.
+
+    snapshot.save(lst, 'lst.snap')
+    lst = snapshot.load('lst.snap')
+
+Both take a path or a binary file object and stream the list in chunks,
+so memory stays flat however long the list is. The format is
+
+    header  magic b'LLSNAP', version, list kind, flags, value count,
+            crc32 of those fields
+    blocks  typecode, value count, byte length, crc32 of those fields
+            and the payload, then the payload
+    trailer crc32 of the header and every block
+
+A chunk of ints that fit in 64 bits is written as a packed 'q' array and
+a chunk of floats as a 'd' array, little-endian. Any other chunk is
+pickled. The header and each block are checked against their crc32
+before they're used, so corrupt bytes are never unpickled.
+"""
+import gc
+import pickle
+import struct
+import sys
+import zlib
+from array import array
+from itertools import islice
+
+from doubly_linked_list import DoublyLinkedList
+from linked_list import LinkedList
+
+MAGIC = b'LLSNAP'
+VERSION = 2
+
+# position in KINDS is the kind byte in the header
+KINDS = (LinkedList, DoublyLinkedList)
+
+TRACK_EXTREMA = 1
+INDEXED = 2
+
+HEADER = struct.Struct('<6sBBBQI')
+HEADER_FIELDS = HEADER.size - 4  # the bytes the header's crc32 covers
+BLOCK = struct.Struct('<cIQI')
+BLOCK_FIELDS = BLOCK.size - 4  # the bytes the block's crc32 covers
+TRAILER = struct.Struct('<I')
+
+PICKLED = b'p'
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class _Opened:
+    """Context manager that opens a path but leaves file objects alone."""
+
+    def __init__(self, file, mode):
+        self._file = file
+        self._mode = mode
+        self._opened = None
+
+    def __enter__(self):
+        if hasattr(self._file, 'read' if 'r' in self._mode else 'write'):
+            return self._file
+
+        self._opened = open(self._file, self._mode)
+        return self._opened
+
+    def __exit__(self, *exc_info):
+        if self._opened:
+            self._opened.close()
+
+
+def _encode(chunk):
+    """Return (typecode, payload bytes) for a chunk of values."""
+    typecode = None
+
+    if all(type(value) is int for value in chunk):
+        typecode = 'q'
+    elif all(type(value) is float for value in chunk):
+        typecode = 'd'
+
+    if typecode:
+        try:
+            packed = array(typecode, chunk)
+        except OverflowError:
+            pass
+        else:
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            return typecode.encode(), packed.tobytes()
+
+    return PICKLED, pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(typecode, payload):
+    if typecode == PICKLED:
+        return pickle.loads(payload)
+
+    values = array(typecode.decode())
+    values.frombytes(payload)
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+def _pack_checked(layout, fields, payload=b''):
+    """Pack fields, then the crc32 of their bytes followed by payload."""
+    packed = layout.pack(*fields, 0)[:-4]
+    return packed + struct.pack('<I', zlib.crc32(payload, zlib.crc32(packed)))
+
+
+def _read_exactly(file, size):
+    try:
+        data = file.read(size)
+    except (OverflowError, MemoryError):
+        # only a corrupt length asks for more than memory can hold
+        raise ValueError('snapshot is corrupt') from None
+
+    if len(data) != size:
+        raise ValueError('snapshot is truncated')
+
+    return data
+
+
+# space: O(c) for one chunk of c values and its encoding
+# time: O(n)
+def save(lst, file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write lst to file, a path or a binary file object."""
+    for kind, cls in enumerate(KINDS):
+        if isinstance(lst, cls):
+            break
+    else:
+        raise TypeError('cannot snapshot {}'.format(type(lst).__name__))
+
+    flags = 0
+
+    if lst._track_extrema:
+        flags |= TRACK_EXTREMA
+
+    if getattr(lst, '_index', None) is not None:
+        flags |= INDEXED
+
+    values = iter(lst)
+
+    with _Opened(file, 'wb') as f:
+        header = _pack_checked(HEADER, (MAGIC, VERSION, kind, flags, lst.length()))
+        crc = zlib.crc32(header)
+        f.write(header)
+
+        while True:
+            chunk = list(islice(values, chunk_size))
+
+            if not chunk:
+                break
+
+            typecode, payload = _encode(chunk)
+            block = _pack_checked(BLOCK, (typecode, len(chunk), len(payload)), payload)
+            crc = zlib.crc32(payload, zlib.crc32(block, crc))
+            f.write(block)
+            f.write(payload)
+
+        f.write(TRAILER.pack(crc))
+
+
+def _load_blocks(file, lst, count, crc):
+    """
+    Extend lst with count values read block by block.
+
+    crc is the running checksum so far; returns it updated.
+    """
+    remaining = count
+
+    while remaining:
+        block = _read_exactly(file, BLOCK.size)
+        typecode, block_count, size, block_crc = BLOCK.unpack(block)
+        payload = _read_exactly(file, size)
+
+        if zlib.crc32(payload, zlib.crc32(block[:BLOCK_FIELDS])) != block_crc:
+            raise ValueError('snapshot checksum mismatch')
+
+        crc = zlib.crc32(payload, zlib.crc32(block, crc))
+
+        # a block that passed its checksum but still won't decode was
+        # written wrong, not damaged in transit; report it the same way
+        try:
+            values = _decode(typecode, payload)
+        except Exception as exc:
+            raise ValueError('snapshot block is corrupt') from exc
+
+        if len(values) != block_count or block_count > remaining:
+            raise ValueError('snapshot block is corrupt')
+
+        lst.extend(values)
+        remaining -= block_count
+
+    return crc
+
+
+# space: O(c) for one block, plus the list itself
+# time: O(n)
+def load(file):
+    """
+    Read a list written by save from file, a path or a binary file object.
+
+    Raises ValueError if the data isn't a snapshot, is truncated or fails
+    its checksum. Blocks of values other than ints and floats are pickled,
+    so only load snapshots you trust.
+    """
+    with _Opened(file, 'rb') as f:
+        header = _read_exactly(f, HEADER.size)
+        magic, version, kind, flags, count, header_crc = HEADER.unpack(header)
+
+        if magic != MAGIC:
+            raise ValueError('not a linked list snapshot')
+
+        if zlib.crc32(header[:HEADER_FIELDS]) != header_crc:
+            raise ValueError('snapshot checksum mismatch')
+
+        if version != VERSION or kind >= len(KINDS):
+            raise ValueError('unsupported snapshot version {} kind {}'.format(
+                version, kind))
+
+        kwargs = {'track_extrema': bool(flags & TRACK_EXTREMA)}
+
+        if KINDS[kind] is DoublyLinkedList:
+            kwargs['indexed'] = bool(flags & INDEXED)
+
+        lst = KINDS[kind](**kwargs)
+
+        # every node made here stays alive, so the collector passes their
+        # allocations would trigger only rescan the growing chain
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            crc = _load_blocks(f, lst, count, zlib.crc32(header))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        expected, = TRAILER.unpack(_read_exactly(f, TRAILER.size))
+
+        if crc != expected:
+            raise ValueError('snapshot checksum mismatch')
+
+    return lst
@@ -0,0 +1,95 @@
+import io
+import os
+import tempfile
+import unittest
+import doubly_linked_list as dll
+import linked_list
+import snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test saving and loading lists in the binary snapshot format."""
+
+    def round_trip(self, lst, **kwargs):
+        buffer = io.BytesIO()
+        snapshot.save(lst, buffer, **kwargs)
+        buffer.seek(0)
+        return snapshot.load(buffer)
+
+    def test_numeric_blocks(self):
+        values = list(range(-5, 1000)) + [2 ** 63 - 1]
+        loaded = self.round_trip(linked_list.LinkedList.from_iterable(values),
+                                 chunk_size=100)
+        self.assertIs(type(loaded), linked_list.LinkedList)
+        self.assertEqual(list(loaded), values)
+
+        floats = [0.5, -1e300, float('inf')]
+        loaded = self.round_trip(dll.DoublyLinkedList.from_iterable(floats))
+        self.assertEqual(list(reversed(loaded)), floats[::-1])
+
+    def test_other_values_are_pickled(self):
+        values = [1, 'a', None, 2 ** 70, True, (1, 2)]
+        lst = linked_list.LinkedList.from_iterable(values)
+        self.assertEqual(list(self.round_trip(lst, chunk_size=4)), values)
+
+        buffer = io.BytesIO()
+        snapshot.save(lst, buffer)
+        self.assertEqual(buffer.getvalue()[snapshot.HEADER.size:][:1], b'p')
+
+    def test_flags(self):
+        lst = dll.DoublyLinkedList.from_iterable([3, 1, 3], indexed=True,
+                                                 track_extrema=True)
+        loaded = self.round_trip(lst)
+        self.assertEqual(len(loaded._index[3]), 2)
+        self.assertEqual(loaded.find_min(), 1)
+        self.assertEqual(loaded.find_middle_value(), 1)
+
+        loaded = self.round_trip(linked_list.LinkedList(track_extrema=True))
+        self.assertTrue(loaded._track_extrema)
+        self.assertEqual(loaded.length(), 0)
+
+    def test_path(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        snapshot.save(linked_list.LinkedList.from_iterable(range(10)), path)
+        self.assertEqual(list(snapshot.load(path)), list(range(10)))
+
+    def test_rejects_bad_data(self):
+        buffer = io.BytesIO()
+        snapshot.save(linked_list.LinkedList.from_iterable(range(10)), buffer)
+        data = buffer.getvalue()
+
+        with self.assertRaisesRegex(ValueError, 'not a linked list snapshot'):
+            snapshot.load(io.BytesIO(b'x' + data[1:]))
+
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            snapshot.load(io.BytesIO(data[:-6]))
+
+        corrupt = bytearray(data)
+        corrupt[-10] ^= 1
+        with self.assertRaisesRegex(ValueError, 'checksum'):
+            snapshot.load(io.BytesIO(bytes(corrupt)))
+
+        with self.assertRaises(TypeError):
+            snapshot.save([1, 2], io.BytesIO())
+
+    def test_corrupt_block_is_never_unpickled(self):
+        buffer = io.BytesIO()
+        values = ['a', None, (1, 2)] * 4
+        snapshot.save(linked_list.LinkedList.from_iterable(values), buffer,
+                      chunk_size=5)
+        data = buffer.getvalue()
+
+        # every single-bit flip, in any field or payload, is a ValueError
+        for position in range(len(data)):
+            corrupt = bytearray(data)
+            corrupt[position] ^= 0x80
+
+            with self.assertRaises(ValueError):
+                snapshot.load(io.BytesIO(bytes(corrupt)))
+
+
+if __name__ == '__main__':
+    unittest.main()
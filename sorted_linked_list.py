@@ -0,0 +1,300 @@
+import random
+import sys
+
+from linked_list import Node
+
+
+class SkipNode(Node):
+    """
+    Node with express lanes for the skip list.
+
+    next_node is the ordinary level 0 link, so the bottom level is a plain
+    singly linked chain. _skips[i - 1] is the link at level i.
+    """
+
+    __slots__ = ('_skips',)
+
+    def __init__(self, value, level):
+        super().__init__(value)
+        self._skips = [None] * (level - 1)
+
+    @property
+    def level(self):
+        return len(self._skips) + 1
+
+
+class SortedLinkedList:
+    """
+    Sorted singly linked list indexed by a probabilistic skip list.
+
+    Each node is promoted to the next level with probability 1/2, which
+    gives expected O(log n) insert_ascending, search and delete.
+    """
+
+    MAX_LEVEL = 32
+
+    def __init__(self, seed=None):
+        # the header is a sentinel whose value is never read
+        self._header = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self._tail = None
+        self._length = 0
+        self._random = random.Random(seed)
+
+    def __str__(self):
+        return ' -> '.join(str(value) for value in self)
+
+    def __iter__(self):
+        current = self._header._next_node
+
+        while current:
+            yield current._value
+            current = current._next_node
+
+    # space: O(n), nodes are only linked forward
+    # time: O(n)
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def _random_level(self):
+        level = 1
+        rand = self._random.random
+
+        while level < self.MAX_LEVEL and rand() < 0.5:
+            level += 1
+
+        return level
+
+    # space: O(log n) for the list of predecessors
+    # time: O(log n) expected
+    def _find_predecessors(self, value):
+        """
+        Return the last node before value on every level.
+
+        update[i] is the predecessor at level i. Stops before the first node
+        equal to value, so a new duplicate is linked in front of the older
+        ones and delete removes the most recently inserted.
+        """
+        update = [self._header] * self.MAX_LEVEL
+        current = self._header
+
+        for i in range(self._level - 1, 0, -1):
+            next_node = current._skips[i - 1]
+
+            while next_node and next_node._value < value:
+                current = next_node
+                next_node = current._skips[i - 1]
+
+            update[i] = current
+
+        next_node = current._next_node
+
+        while next_node and next_node._value < value:
+            current = next_node
+            next_node = current._next_node
+
+        update[0] = current
+        return update
+
+    # space: O(log n) expected for the node's links
+    # time: O(log n) expected
+    def insert_ascending(self, value):
+        """Insert new node with the given value in ascending order."""
+        update = self._find_predecessors(value)
+        level = self._random_level()
+        new_node = SkipNode(value, level)
+
+        if level > self._level:
+            self._level = level
+
+        for i in range(1, level):
+            previous = update[i]
+            new_node._skips[i - 1] = previous._skips[i - 1]
+            previous._skips[i - 1] = new_node
+
+        previous = update[0]
+        new_node._next_node = previous._next_node
+        previous._next_node = new_node
+
+        if not new_node._next_node:
+            self._tail = new_node
+
+        self._length += 1
+
+    # the list is always sorted, so inserting at the head would break it
+    insert = insert_ascending
+
+    # space: O(log n)
+    # time: O(log n) expected
+    def search(self, value):
+        """Search for the given value. Returns True if found; else False."""
+        candidate = self._find_predecessors(value)[0]._next_node
+        return candidate is not None and candidate._value == value
+
+    # space: O(log n)
+    # time: O(log n) expected
+    def delete(self, value):
+        """
+        Delete the first node found with the specified value.
+
+        Returns the deleted node if found; else None.
+        """
+        update = self._find_predecessors(value)
+        deleted = update[0]._next_node
+
+        if not deleted or deleted._value != value:
+            return None
+
+        for i in range(1, deleted.level):
+            update[i]._skips[i - 1] = deleted._skips[i - 1]
+
+        update[0]._next_node = deleted._next_node
+
+        if deleted is self._tail:
+            self._tail = update[0] if update[0] is not self._header else None
+
+        while self._level > 1 and not self._header._skips[self._level - 2]:
+            self._level -= 1
+
+        self._length -= 1
+        return deleted
+
+    # space and time: O(1), the smallest value is the first node
+    def find_min(self):
+        """Return the min value in the list; returns None if list is empty."""
+        first = self._header._next_node
+        return first._value if first else None
+
+    # space and time: O(1), the largest value is the tail
+    def find_max(self):
+        """Return the max value in the list; returns None if list is empty."""
+        return self._tail._value if self._tail else None
+
+    # space and time: O(1), the length is tracked
+    def length(self):
+        return self._length
+
+    # space: O(1)
+    # time: O(n) where n is the index, skip links don't carry widths
+    def find_nth_from_beginning(self, n):
+        """
+        Return value of nth node in the list.
+
+        Raises error if n is not in list range.
+        """
+        current = self._header._next_node
+        counter = 0
+
+        while current:
+            if counter == n:
+                return current._value
+
+            counter += 1
+            current = current._next_node
+
+        raise IndexError
+
+    def find_nth_from_end(self, n):
+        """
+        Return value of nth node from end of list.
+
+        Assumes last node is index 0. (e.g. 3rd from end is idx -4)
+        """
+        if self._length - 1 < n:
+            raise IndexError
+
+        return self.find_nth_from_beginning((self._length - 1) - n)
+
+    def find_middle_value(self):
+        """
+        Return value at middle node in list.
+
+        If length is even, returns middle rounded down.
+
+        Returns None if list is empty.
+        """
+        if not self._length:
+            return None
+
+        return self.find_nth_from_beginning((self._length - 1) // 2)
+
+    # space: O(log n) for the predecessor search
+    # time: O(log n + k) expected, where k is the number of values yielded
+    def iter_range(self, low, high):
+        """Yield values v with low <= v < high in ascending order."""
+        current = self._find_predecessors(low)[0]._next_node
+
+        while current and current._value < high:
+            yield current._value
+            current = current._next_node
+
+    # space: O(c) for one chunk of c value strings
+    # time: O(n), with one write per chunk instead of one print per value
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
+
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
+
+        file.write('\n')
+
+    def reverse(self):
+        """Sorted lists can't be reversed in place."""
+        raise TypeError('a SortedLinkedList is always ascending')
+
+    # space: O(1), Brent's algorithm on the bottom level, as in LinkedList
+    # time: O(n)
+    def has_cycle(self):
+        first = self._header._next_node
+
+        if not first:
+            return False
+
+        power = cycle_len = 1
+        tortoise = first
+        hare = first._next_node
+
+        while hare is not tortoise:
+            if hare is None:
+                return False
+
+            if power == cycle_len:
+                tortoise = hare
+                power *= 2
+                cycle_len = 0
+
+            hare = hare._next_node
+            cycle_len += 1
+
+        return True
+
+    def create_cycle(self):
+        """Create a cycle on the bottom level for testing purposes."""
+        # do nothing if empty list
+        if not self._tail:
+            return
+
+        # cycle back to head
+        self._tail._next_node = self._header._next_node
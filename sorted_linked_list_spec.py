@@ -0,0 +1,77 @@
+import unittest
+import linked_list_spec
+import sorted_linked_list as sll
+
+
+class TestSortedLinkedListClass(linked_list_spec.ListBehavior, unittest.TestCase):
+    """
+    Test skip list backed sorted linked list.
+
+    insert keeps ascending order, so the shared behaviour tests expect the
+    fixtures sorted.
+    """
+
+    def make_list(self):
+        return sll.SortedLinkedList(seed=1)
+
+    order = staticmethod(sorted)
+
+    def test_insert(self):
+        self.assertEqual(str(self.empty_list), '')
+        self.assertEqual(str(self.small_list), '2')
+        self.assertEqual(str(self.large_list), '-3 -> -3 -> 4 -> 5 -> 20')
+
+    def test_delete_newest_duplicate(self):
+        lst = self.large_list
+        oldest = lst._header._next_node
+        lst.insert(-3)
+        newest = lst._header._next_node
+
+        self.assertIsNot(newest, oldest)
+        self.assertIs(lst.delete(-3), newest)
+        self.assertEqual(str(lst), '-3 -> -3 -> 4 -> 5 -> 20')
+        self.assertEqual(lst.find_max(), 20)
+
+    def test_iter_range(self):
+        lst = self.large_list
+        self.assertEqual(list(lst.iter_range(-3, 5)), [-3, -3, 4])
+        self.assertEqual(list(lst.iter_range(0, 100)), [4, 5, 20])
+        self.assertEqual(list(lst.iter_range(6, 10)), [])
+
+    def test_matches_sorted(self):
+        lst = sll.SortedLinkedList(seed=7)
+        values = [(i * 37) % 101 for i in range(300)]
+        for value in values:
+            lst.insert_ascending(value)
+        for value in values[::3]:
+            lst.delete(value)
+            values.remove(value)
+
+        values.sort()
+        self.assertEqual(str(lst), ' -> '.join(str(v) for v in values))
+        self.assertEqual(lst.find_max(), values[-1])
+        self.assertEqual(lst.length(), len(values))
+
+    def test_reverse(self):
+        with self.assertRaises(TypeError):
+            self.large_list.reverse()
+
+    def test_has_cycle(self):
+        self.assertFalse(self.empty_list.has_cycle())
+        self.assertFalse(self.large_list.has_cycle())
+        self.large_list.create_cycle()
+        self.assertTrue(self.large_list.has_cycle())
+
+        self.small_list.create_cycle()  # one node linked to itself
+        self.assertTrue(self.small_list.has_cycle())
+
+        # close the bottom level on the third node
+        lst = self.medium_list
+        lst.insert(20)
+        lst.insert(30)  # list of [-2, 0, 10, 20, 30]
+        lst._tail._next_node = lst._header._next_node._next_node._next_node
+        self.assertTrue(lst.has_cycle())
+
+
+if __name__ == '__main__':
+    unittest.main()
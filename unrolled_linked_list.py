@@ -0,0 +1,432 @@
+import sys
+from bisect import bisect_left
+
+from linked_list import Node
+
+
+class Block:
+    """Fixed-capacity chunk of values used by the unrolled linked list."""
+
+    __slots__ = ('_values', '_next_block')
+
+    def __init__(self, values=None):
+        self._values = values if values is not None else []
+        self._next_block = None
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def next_block(self):
+        return self._next_block
+
+    @next_block.setter
+    def next_block(self, next_block):
+        self._next_block = next_block
+
+
+class UnrolledLinkedList:
+    """
+    Linked list of Blocks, each holding up to `capacity` values.
+
+    Exposes the same methods as LinkedList, but a hop moves across a whole
+    block, so there are roughly capacity times fewer nodes to chase.
+    """
+
+    def __init__(self, capacity=64):
+        if capacity < 2:
+            raise ValueError('capacity must be at least 2')
+
+        self._capacity = capacity
+        self._head = None
+        self._tail = None
+        self._length = 0
+
+    def __str__(self):
+        return ' -> '.join(str(value) for value in self)
+
+    def __iter__(self):
+        current = self._head
+
+        while current:
+            yield from current._values
+            current = current._next_block
+
+    # space: O(n / c) for the list of blocks, blocks are only linked forward
+    # time: O(n)
+    def __reversed__(self):
+        blocks = []
+        current = self._head
+
+        while current:
+            blocks.append(current)
+            current = current._next_block
+
+        for block in reversed(blocks):
+            yield from reversed(block._values)
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def _split(self, block):
+        """Move the upper half of a full block into a new block after it."""
+        half = len(block._values) // 2
+        new_block = Block(block._values[half:])
+        del block._values[half:]
+
+        new_block._next_block = block._next_block
+        block._next_block = new_block
+
+        if block is self._tail:
+            self._tail = new_block
+
+        return new_block
+
+    def _merge_next(self, block):
+        """
+        Absorb the following block if both fit in one.
+
+        block must not be empty; callers unlink empty blocks with
+        _remove_block instead.
+        """
+        next_block = block._next_block
+
+        if next_block and len(block._values) + len(next_block._values) <= self._capacity:
+            block._values.extend(next_block._values)
+            block._next_block = next_block._next_block
+
+            if next_block is self._tail:
+                self._tail = block
+
+    def _remove_block(self, previous, block):
+        """Unlink an empty block; previous is None when block is the head."""
+        if previous:
+            previous._next_block = block._next_block
+        else:
+            self._head = block._next_block
+
+        if block is self._tail:
+            self._tail = previous
+
+    # space: O(1) amortized, a new block is only made when the head is full
+    # time: O(c) where c is the block capacity, for the shift within the block
+    def insert(self, value):
+        """Insert given value at the head of the linked list."""
+        if not self._head or len(self._head._values) >= self._capacity:
+            new_block = Block([value])
+            new_block._next_block = self._head
+            self._head = new_block
+
+            if not self._tail:
+                self._tail = new_block
+        else:
+            self._head._values.insert(0, value)
+
+        self._length += 1
+
+    # space: O(1) amortized
+    # time: O(1) because the tail block is tracked
+    def append(self, value):
+        """Insert given value at the tail of the linked list."""
+        if not self._tail or len(self._tail._values) >= self._capacity:
+            new_block = Block([value])
+
+            if self._tail:
+                self._tail._next_block = new_block
+            else:
+                self._head = new_block
+
+            self._tail = new_block
+        else:
+            self._tail._values.append(value)
+
+        self._length += 1
+
+    # time: O(c) for the shift within the head block
+    def pop_front(self):
+        """
+        Remove the first value and return it.
+
+        Raises IndexError if the list is empty.
+        """
+        if not self._head:
+            raise IndexError
+
+        value = self._head._values.pop(0)
+
+        if not self._head._values:
+            self._remove_block(None, self._head)
+
+        self._length -= 1
+        return value
+
+    # time: O(n / c) because the block before the tail has to be found
+    # when the tail block empties; O(1) otherwise
+    def pop_back(self):
+        """
+        Remove the last value and return it.
+
+        Raises IndexError if the list is empty.
+        """
+        if not self._tail:
+            raise IndexError
+
+        value = self._tail._values.pop()
+
+        if not self._tail._values:
+            previous = None
+            current = self._head
+
+            while current is not self._tail:
+                previous = current
+                current = current._next_block
+
+            self._remove_block(previous, current)
+
+        self._length -= 1
+        return value
+
+    # space: O(1)
+    # time: O(n), but each block is scanned by list.__contains__ in C
+    def search(self, value):
+        """Search for the given value. Returns True if found; else False."""
+        current = self._head
+
+        while current:
+            if value in current._values:
+                return True
+            current = current._next_block
+
+        return False
+
+    # space: O(1)
+    # time: O(n), scanning each block with the builtin max
+    def find_max(self):
+        """Return the max value in the list; returns None if list is empty."""
+        if not self._head:
+            return None
+
+        max_so_far = max(self._head._values)
+        current = self._head._next_block
+
+        while current:
+            block_max = max(current._values)
+            if block_max > max_so_far:
+                max_so_far = block_max
+            current = current._next_block
+
+        return max_so_far
+
+    # same as above for space and time
+    def find_min(self):
+        """Return the min value in the list; returns None if list is empty."""
+        if not self._head:
+            return None
+
+        min_so_far = min(self._head._values)
+        current = self._head._next_block
+
+        while current:
+            block_min = min(current._values)
+            if block_min < min_so_far:
+                min_so_far = block_min
+            current = current._next_block
+
+        return min_so_far
+
+    # space and time: O(1), the length is tracked
+    def length(self):
+        return self._length
+
+    # space: O(1)
+    # time: O(n / c) because whole blocks are skipped by their length
+    def find_nth_from_beginning(self, n):
+        """
+        Return value of nth item in the list.
+
+        Raises error if n is not in list range.
+        """
+        if n < 0:
+            raise IndexError
+
+        current = self._head
+
+        while current:
+            block_len = len(current._values)
+
+            if n < block_len:
+                return current._values[n]
+
+            n -= block_len
+            current = current._next_block
+
+        raise IndexError
+
+    # space: O(1) unless a block splits
+    # time: O(n / c + c), walking blocks then bisecting and shifting in one
+    def insert_ascending(self, value):
+        """
+        Insert the given value in ascending order.
+
+        Assumes the list is already sorted.
+        """
+        if not self._head or value <= self._head._values[0]:
+            self.insert(value)
+            return
+
+        # find the first block whose last value isn't smaller than value
+        current = self._head
+
+        while current._next_block and current._values[-1] < value:
+            current = current._next_block
+
+        if len(current._values) >= self._capacity:
+            new_block = self._split(current)
+
+            if current._values[-1] < value:
+                current = new_block
+
+        current._values.insert(bisect_left(current._values, value), value)
+        self._length += 1
+
+    # space: O(c) for one chunk of c value strings
+    # time: O(n), with one write per chunk instead of one print per value
+    def visit(self, file=None, chunk_size=4096):
+        """
+        Write all values in the linked list to file (stdout by default).
+
+        Each value is followed by a space and the output ends with a
+        newline, so an empty list writes just the newline.
+        """
+        if file is None:
+            file = sys.stdout
+
+        chunk = []
+
+        for value in self:
+            chunk.append(str(value))
+
+            if len(chunk) >= chunk_size:
+                file.write(' '.join(chunk) + ' ')
+                chunk.clear()
+
+        if chunk:
+            file.write(' '.join(chunk) + ' ')
+
+        file.write('\n')
+
+    # space: O(1)
+    # time: O(n) in the worst case, the value isn't in the list
+    def delete(self, value):
+        """
+        Delete the first occurrence of the specified value.
+
+        Returns a detached Node holding the value if found; else None.
+        """
+        previous = None
+        current = self._head
+
+        while current:
+            values = current._values
+
+            if value in values:
+                idx = values.index(value)
+                deleted = values.pop(idx)
+                self._length -= 1
+
+                if not values:
+                    self._remove_block(previous, current)
+                elif len(values) < self._capacity // 2:
+                    self._merge_next(current)
+
+                return Node(deleted)
+
+            previous = current
+            current = current._next_block
+
+        return None
+
+    # space: O(1)
+    # time: O(n), but the per-value work is list.reverse in C
+    def reverse(self):
+        """Reverse the linked list iteratively."""
+        if not self._head:
+            return
+
+        previous = None
+        current = self._head
+
+        while current:
+            next_block = current._next_block
+            current._next_block = previous
+            current._values.reverse()
+
+            previous = current
+            current = next_block
+
+        self._tail = self._head
+        self._head = previous
+
+    def find_middle_value(self):
+        """
+        Return value at middle of list.
+
+        If length is odd, returns middle value. If even, returns middle
+        rounded down (e.g. length 10 will return element at index 4).
+
+        Returns None if list is empty.
+        """
+        if not self._head:
+            return None
+
+        return self.find_nth_from_beginning((self._length - 1) // 2)
+
+    # space: O(1)
+    # time: O(n / c), using the tracked length
+    def find_nth_from_end(self, n):
+        """
+        Return value of nth item from end of list.
+
+        Assumes last item is index 0. (e.g. 3rd from end is idx -4)
+        """
+        if self._length - 1 < n:
+            raise IndexError
+
+        return self.find_nth_from_beginning((self._length - 1) - n)
+
+    # space: O(1), Brent's algorithm over the blocks, as in LinkedList
+    # time: O(n / c)
+    def has_cycle(self):
+        if not self._head:
+            return False
+
+        power = cycle_len = 1
+        tortoise = self._head
+        hare = self._head._next_block
+
+        while hare is not tortoise:
+            if hare is None:
+                return False
+
+            if power == cycle_len:
+                tortoise = hare
+                power *= 2
+                cycle_len = 0
+
+            hare = hare._next_block
+            cycle_len += 1
+
+        return True
+
+    def create_cycle(self):
+        """Create a cycle for testing purposes."""
+        # do nothing if empty list
+        if not self._head:
+            return
+
+        # cycle back to head
+        self._tail._next_block = self._head
@@ -0,0 +1,144 @@
+import unittest
+import linked_list_spec
+import unrolled_linked_list as ull
+
+
+class TestUnrolledLinkedListClass(linked_list_spec.ListBehavior, unittest.TestCase):
+    """
+    Test unrolled linked list.
+
+    Uses a tiny block capacity so splits and merges happen on small lists.
+    """
+
+    def make_list(self):
+        return ull.UnrolledLinkedList(capacity=2)
+
+    def order(self, values):
+        return values[::-1]
+
+    def test_capacity(self):
+        with self.assertRaises(ValueError):
+            ull.UnrolledLinkedList(capacity=1)
+
+    def test_insert(self):
+        self.assertEqual(str(self.empty_list), '')
+        self.assertEqual(str(self.small_list), '2')
+        self.assertEqual(str(self.medium_list), '10 -> -2 -> 0')
+        self.assertEqual(str(self.large_list), '-3 -> 4 -> -3 -> 5 -> 20')
+
+    def test_length(self):
+        self.assertEqual(self.empty_list.length(), 0)
+        self.assertEqual(self.medium_list.length(), 3)
+        self.assertEqual(self.large_list.length(), 5)
+
+    def test_search(self):
+        self.assertFalse(self.empty_list.search(2))
+        self.assertTrue(self.small_list.search(2))
+        self.assertTrue(self.large_list.search(20))
+        self.assertFalse(self.large_list.search(0))
+
+    def test_find_max_and_min(self):
+        self.assertIsNone(self.empty_list.find_max())
+        self.assertIsNone(self.empty_list.find_min())
+        self.assertEqual(self.large_list.find_max(), 20)
+        self.assertEqual(self.large_list.find_min(), -3)
+
+    def test_find_nth_from_beginning(self):
+        with self.assertRaises(IndexError):
+            self.empty_list.find_nth_from_beginning(0)
+        with self.assertRaises(IndexError):
+            self.medium_list.find_nth_from_beginning(5)
+
+        for idx, value in enumerate([-3, 4, -3, 5, 20]):
+            self.assertEqual(self.large_list.find_nth_from_beginning(idx), value)
+
+    def test_insert_ascending(self):
+        lst = self.empty_list
+        for value in [5, 1, 3, 3, 10, -2, 4, 7]:
+            lst.insert_ascending(value)
+
+        self.assertEqual(str(lst), '-2 -> 1 -> 3 -> 3 -> 4 -> 5 -> 7 -> 10')
+        self.assertEqual(lst.length(), 8)
+        self.assertEqual(lst.find_nth_from_end(0), 10)
+
+    def test_append_and_pop(self):
+        lst = self.medium_list
+        lst.append(1)
+        lst.append(2)
+        self.assertEqual(str(lst), '10 -> -2 -> 0 -> 1 -> 2')
+
+        self.assertEqual(lst.pop_front(), 10)
+        self.assertEqual(lst.pop_back(), 2)
+        self.assertEqual(lst.pop_back(), 1)
+        self.assertEqual(str(lst), '-2 -> 0')
+
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_front()
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+
+    def test_delete(self):
+        self.assertIsNone(self.empty_list.delete(10))
+        self.assertEqual(self.small_list.delete(2).value, 2)
+        self.assertEqual(str(self.small_list), '')
+
+        lst = self.large_list
+        self.assertEqual(lst.delete(-3).value, -3)
+        self.assertEqual(str(lst), '4 -> -3 -> 5 -> 20')
+        self.assertEqual(lst.delete(20).value, 20)
+        self.assertEqual(lst.delete(4).value, 4)
+        self.assertEqual(str(lst), '-3 -> 5')
+        self.assertIsNone(lst.delete(100))
+
+        lst.append(1)
+        self.assertEqual(str(lst), '-3 -> 5 -> 1')
+
+    def test_reverse(self):
+        self.empty_list.reverse()
+        self.assertEqual(str(self.empty_list), '')
+
+        self.large_list.reverse()
+        self.assertEqual(str(self.large_list), '20 -> 5 -> -3 -> 4 -> -3')
+
+        self.large_list.append(0)
+        self.assertEqual(self.large_list.find_nth_from_end(0), 0)
+
+    def test_find_middle_value(self):
+        self.assertIsNone(self.empty_list.find_middle_value())
+        self.assertEqual(self.large_list.find_middle_value(), -3)
+
+        self.large_list.append(6)  # [-3, 4, -3, 5, 20, 6]
+        self.assertEqual(self.large_list.find_middle_value(), -3)
+
+    def test_find_nth_from_end(self):
+        with self.assertRaises(IndexError):
+            self.empty_list.find_nth_from_end(0)
+
+        self.assertEqual(self.large_list.find_nth_from_end(0), 20)
+        self.assertEqual(self.large_list.find_nth_from_end(3), 4)
+        self.assertEqual(self.large_list.find_nth_from_end(4), -3)
+
+    def test_has_cycle(self):
+        self.assertFalse(self.empty_list.has_cycle())
+        self.empty_list.create_cycle()
+        self.assertFalse(self.empty_list.has_cycle())
+
+        self.assertFalse(self.large_list.has_cycle())
+        self.large_list.create_cycle()
+        self.assertTrue(self.large_list.has_cycle())
+
+        self.small_list.create_cycle()  # one block linked to itself
+        self.assertTrue(self.small_list.has_cycle())
+
+        # close the cycle past the head block
+        lst = self.empty_list
+        for value in range(9):
+            lst.append(value)  # five blocks
+
+        self.assertFalse(lst.has_cycle())
+        lst._tail._next_block = lst._head._next_block._next_block
+        self.assertTrue(lst.has_cycle())
+
+
+if __name__ == '__main__':
+    unittest.main()